@@ -22,11 +22,21 @@ Additionally writes a consolidated CSV with schema:
    score_means, score_medians, score_stds,
    actual_test_path]
 to "<stem>_aggregated.csv".
+
+When every input has the performance columns written by run_single_mutation_test.py
+(wall_seconds, cpu_user_seconds, cpu_system_seconds, peak_rss_mb), also writes
+"<stem>_performance.csv":
+  [put, api_mode, temperature, repetition_id, duration_seconds, file_size_bytes,
+   <column>_means, <column>_medians, <column>_stds for each performance column,
+   actual_test_path]
+Performance values of failed/timeout rows are kept (their cost is real); empty
+cells (cache hits, rows reused from an identical suite) are ignored.
 """
 
 from pathlib import Path
 import sys
 import argparse
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -36,6 +46,7 @@ COLUMNS = ["killed_mutations", "all_mutations", "score"]
 META_PREFIX = ["put", "api_mode", "temperature", "repetition_id", "duration_seconds", "file_size_bytes"]
 META_SUFFIX = "actual_test_path"
 STATUS_COLUMN = "status"  # Optional column: 'ok', 'failed', 'timeout', 'error'
+PERF_COLUMNS = ["wall_seconds", "cpu_user_seconds", "cpu_system_seconds", "peak_rss_mb"]
 
 # Allow legacy column names to be mapped into the new schema transparently.
 RENAME_MAP = {
@@ -78,6 +89,7 @@ def is_aggregate_output(path: Path) -> bool:
         or name.endswith("_medians.csv")
         or name.endswith("_stds.csv")
         or name.endswith("_aggregated.csv")
+        or name.endswith("_performance.csv")
         # Also match legacy hyphen-separated names
         or name.endswith("-means.csv")
         or name.endswith("-medians.csv")
@@ -129,6 +141,8 @@ def main() -> int:
         return 1
 
     frames = []
+    perf_frames = []  # emptied for good once an input lacks the performance columns
+    perf_available = True
     lengths = []
     total_failed_rows = 0
 
@@ -177,6 +191,12 @@ def main() -> int:
         frames.append(sub)
         lengths.append(len(sub))
 
+        if perf_available and all(c in df.columns for c in PERF_COLUMNS):
+            perf_frames.append(df.loc[:, PERF_COLUMNS].apply(pd.to_numeric, errors="coerce"))
+        else:
+            perf_available = False
+            perf_frames = []
+
         # Capture meta columns from the first file to carry over into outputs
         if i == 0:
             meta_prefix_df = df.loc[:, META_PREFIX].copy()
@@ -241,10 +261,33 @@ def main() -> int:
     )
     consolidated.to_csv(base / f"{out_stem}_aggregated.csv", index=False, lineterminator="\n")
 
+    if perf_frames:
+        perf_arr = np.stack([f.to_numpy() for f in perf_frames], axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # rows never measured (all NaN)
+            perf_stats = {
+                "means": np.nanmean(perf_arr, axis=0),
+                "medians": np.nanmedian(perf_arr, axis=0),
+                "stds": np.nanstd(perf_arr, axis=0, ddof=ddof),
+            }
+            perf_totals = np.nansum(perf_stats["means"], axis=0)
+        perf_df = pd.DataFrame(
+            {f"{col}_{kind}": perf_stats[kind][:, j] for j, col in enumerate(PERF_COLUMNS) for kind in ("means", "medians", "stds")}
+        )
+        perf_out = pd.concat([meta_prefix_df.reset_index(drop=True), perf_df, meta_suffix_df], axis=1)
+        perf_out.to_csv(base / f"{out_stem}_performance.csv", index=False, lineterminator="\n")
+
     msg = f"Matched pattern {selected_pattern!r} with {len(files)} files."
     if total_failed_rows > 0:
         msg += f"\n  NOTE: {total_failed_rows} total failed/timeout/error rows across all files were excluded from statistics."
     msg += f"\nWrote {out_stem}_means.csv, {out_stem}_medians.csv, {out_stem}_stds.csv, {out_stem}_aggregated.csv"
+    if perf_frames:
+        msg += (
+            f", {out_stem}_performance.csv"
+            f"\n  Mean cost per sweep: {perf_totals[0]:.1f}s wall, {perf_totals[1]:.1f}s user + {perf_totals[2]:.1f}s system CPU"
+        )
+    else:
+        msg += "\n  (performance columns missing from at least one input; no performance summary)"
     print(msg)
     return 0
 
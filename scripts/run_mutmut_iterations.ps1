@@ -3,7 +3,16 @@ Param(
   [ValidateRange(1, 1000000)]
   [int]$Count,
 
-  [string]$OutputDir = "."
+  [string]$OutputDir = ".",
+
+  # Worker count passed to -j: a number, or "auto" to size from cores and free memory
+  [string]$Jobs = "8",
+
+  # Continue interrupted iterations from their journals instead of starting them over
+  [switch]$Resume,
+
+  # Run all iterations in one Python process (--replications) instead of one process per iteration
+  [switch]$SingleProcess
 )
 
 Set-StrictMode -Version Latest
@@ -16,6 +25,39 @@ $RepoRoot = (Get-Item $PSScriptRoot).Parent.FullName
 $VenvPython = Join-Path -Path $RepoRoot -ChildPath ".venv-invicto\Scripts\python.exe"
 $PythonExe = if (Test-Path -LiteralPath $VenvPython) { $VenvPython } else { "python" }
 
+if ($SingleProcess) {
+  $outPattern = Join-Path -Path $OutputDir -ChildPath "benchmark_results_{i}.csv"
+  $argList = @(
+    "$PSScriptRoot\run_single_mutation_test.py",
+    "--python-hash-seed", "0",
+    "--repo-root", ".",
+    "--venv-path", ".venv-invicto",
+    "--output-path", $outPattern,
+    "--mutmut-timeout-seconds", "300",
+    "--no-cache",
+    "-j", $Jobs,
+    "--replications", "$Count"
+  )
+  if ($Resume) { $argList += "--resume" }
+
+  Write-Host "Start-Process: $PythonExe $($argList -join ' ')" -ForegroundColor DarkGray
+  $proc = Start-Process -FilePath $PythonExe -ArgumentList $argList -NoNewWindow -Wait -PassThru
+  if ($null -eq $proc) { throw "Failed to start python process" }
+  $exitCode = $proc.ExitCode
+  if ($null -eq $exitCode) { $exitCode = 0 }
+  if ($exitCode -ne 0) {
+    throw "run_single_mutation_test.py failed with exit code $exitCode"
+  }
+
+  Write-Host "Cleaning caches ..." -ForegroundColor Yellow
+  & "$PSScriptRoot\remove_mutation_caches.ps1"
+  if ($LASTEXITCODE -ne 0) {
+    throw "remove_mutation_caches.ps1 failed with exit code $LASTEXITCODE"
+  }
+  Write-Host "Done. Created $Count CSV file(s)." -ForegroundColor Cyan
+  exit 0
+}
+
 for ($i = 1; $i -le $Count; $i++) {
   $outFile = Join-Path -Path $OutputDir -ChildPath "benchmark_results_$i.csv"
   Write-Host "[$i/$Count] Building $outFile" -ForegroundColor Green
@@ -27,8 +69,10 @@ for ($i = 1; $i -le $Count; $i++) {
     "--venv-path", ".venv-invicto",
     "--output-path", $outFile,
     "--mutmut-timeout-seconds", "300",
-    "-j", "8"
+    "--no-cache",
+    "-j", $Jobs
   )
+  if ($Resume) { $argList += "--resume" }
 
   Write-Host "[$i/$Count] Start-Process: $PythonExe $($argList -join ' ')" -ForegroundColor DarkGray
   $proc = Start-Process -FilePath $PythonExe -ArgumentList $argList -NoNewWindow -Wait -PassThru
@@ -4,37 +4,93 @@
 Mutmut Benchmark Builder — No-Input CSV, Directory Sweep
 Windows 11 (PowerShell 5.1) • Python 3.10 • Single-file script (std lib only)
 
-Changes in this version:
-- Mutant counts are read DIRECTLY from `.mutmut-cache` (SQLite), not via `mutmut result-ids`.
-- Uses the installed mutmut's MUTANT_STATUSES mapping when available; otherwise a safe fallback.
-- Keeps all prior semantics, CSV schema, timeouts, process-tree cleanup, and deterministic ordering.
-- Forces PYTHONHASHSEED=0 for every mutmut invocation by default (override with --python-hash-seed).
+Sweeps the `completions/` and `assistant/` trees for suites (a `test_final.py` next to a mutate
+target), mutation-tests each one and writes one CSV row per suite with its killed/total mutant
+counts, score and run costs. Suites run in a worker pool, through `mutmut run` or one of the
+in-process engines, optionally spread over several machines. Command-line flags are documented
+in --help and in the README.
 """
 from __future__ import annotations
 
 import argparse
+import ast
+import collections
+import contextlib
+import contextvars
 import csv
+import functools
+import gzip
+import hashlib
 import io
+import ipaddress
 import json
+import keyword
+import math
 import os
+import queue
+import random
 import re
+import secrets
 import shutil
 import signal
+import socket
 import sqlite3
+import statistics
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+import types
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from multiprocessing.managers import BaseManager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 DEFAULT_VENV = ".venv-invicto"
 DEFAULT_OUTPUT = "mut_benchmark_results.csv"
+DEFAULT_REPLICATION_OUTPUT = "benchmark_results_{i}.csv"  # --replications N
 DEFAULT_TIMEOUT = 300
 DEFAULT_JOBS = 1
+DEFAULT_JOB_MEMORY_MB = 512   # --jobs auto: memory budgeted per concurrent suite
+DEFAULT_MAX_LOAD = 1.0        # --jobs auto: 1-minute load average per core above which no suite is started
+ADMISSION_POLL_SECONDS = 1.0
 MAX_JOBS = 8
+ENGINES = ["mutmut", "warm", "fork"]
+DEFAULT_ENGINE = "mutmut"
+WARM_WORKER_FLAG = "--warm-worker"
+FORK_ZYGOTE_FLAG = "--fork-zygote"
+DEFAULT_OUTCOME_CACHE = ".mutation-outcome-cache"
+DEFAULT_CATALOGUE_DIR = ".mutant-catalogue"
+DEFAULT_MUTANT_TIMEOUT_MULTIPLIER = 10.0  # mutmut's own per-mutant limit is 10x the baseline
+DEFAULT_MUTANT_TIMEOUT_CONSTANT = 5.0
+SCHEDULES = ["ljf", "discovery"]
+RUN_DURATIONS_FILE = "run-durations.json"  # inside the catalogue dir
+DEFAULT_SECONDS_PER_TEST_RUN = 0.5  # cost model prior before any durations are recorded
+MAX_RUNNER_TEST_CHARS = 6000  # kill-ordered node ids on mutmut's --runner; cmd.exe stops at 8191
+MUTANTS_PER_CODE_LINE = 1.0  # cost model estimate for targets without a catalogue entry yet
+MIN_SAMPLES_FOR_FIT = 8
+JOURNAL_SUFFIX = ".journal.jsonl"
+JOURNAL_VERSION = 1
+AUTHKEY_ENV = "MUTATION_SWEEP_AUTHKEY"
+DEFAULT_WORKER_TIMEOUT = 60.0  # --coordinator: silence after which a worker's jobs are re-queued
+DIST_HEARTBEAT_SECONDS = 5.0
+DIST_POLL_SECONDS = 2.0
+DIST_CONNECT_SECONDS = 60.0   # --worker: how long to keep retrying an unreachable coordinator
+DIST_LINGER_SECONDS = 10.0    # --coordinator: how long to keep serving 'stop' after the last result
+CATALOGUE_VERSION = 1
+OUTCOME_CACHE_VERSION = 2
+WARM_STDERR_TAIL_LINES = 200
+DEFAULT_WORKSPACE_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()  # --workspace
+DEFAULT_LOG_DIR = ".mutmut-logs"
+LOG_TAIL_BYTES = 16 * 1024  # output of a mutmut run kept in memory for error messages
+DEFAULT_PROGRESS_INTERVAL = 30.0
+SAMPLE_CI_METHODS = ["wilson", "clopper-pearson"]  # --sample-ci
+DEFAULT_SAMPLE_CONFIDENCE = 0.95
+SAMPLE_MIN_MUTANTS = 10    # --sample-epsilon: never stop before this many counted mutants
+SAMPLE_BATCH_MUTANTS = 20  # --sample-epsilon with mutmut or shards: mutants per 'mutmut run'
+MUTMUT_PROGRESS_RX = re.compile(rb"(\d+)/(\d+)\s+KILLED\s")  # mutmut's --simple-output status line
 
 SCAN_ROOTS = ["completions", "assistant"]
 
@@ -50,8 +106,23 @@ CSV_HEADER = [
     "score",
     "actual_test_path",
     "status",  # 'ok', 'failed', 'timeout', or 'error'
+    # Cost of the run that produced the row; empty for cache hits and rows reused from an identical suite.
+    "wall_seconds",
+    "cpu_user_seconds",  # children's CPU time (POSIX only)
+    "cpu_system_seconds",
+    "peak_rss_mb",  # largest child RSS (POSIX only)
+    # Sequential sampling (--sample-epsilon); empty in exact mode, where every mutant is tested.
+    "mutants_tested",
+    "score_estimate",
+    "score_ci_low",
+    "score_ci_high",
+    "equivalent_mutations",  # --skip-equivalent: mutants not run because their bytecode equals the original's
 ]
 
+# Buckets counted in all_mutations (untested/unknown statuses are ignored).
+MUTANT_BUCKETS = ("killed", "timeout", "suspicious", "survived", "skipped")
+EQUIVALENT_STATUS = "equivalent"  # --skip-equivalent: raw status and bucket of mutants compiling to the original code
+
 FLOAT_RX = re.compile(r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?')
 # Accept any non-underscore chunk for tc_id (e.g., m02, s01, etc.).
 # The previous pattern hard-coded 'm\d+' and failed for 'tc_s01_t1.0_rep1' style names,
@@ -64,8 +135,45 @@ class Config:
     venv_path: Path
     output_path: Path
     mutmut_timeout_seconds: int
-    jobs: int
+    jobs: int  # pool size; with --jobs auto the computed size
     python_hash_seed: Optional[str]
+    engine: str
+    mutant_shards: int
+    scratch_dir: Path
+    workspace_dir: Optional[Path]  # --workspace: mutmut runs in private clones here; None runs in place
+    outcome_cache_dir: Optional[Path]  # None disables the outcome cache
+    verify_fraction: float
+    dedup: bool
+    catalogue_dir: Path
+    coverage_gate: bool
+    select_tests: bool
+    kill_order: bool
+    mutant_timeout_multiplier: float
+    mutant_timeout_constant: float
+    schedule: str
+    auto_jobs: bool
+    max_load: float
+    max_rss_mb: Optional[float]
+    coordinator: Optional[Tuple[str, int]]  # --coordinator HOST:PORT
+    worker: Optional[Tuple[str, int]]  # --worker HOST:PORT
+    local_workers: int
+    authkey: bytes
+    worker_timeout: float
+    journal_path: Path
+    resume: bool
+    replications: int  # >1: output_path and journal_path contain '{i}'
+    log_dir: Optional[Path]  # None: mutmut output is only kept as a bounded tail
+    progress_interval: float  # seconds between progress lines; 0 disables them
+    trace_path: Optional[Path]  # Chrome trace-event JSON of the run
+    sample_epsilon: Optional[float]  # stop a suite once the score's interval is within +-epsilon; None tests every mutant
+    sample_ci: str  # one of SAMPLE_CI_METHODS
+    sample_confidence: float
+    sample_seed: int
+    mutant_sample_fraction: float  # fixed stratified sample per target; 1.0 with no max tests every mutant
+    mutant_sample_max: Optional[int]
+    skip_equivalent: bool
+    equivalent_in_score: bool  # --skip-equivalent: count equivalent mutants as survivors in all_mutations
+    warehouse_path: Optional[Path]  # SQLite store of per-mutant outcomes; None disables it
 
 @dataclass
 class TestDir:
@@ -87,19 +195,77 @@ class Row:
     score: float
     actual_test_path: str
     status: str  # 'ok', 'failed', 'timeout', or 'error'
+    wall_seconds: Optional[float] = None
+    cpu_user_seconds: Optional[float] = None
+    cpu_system_seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    mutants_tested: Optional[int] = None
+    score_estimate: Optional[float] = None
+    score_ci_low: Optional[float] = None
+    score_ci_high: Optional[float] = None
+    equivalent: Optional[int] = None
+
+@dataclass
+class RunUsage:
+    """Resources of the child processes of one suite run, summed over every process reaped during it."""
+    user_seconds: float = 0.0
+    system_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    measured: bool = False  # False where os.wait4 is unavailable (Windows)
+
+@dataclass
+class SuiteResult:
+    killed: int
+    total: int
+    score: float
+    status: str  # same values as Row.status
+    seconds: Optional[float] = None  # engine wall time; None when nothing ran (cache hit, error)
+    usage: Optional[RunUsage] = None
+    outcomes: Optional[List["MutantOutcome"]] = None  # per-mutant outcomes of an 'ok' result, when known
+    tested: Optional[int] = None  # --sample-epsilon: mutants tested
+    interval: Optional[Tuple[float, float]] = None  # --sample-epsilon: confidence interval of score
+    equivalent: Optional[int] = None  # --skip-equivalent: mutants found equivalent
+
+@dataclass
+class MutantSpec:
+    id: int           # 1-based, in mutmut's enumeration order
+    line_number: int  # 1-based line of the mutated node
+    index: int        # mutmut's per-line mutation index
+    source: str       # full mutated module source
+    mutant_hash: str = ""  # sha256 prefix of the mutated source; stable across runs and suites
+
+@dataclass
+class CoverageMap:
+    import_lines: Set[int]            # target lines executed while the test module was imported
+    test_lines: Dict[str, Set[int]]   # "test_final.py::[Class::]test" -> target lines executed by that test
+
+@dataclass
+class MutantOutcome:
+    id: int
+    line_number: int
+    index: int
+    status: str  # raw mutmut status, e.g. 'ok_killed'
+    seconds: Optional[float]
 
 # --- global state for cleanup ---
 _active_procs_lock = threading.Lock()
 _active_procs: Dict[int, subprocess.Popen] = {}
+_interrupted = threading.Event()  # set by cleanup_all_processes: rows finished after this are not journaled
+_progress: Optional["SweepProgress"] = None  # set by main while the pool runs
+_tracer: Optional["TraceRecorder"] = None  # set by main with --trace-path
+_usage_var: "contextvars.ContextVar[Optional[RunUsage]]" = contextvars.ContextVar("suite_usage", default=None)
+_usage_lock = threading.Lock()
 _stdout_lock = threading.Lock()
-_per_dir_locks: Dict[Path, threading.Lock] = {}
+_per_dir_locks: Dict[Path, threading.RLock] = {}  # reentrant: run_mutmut takes it inside callers that read the cache
 _per_dir_locks_lock = threading.Lock()
+_inplace_lock = threading.Lock()
+_inplace_targets: Dict[Path, bytes] = {}  # mutate target -> pristine bytes while `mutmut run` rewrites it in place
 
-def get_per_dir_lock(test_dir: Path) -> threading.Lock:
+def get_per_dir_lock(test_dir: Path) -> threading.RLock:
     with _per_dir_locks_lock:
         lk = _per_dir_locks.get(test_dir)
         if lk is None:
-            lk = threading.Lock()
+            lk = threading.RLock()
             _per_dir_locks[test_dir] = lk
         return lk
 
@@ -113,34 +279,273 @@ def parse_args(argv: Optional[List[str]] = None) -> Config:
     p.add_argument("--venv-path", type=str, default=DEFAULT_VENV, help="Venv dir relative to repo-root (default: .venv-invicto).")
     p.add_argument("--output-path", type=str, default=DEFAULT_OUTPUT, help="Output CSV path (overwritten).")
     p.add_argument("--mutmut-timeout-seconds", type=int, default=DEFAULT_TIMEOUT, help="Timeout per 'mutmut run' (seconds, > 0).")
-    p.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help="Max concurrent mutmut processes (1..8).")
+    p.add_argument("--jobs", "-j", type=str, default=str(DEFAULT_JOBS),
+                   help=f"Max concurrent mutmut processes (1..max({MAX_JOBS}, cores)), or 'auto' to size from cores and free memory.")
+    p.add_argument("--job-memory-mb", type=float, default=DEFAULT_JOB_MEMORY_MB,
+                   help=f"--jobs auto: memory budget per concurrent suite (default: {DEFAULT_JOB_MEMORY_MB}).")
+    p.add_argument("--max-load", type=float, default=DEFAULT_MAX_LOAD,
+                   help=f"--jobs auto: start no suite while the 1-minute load average per core exceeds this (default: {DEFAULT_MAX_LOAD}).")
+    p.add_argument("--max-rss-mb", type=float, default=None,
+                   help="--jobs auto: start no suite while the child processes' total RSS exceeds this (default: 80%% of available memory).")
     p.add_argument(
         "--python-hash-seed",
         type=str,
         default="0",
         help="Value assigned to PYTHONHASHSEED for each mutmut run (default: 0, set to '' to inherit ambient value).",
     )
+    p.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=(
+            "'mutmut' shells out to 'mutmut run'; 'warm' tests all mutants of a suite in one pytest session; "
+            "'fork' (POSIX) forks each mutant run from a zygote with the suite's dependencies preloaded (default: mutmut)."
+        ),
+    )
+    p.add_argument(
+        "--mutant-shards",
+        type=int,
+        default=1,
+        help="Split the mutants of each suite over N workers, each in its own scratch copy of the directory (default: 1).",
+    )
+    p.add_argument("--scratch-dir", type=str, default=tempfile.gettempdir(), help="Parent directory for scratch copies (default: system temp).")
+    p.add_argument("--workspace", action="store_true",
+                   help="mutmut engine: run each suite in a private clone under --workspace-dir and copy back only "
+                        "`.mutmut-cache`, so runs of the same directory need not wait for each other.")
+    p.add_argument("--workspace-dir", type=str, default=DEFAULT_WORKSPACE_DIR,
+                   help=f"--workspace: parent directory of the clones, ideally tmpfs (default: {DEFAULT_WORKSPACE_DIR}).")
+    p.add_argument(
+        "--outcome-cache-dir",
+        type=str,
+        default=DEFAULT_OUTCOME_CACHE,
+        help=f"Per-mutant outcome cache keyed by suite content and run settings, relative to repo-root (default: {DEFAULT_OUTCOME_CACHE}).",
+    )
+    p.add_argument(
+        "--catalogue-dir",
+        type=str,
+        default=DEFAULT_CATALOGUE_DIR,
+        help=f"Shared mutant catalogue (one entry per distinct target source), relative to repo-root (default: {DEFAULT_CATALOGUE_DIR}).",
+    )
+    p.add_argument("--no-cache", action="store_true", help="Neither read nor write the outcome cache.")
+    p.add_argument(
+        "--coverage-gate",
+        action="store_true",
+        help="Measure line coverage of the unmutated suite once and count mutants on uncovered lines as survived without running tests.",
+    )
+    p.add_argument(
+        "--select-tests",
+        action="store_true",
+        help="Like --coverage-gate, and run each mutant against only the tests that execute its line.",
+    )
+    p.add_argument(
+        "--kill-order",
+        action="store_true",
+        help="Stop each mutant at its first failing test (pytest -x), running the tests that killed most mutants so far first. "
+             "The warm and fork engines record the kills; --engine mutmut only reuses them (mutmut does not report the killer).",
+    )
+    p.add_argument(
+        "--schedule",
+        choices=SCHEDULES,
+        default="ljf",
+        help="Job order: 'ljf' runs the suites predicted to take longest first (default); 'discovery' keeps path order.",
+    )
+    p.add_argument(
+        "--mutant-timeout-multiplier",
+        type=float,
+        default=DEFAULT_MUTANT_TIMEOUT_MULTIPLIER,
+        help=f"warm/fork engines: per-mutant limit is this multiple of the clean-suite runtime plus --mutant-timeout-constant (default: {DEFAULT_MUTANT_TIMEOUT_MULTIPLIER}).",
+    )
+    p.add_argument(
+        "--mutant-timeout-constant",
+        type=float,
+        default=DEFAULT_MUTANT_TIMEOUT_CONSTANT,
+        help=f"warm/fork engines: seconds added to the per-mutant limit (default: {DEFAULT_MUTANT_TIMEOUT_CONSTANT}).",
+    )
+    p.add_argument("--no-dedup", action="store_true", help="Run every directory even when its target and test_final.py are byte-identical to another's.")
+    p.add_argument(
+        "--verify-fraction",
+        type=float,
+        default=0.0,
+        help="Fraction of cache hits that are re-run anyway and compared with the cached outcomes (0..1, default: 0).",
+    )
+
+    p.add_argument("--log-dir", type=str, default=DEFAULT_LOG_DIR,
+                   help=f"gzip-compressed output of each 'mutmut run', relative to repo-root; '' keeps only the last "
+                        f"{LOG_TAIL_BYTES // 1024} KB in memory (default: {DEFAULT_LOG_DIR}).")
+    p.add_argument("--progress-interval", type=float, default=DEFAULT_PROGRESS_INTERVAL,
+                   help=f"Seconds between progress lines (mutants done, mutants/s, ETA); 0 disables them (default: {DEFAULT_PROGRESS_INTERVAL:.0f}).")
+    p.add_argument("--trace-path", type=str, default=None,
+                   help="Write a Chrome trace (chrome://tracing, Perfetto) of discovery, every suite and mutmut run, "
+                        "and the warm/fork baseline and mutant runs, one lane per worker thread.")
+    p.add_argument("--sample-epsilon", type=float, default=None,
+                   help="Sequential sampling: test each suite's mutants in a seeded random order and stop once the "
+                        "score's confidence interval is within +-EPSILON (default: test every mutant).")
+    p.add_argument("--sample-ci", choices=SAMPLE_CI_METHODS, default="wilson",
+                   help="--sample-epsilon: interval on killed/all (default: wilson).")
+    p.add_argument("--sample-confidence", type=float, default=DEFAULT_SAMPLE_CONFIDENCE,
+                   help=f"--sample-epsilon: confidence level of the interval (default: {DEFAULT_SAMPLE_CONFIDENCE}).")
+    p.add_argument("--mutant-sample-fraction", type=float, default=1.0,
+                   help="Test a fixed sample of this fraction of each target's mutants, stratified by mutation operator "
+                        "and source line; suites with the same target source get the same sample (default: 1.0).")
+    p.add_argument("--mutant-sample-max", type=int, default=None,
+                   help="Test at most this many mutants per suite, sampled like --mutant-sample-fraction (default: no cap).")
+    p.add_argument("--sample-seed", type=int, default=0,
+                   help="Seed of the mutant order and of the fixed sample; suites with the same target source see the "
+                        "same order and sample (default: 0).")
+    p.add_argument("--skip-equivalent", action="store_true",
+                   help="Compile every mutant first and do not run those whose bytecode (docstrings and line numbers "
+                        "ignored) equals the original module's; they are reported in equivalent_mutations.")
+    p.add_argument("--equivalent-in-score", action="store_true",
+                   help="--skip-equivalent: still count equivalent mutants in all_mutations, as the survivors mutmut "
+                        "would report (default: excluded from the score).")
+    p.add_argument("--warehouse-path", type=str, default=None,
+                   help="Also write every mutant's outcome to this SQLite database, one row per mutant, suite and "
+                        "replication, appended across sweeps (default: disabled).")
+    p.add_argument("--replications", type=int, default=1,
+                   help=f"Run the sweep N times in this process, writing one CSV per replication to --output-path with "
+                        f"'{{i}}' replaced by 1..N (default output: {DEFAULT_REPLICATION_OUTPUT}). Only the first "
+                        "replication reads the outcome cache.")
+    p.add_argument("--journal-path", type=str, default=None,
+                   help=f"Append-only record of finished rows (default: <output-path>{JOURNAL_SUFFIX}).")
+    p.add_argument("--resume", action="store_true",
+                   help="Keep the journal of an interrupted run, skip the directories it already holds and rebuild the CSV from it.")
+    p.add_argument("--coordinator", type=str, default=None, metavar="HOST:PORT",
+                   help="Serve the sweep's jobs to --worker processes on HOST:PORT instead of running them; writes the CSV.")
+    p.add_argument("--worker", type=str, default=None, metavar="HOST:PORT",
+                   help="Pull jobs from the coordinator at HOST:PORT and run them against this node's copy of the corpus.")
+    p.add_argument("--local-workers", type=int, default=0,
+                   help="--coordinator: also start N worker processes on this machine (default: 0).")
+    p.add_argument("--authkey", type=str, default=os.environ.get(AUTHKEY_ENV),
+                   help=f"Shared secret between coordinator and workers (default: ${AUTHKEY_ENV}). Required by --worker "
+                        "and by a --coordinator bound to a non-loopback address; a loopback coordinator without one "
+                        "generates a random key and prints it.")
+    p.add_argument("--worker-timeout", type=float, default=DEFAULT_WORKER_TIMEOUT,
+                   help=f"--coordinator: re-queue the jobs of a worker silent for this many seconds (default: {DEFAULT_WORKER_TIMEOUT:.0f}).")
 
     ns = p.parse_args(argv)
+    if ns.replications < 1:
+        p.error("--replications must be >= 1")
+    if ns.replications > 1:
+        if "{i}" not in ns.output_path:
+            if ns.output_path != DEFAULT_OUTPUT:
+                p.error("--output-path must contain '{i}' with --replications")
+            ns.output_path = DEFAULT_REPLICATION_OUTPUT
+        if ns.journal_path and "{i}" not in ns.journal_path:
+            p.error("--journal-path must contain '{i}' with --replications")
     repo_root = Path(ns.repo_root).resolve()
     venv_path = (repo_root / ns.venv_path).resolve()
     output_path = Path(ns.output_path).resolve()
+    journal_path = Path(ns.journal_path).resolve() if ns.journal_path else output_path.with_name(output_path.name + JOURNAL_SUFFIX)
     mutmut_timeout_seconds = int(ns.mutmut_timeout_seconds)
-    jobs = int(ns.jobs)
     python_hash_seed = str(ns.python_hash_seed)
+    auto_jobs = ns.jobs.strip().lower() == "auto"
+    max_rss_mb = ns.max_rss_mb
+    if auto_jobs:
+        if ns.job_memory_mb <= 0 or ns.max_load <= 0:
+            p.error("--job-memory-mb and --max-load must be > 0")
+        jobs, avail_mb = auto_job_count(ns.job_memory_mb)
+        if max_rss_mb is None and avail_mb is not None:
+            max_rss_mb = 0.8 * avail_mb
+    else:
+        try:
+            jobs = int(ns.jobs)
+        except ValueError:
+            p.error("--jobs must be an integer or 'auto'")
+        max_jobs = max(MAX_JOBS, os.cpu_count() or 1)
+        if not (1 <= jobs <= max_jobs):
+            p.error(f"--jobs must be in 1..{max_jobs}")
 
     if mutmut_timeout_seconds <= 0:
         p.error("--mutmut-timeout-seconds must be > 0")
-    if not (1 <= jobs <= MAX_JOBS):
-        p.error(f"--jobs must be in 1..{MAX_JOBS}")
     if python_hash_seed == "":
         python_hash_seed = None
+    if ns.mutant_timeout_multiplier <= 0 or ns.mutant_timeout_constant < 0:
+        p.error("--mutant-timeout-multiplier must be > 0 and --mutant-timeout-constant >= 0")
+    if not (0.0 <= ns.verify_fraction <= 1.0):
+        p.error("--verify-fraction must be in 0..1")
+    if ns.mutant_shards < 1:
+        p.error("--mutant-shards must be >= 1")
+    if ns.engine == "fork" and not hasattr(os, "fork"):
+        p.error("--engine fork requires a POSIX platform (os.fork)")
+    try:
+        coordinator = parse_address(ns.coordinator) if ns.coordinator else None
+        worker = parse_address(ns.worker) if ns.worker else None
+    except ValueError as e:
+        p.error(str(e))
+    if coordinator and worker:
+        p.error("--coordinator and --worker are mutually exclusive")
+    if ns.local_workers < 0 or (ns.local_workers and not coordinator):
+        p.error("--local-workers must be >= 0 and requires --coordinator")
+    authkey = ns.authkey or None
+    if worker and authkey is None:
+        p.error(f"--worker requires --authkey or ${AUTHKEY_ENV}")
+    if coordinator and authkey is None:
+        if not is_loopback(coordinator[0]):
+            p.error(f"--coordinator on {coordinator[0] or 'all interfaces'} requires --authkey or ${AUTHKEY_ENV} "
+                    "(the coordinator unpickles what workers send)")
+        authkey = secrets.token_hex(16)
+        log(f"No --authkey given; generated one for this loopback coordinator: {authkey}")
+    if ns.sample_epsilon is not None:
+        if not (0.0 < ns.sample_epsilon < 0.5) or not (0.0 < ns.sample_confidence < 1.0):
+            p.error("--sample-epsilon must be in (0, 0.5) and --sample-confidence in (0, 1)")
+        if ns.coverage_gate or ns.select_tests:
+            p.error("--sample-epsilon cannot be combined with --coverage-gate or --select-tests")
+    if ns.equivalent_in_score and not ns.skip_equivalent:
+        p.error("--equivalent-in-score requires --skip-equivalent")
+    if not (0.0 < ns.mutant_sample_fraction <= 1.0) or (ns.mutant_sample_max is not None and ns.mutant_sample_max < 1):
+        p.error("--mutant-sample-fraction must be in (0, 1] and --mutant-sample-max >= 1")
+    if ns.worker_timeout <= DIST_HEARTBEAT_SECONDS:
+        p.error(f"--worker-timeout must be > {DIST_HEARTBEAT_SECONDS:.0f}")
 
     roots_present = [r for r in SCAN_ROOTS if (repo_root / r).exists()]
     if not roots_present:
         p.error(f"No scan roots found under {repo_root}. At least one of {', '.join(SCAN_ROOTS)} must exist.")
 
-    return Config(repo_root, venv_path, output_path, mutmut_timeout_seconds, jobs, python_hash_seed)
+    return Config(
+        repo_root=repo_root,
+        venv_path=venv_path,
+        output_path=output_path,
+        mutmut_timeout_seconds=mutmut_timeout_seconds,
+        jobs=jobs,
+        python_hash_seed=python_hash_seed,
+        engine=ns.engine,
+        mutant_shards=int(ns.mutant_shards),
+        scratch_dir=Path(ns.scratch_dir).resolve(),
+        workspace_dir=Path(ns.workspace_dir).resolve() if ns.workspace else None,
+        outcome_cache_dir=None if ns.no_cache else (repo_root / ns.outcome_cache_dir).resolve(),
+        verify_fraction=float(ns.verify_fraction),
+        dedup=not ns.no_dedup,
+        catalogue_dir=(repo_root / ns.catalogue_dir).resolve(),
+        coverage_gate=bool(ns.coverage_gate),
+        select_tests=bool(ns.select_tests),
+        kill_order=bool(ns.kill_order),
+        mutant_timeout_multiplier=float(ns.mutant_timeout_multiplier),
+        mutant_timeout_constant=float(ns.mutant_timeout_constant),
+        schedule=ns.schedule,
+        auto_jobs=auto_jobs,
+        max_load=float(ns.max_load),
+        max_rss_mb=max_rss_mb,
+        coordinator=coordinator,
+        worker=worker,
+        local_workers=int(ns.local_workers),
+        authkey=(authkey or "").encode("utf-8"),
+        worker_timeout=float(ns.worker_timeout),
+        journal_path=journal_path,
+        resume=bool(ns.resume),
+        replications=int(ns.replications),
+        log_dir=(repo_root / ns.log_dir).resolve() if ns.log_dir else None,
+        progress_interval=float(ns.progress_interval),
+        trace_path=Path(ns.trace_path).resolve() if ns.trace_path else None,
+        sample_epsilon=ns.sample_epsilon,
+        sample_ci=ns.sample_ci,
+        sample_confidence=float(ns.sample_confidence),
+        sample_seed=int(ns.sample_seed),
+        mutant_sample_fraction=float(ns.mutant_sample_fraction),
+        mutant_sample_max=ns.mutant_sample_max,
+        skip_equivalent=bool(ns.skip_equivalent),
+        equivalent_in_score=bool(ns.equivalent_in_score),
+        warehouse_path=Path(ns.warehouse_path).resolve() if ns.warehouse_path else None,
+    )
 
 # ---------------------------
 # Logging helpers
@@ -158,6 +563,61 @@ def err(msg: str) -> None:
     with _stdout_lock:
         print(f"[ERROR] {msg}", flush=True, file=sys.stderr)
 
+# ---------------------------
+# Tracing (Chrome trace-event format)
+# ---------------------------
+
+class TraceRecorder:
+    """Complete ('X') events in microseconds since start, one tid per thread."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._t0 = time.perf_counter()
+        self._events: List[dict] = []
+        self._lanes: Dict[int, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, end: float, args: Dict[str, object]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            lane = self._lanes.setdefault(thread.ident or 0, (len(self._lanes) + 1, thread.name))[0]
+            self._events.append({
+                "name": name, "cat": "sweep", "ph": "X", "pid": 1, "tid": lane,
+                "ts": round((start - self._t0) * 1e6), "dur": round((end - start) * 1e6), "args": args,
+            })
+
+    def write(self) -> None:
+        with self._lock:
+            meta = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "mutation sweep"}}]
+            meta += [{"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": name}}
+                     for lane, name in self._lanes.values()]
+            doc = {"traceEvents": meta + self._events, "displayTimeUnit": "ms"}
+        _atomic_write(self.path, json.dumps(doc))
+        log(f"Wrote {len(doc['traceEvents']) - len(meta)} trace events to {self.path}")
+
+@contextlib.contextmanager
+def trace_span(name: str, **args: object):
+    if _tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _tracer.add(name, start, time.perf_counter(), args)
+
+def traced(name: str, describe: Optional[Callable[..., Dict[str, object]]] = None):
+    """Record every call of the decorated function as a span; describe(*args) supplies span args."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*a, **k):
+            if _tracer is None:
+                return fn(*a, **k)
+            with trace_span(name, **(describe(*a, **k) if describe else {})):
+                return fn(*a, **k)
+        return wrapper
+    return decorate
+
 def quote_if_needed(s: str) -> str:
     s = str(s)
     if " " in s and not (s.startswith('"') and s.endswith('"')):
@@ -171,8 +631,41 @@ def as_posix_relative(path: Path, base: Path) -> str:
         rel = path
     return rel.as_posix()
 
-def resolve_executable(repo_root: Path, venv_path: Path, exe_basename: str, fallback: str) -> str:
-    candidate = venv_path / "Scripts" / exe_basename
+def _atomic_write(path: Path, data) -> None:
+    """Write str (UTF-8) or bytes to path via a sibling temp file and os.replace, creating parent
+    directories; readers never see a partial file. Raises OSError like open()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if isinstance(data, str):
+            tmp.write_text(data, encoding="utf-8")
+        else:
+            tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
+
+def parse_address(text: str) -> Tuple[str, int]:
+    """'HOST:PORT' -> (host, port); an empty host means all interfaces."""
+    host, sep, port = text.strip().rpartition(":")
+    if not sep or not port.isdigit() or not (0 <= int(port) <= 65535):
+        raise ValueError(f"Expected HOST:PORT, got {text!r}")
+    return host.strip("[]"), int(port)
+
+def is_loopback(host: str) -> bool:
+    """True for 'localhost' and loopback IP literals; '' (all interfaces) and other names are not."""
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def resolve_executable(repo_root: Path, venv_path: Path, name: str, fallback: str) -> str:
+    """The venv's own copy of a tool (Scripts/<name>.exe on Windows, bin/<name> elsewhere), else the fallback."""
+    candidate = venv_path / "Scripts" / f"{name}.exe" if os.name == "nt" else venv_path / "bin" / name
     if candidate.exists():
         return str(candidate)
     return fallback
@@ -188,6 +681,7 @@ def choose_mutate_target(test_dir: Path) -> Optional[str]:
         return "nds_script.py"
     return None
 
+@traced("find_test_dirs")
 def find_test_dirs(cfg: Config) -> List[TestDir]:
     discovered: List[TestDir] = []
     for root_name in SCAN_ROOTS:
@@ -206,6 +700,34 @@ def find_test_dirs(cfg: Config) -> List[TestDir]:
     discovered.sort(key=lambda td: as_posix_relative(td.test_dir, cfg.repo_root))
     return discovered
 
+def suite_content_hash(td: TestDir) -> str:
+    """sha256 over the mutate target name and the bytes of the target and test_final.py."""
+    h = hashlib.sha256()
+    h.update(td.mutate_target.encode("utf-8") + b"\0")
+    h.update((td.test_dir / td.mutate_target).read_bytes() + b"\0")
+    h.update(td.test_file.read_bytes())
+    return h.hexdigest()
+
+def plan_groups(cfg: Config, tds: List[TestDir]) -> List[List[TestDir]]:
+    """
+    Group byte-identical suites; the first member of each group (in discovery
+    order) is the one that is executed. Without --dedup every suite is its own group.
+    """
+    if not cfg.dedup:
+        return [[td] for td in tds]
+    groups: Dict[str, List[TestDir]] = {}
+    for td in tds:
+        try:
+            key = suite_content_hash(td)
+        except OSError as e:
+            warn(f"Cannot hash {as_posix_relative(td.test_dir, cfg.repo_root)} for deduplication: {e!r}")
+            key = f"unhashable:{td.test_dir}"
+        groups.setdefault(key, []).append(td)
+    planned = list(groups.values())
+    if len(planned) < len(tds):
+        log(f"Deduplicated {len(tds)} suites into {len(planned)} distinct (target, test) pairs")
+    return planned
+
 # ---------------------------
 # Metadata & duration
 # ---------------------------
@@ -291,6 +813,7 @@ def _is_within(base: Path, target: Path) -> bool:
     except Exception:
         return False
 
+@traced("remove_mutmut_cache", lambda test_dir, repo_root: {"dir": as_posix_relative(test_dir, repo_root)})
 def remove_mutmut_cache(test_dir: Path, repo_root: Path) -> None:
     try:
         test_dir = test_dir.resolve()
@@ -325,6 +848,41 @@ def remove_mutmut_cache(test_dir: Path, repo_root: Path) -> None:
     except Exception as e:
         warn(f"Failed to delete cache {as_posix_relative(cache_dir, test_dir)}: {e!r}")
 
+def add_usage(user_seconds: float, system_seconds: float, maxrss: float) -> None:
+    """Charge a reaped child's rusage (ru_maxrss in KiB, bytes on macOS) to the running suite."""
+    usage = _usage_var.get()
+    if usage is None:
+        return
+    rss_mb = maxrss / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0)
+    with _usage_lock:
+        usage.user_seconds += user_seconds
+        usage.system_seconds += system_seconds
+        usage.peak_rss_mb = max(usage.peak_rss_mb, rss_mb)
+        usage.measured = True
+
+def wait_with_usage(p: subprocess.Popen, timeout: Optional[float] = None) -> int:
+    """
+    p.wait(timeout) that reaps the child with os.wait4 on POSIX and charges its CPU time
+    and peak RSS (including its reaped descendants) to the running suite via add_usage.
+    """
+    if p.returncode is not None or not hasattr(os, "wait4"):
+        return p.wait(timeout=timeout)
+    end = None if timeout is None else time.perf_counter() + timeout
+    delay = 0.001
+    while True:
+        try:
+            pid, status, ru = os.wait4(p.pid, os.WNOHANG)
+        except ChildProcessError:  # already reaped by Popen.poll(); the usage is lost
+            return p.wait(timeout=None if end is None else max(end - time.perf_counter(), 0.0))
+        if pid:
+            p.returncode = os.waitstatus_to_exitcode(status)
+            add_usage(ru.ru_utime, ru.ru_stime, ru.ru_maxrss)
+            return p.returncode
+        if end is not None and time.perf_counter() >= end:
+            raise subprocess.TimeoutExpired(p.args, timeout)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
 def register_proc(p: subprocess.Popen) -> None:
     with _active_procs_lock:
         _active_procs[p.pid] = p
@@ -346,66 +904,257 @@ def _taskkill_tree(pid: int) -> None:
     except Exception as e:
         warn(f"taskkill failed for PID {pid}: {e!r}")
 
-def run_mutmut(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str) -> Tuple[bool, Optional[int]]:
-    runner_cmd = f"{quote_if_needed(pytest_exe)} .\\test_final.py"
+def popen_group_kwargs() -> Dict[str, object]:
+    """Popen arguments that give the child its own process group (Windows) or session (POSIX)."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def _interrupt_group(pid: int) -> None:
+    """Polite stop of a process group: CTRL_BREAK on Windows, SIGTERM to the session on POSIX."""
+    if os.name == "nt":
+        _send_ctrl_break_to_group(pid)
+        return
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    except Exception as e:
+        warn(f"SIGTERM to process group {pid} failed: {e!r}")
+
+def _kill_group(p: subprocess.Popen, wait_seconds: float = 5.0) -> None:
+    """
+    Forced stop of p and all its descendants: taskkill /T on Windows; on POSIX SIGKILL
+    to p's session group, reap p, then wait until no member of the group is left
+    (grandchildren are re-parented and reaped by init).
+    """
+    if os.name == "nt":
+        if p.poll() is None:
+            _taskkill_tree(p.pid)
+    else:
+        try:
+            os.killpg(p.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            warn(f"SIGKILL to process group {p.pid} failed: {e!r}")
+    try:
+        if os.name == "nt" and p.poll() is None:
+            p.kill()  # on POSIX the SIGKILL to the group already hit the leader; poll() would reap it unmeasured
+    except Exception:
+        pass
+    try: wait_with_usage(p, wait_seconds)
+    except Exception: pass
+    if os.name != "nt":
+        end = time.time() + wait_seconds
+        while time.time() < end:
+            try:
+                os.killpg(p.pid, 0)
+            except (ProcessLookupError, PermissionError):
+                break
+            time.sleep(0.05)
+        else:
+            warn(f"Process group {p.pid} still has members after SIGKILL")
+
+def _kill_proc_tree(p: subprocess.Popen) -> None:
+    if p.poll() is not None and os.name == "nt":
+        return
+    _kill_group(p)
+
+def mutation_env(cfg: Config) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+    if cfg.python_hash_seed is not None:
+        env["PYTHONHASHSEED"] = cfg.python_hash_seed
+    return env
+
+def mutmut_runner_command(pytest_exe: str, fail_fast: bool = False, tests: Optional[List[str]] = None) -> str:
+    """pytest over test_final.py, or over the given node ids in that order (pytest keeps argument order)."""
+    targets = [os.path.join(".", t) for t in tests] if tests else [os.path.join(".", "test_final.py")]  # .\\ on Windows
+    return f"{quote_if_needed(pytest_exe)}{' -x' if fail_fast else ''} {' '.join(targets)}"
+
+class OutputSink:
+    """Drains a child's merged stdout/stderr on a thread. Everything goes to an optional gzip
+    log; only the last LOG_TAIL_BYTES stay in memory, however much the run prints."""
+
+    def __init__(self, stream, log_path: Optional[Path], on_status: Optional[Callable[[int, int], None]] = None):
+        self._stream = stream
+        self._on_status = on_status
+        self._tail = bytearray()
+        self._log = None
+        if log_path is not None:
+            try:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log = gzip.open(log_path, "wb", compresslevel=6)
+            except OSError as e:
+                warn(f"Cannot write {log_path}: {e!r}; keeping only the output tail")
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        carry = b""
+        try:
+            while True:
+                chunk = self._stream.read1(65536)
+                if not chunk:
+                    break
+                if self._log is not None:
+                    self._log.write(chunk)
+                if self._on_status is not None:
+                    matches = MUTMUT_PROGRESS_RX.findall(carry + chunk)
+                    if matches:
+                        self._on_status(int(matches[-1][0]), int(matches[-1][1]))
+                    carry = (carry + chunk)[-64:]  # a status line split across reads
+                self._tail += chunk
+                if len(self._tail) > 2 * LOG_TAIL_BYTES:
+                    del self._tail[:-LOG_TAIL_BYTES]
+        except (OSError, ValueError):
+            pass
+        finally:
+            if self._log is not None:
+                self._log.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Wait for EOF (the process group is gone by now), then release the pipe."""
+        self._thread.join(timeout)
+        try:
+            self._stream.close()
+        except OSError:
+            pass
+
+    def tail(self, lines: int = 20) -> str:
+        text = bytes(self._tail[-LOG_TAIL_BYTES:]).decode("utf-8", errors="replace")
+        return "\n".join(text.splitlines()[-lines:])
+
+def mutmut_log_path(cfg: Config, td: TestDir, suffix: str = "") -> Optional[Path]:
+    """<log-dir>/<suite path with separators flattened><suffix>.log.gz, or None without --log-dir."""
+    if cfg.log_dir is None:
+        return None
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", as_posix_relative(td.test_dir, cfg.repo_root)).strip("_")
+    return cfg.log_dir / f"{name}{suffix}.log.gz"
+
+@traced("run_mutmut", lambda cfg, td, *a, **k: {"dir": as_posix_relative(td.test_dir, cfg.repo_root)})
+def run_mutmut(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, log_path: Optional[Path] = None,
+               label: Optional[str] = None, tests: Optional[List[str]] = None) -> Tuple[bool, Optional[int]]:
+    """`mutmut run` in td, running the given tests in that order if any; output goes to log_path (default:
+    the suite's log under --log-dir) and its status lines to report_progress under label (default: td's path)."""
+    runner_cmd = mutmut_runner_command(pytest_exe, cfg.kill_order, tests)
     args = [
         mutmut_exe, "run",
         "--paths-to-mutate", td.mutate_target,
         "--tests-dir", ".",
         "--runner", runner_cmd,
-        "--no-progress", "--CI", "--simple-output",
+        "--CI", "--simple-output",  # progress lines feed report_progress
     ]
-    env = os.environ.copy()
-    env["PYTHONIOENCODING"] = "utf-8"
-    if cfg.python_hash_seed is not None:
-        env["PYTHONHASHSEED"] = cfg.python_hash_seed
-    remove_mutmut_cache(td.test_dir, cfg.repo_root)
-
-    createflags = subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
+    env = mutation_env(cfg)
+    in_place = _is_within(cfg.repo_root.resolve(), td.test_dir.resolve())
 
     with get_per_dir_lock(td.test_dir):
-        start = time.time()
-        p = subprocess.Popen(
-            args, cwd=str(td.test_dir), env=env,
-            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            text=True, creationflags=createflags,
-        )
+        if _interrupted.is_set():
+            return False, None
+        if in_place:
+            remove_mutmut_cache(td.test_dir, cfg.repo_root)  # scratch clones start without a cache
+        target = td.test_dir / td.mutate_target
+        original = track_inplace_target(target) if in_place else None
+        start = time.perf_counter()
+        try:
+            p = subprocess.Popen(
+                args, cwd=str(td.test_dir), env=env,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                **popen_group_kwargs(),
+            )
+        except BaseException:
+            release_inplace_target(target, restore=False)
+            raise
         register_proc(p)
+        progress_label = label or as_posix_relative(td.test_dir, cfg.repo_root)
+        sink = OutputSink(p.stdout, log_path or mutmut_log_path(cfg, td),
+                          lambda done, total: report_progress(progress_label, done, total))
         try:
             try:
-                stdout, stderr = p.communicate(timeout=cfg.mutmut_timeout_seconds)
-                exit_code = p.returncode
+                exit_code = wait_with_usage(p, cfg.mutmut_timeout_seconds)
                 completed = True
             except subprocess.TimeoutExpired:
-                _send_ctrl_break_to_group(p.pid)
+                _interrupt_group(p.pid)
                 try:
-                    p.communicate(timeout=5)
+                    wait_with_usage(p, 5)
                 except subprocess.TimeoutExpired:
                     pass
-                _taskkill_tree(p.pid)
-                try:
-                    p.wait(timeout=5)
-                except Exception:
-                    pass
+                _kill_group(p)
                 completed = False
                 exit_code = None
             finally:
                 unregister_proc(p)
         finally:
-            if p.poll() is None:
-                _taskkill_tree(p.pid)
-                try: p.kill()
-                except Exception: pass
-                try: p.wait(timeout=5)
-                except Exception: pass
+            if p.poll() is None or os.name != "nt":
+                _kill_group(p)  # on POSIX also sweeps up test processes the run left behind
+            sink.close()
+            if original is not None:
+                release_inplace_target(target, restore=not completed or _interrupted.is_set())
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
+    rel_dir = as_posix_relative(td.test_dir, cfg.repo_root)
+    if _interrupted.is_set():
+        return False, None
     if not completed:
-        warn(f"Timeout after {cfg.mutmut_timeout_seconds}s for {as_posix_relative(td.test_dir, cfg.repo_root)}; killed process tree (elapsed ~{elapsed:.1f}s)")
+        warn(f"Timeout after {cfg.mutmut_timeout_seconds}s for {rel_dir}; killed process tree (elapsed ~{elapsed:.1f}s)")
+        if original is None:
+            restore_mutated_target(td)
         return False, None
+    if exit_code & 1:
+        err(f"mutmut run in {rel_dir} exited with {exit_code}; last output:\n{sink.tail()}")
     return True, exit_code
 
+def restore_mutated_target(td: TestDir) -> None:
+    """A killed `mutmut run` leaves the current mutant applied; put back its `<target>.bak`."""
+    backup = td.test_dir / f"{td.mutate_target}.bak"
+    if not backup.exists():
+        return
+    try:
+        os.replace(backup, td.test_dir / td.mutate_target)
+        warn(f"Restored {td.mutate_target} from the backup left by the killed mutmut run in {td.test_dir.name}")
+    except OSError as e:
+        err(f"Could not restore {td.mutate_target} from {backup}: {e!r}")
+
+def restore_leftover_backups(tds: List[TestDir]) -> None:
+    """A `<target>.bak` found before a run means an earlier `mutmut run` died mid-mutant (crash,
+    kill -9) and the target may still hold that mutant; put every such backup back first."""
+    for td in tds:
+        restore_mutated_target(td)
+
+def track_inplace_target(target: Path) -> bytes:
+    """Snapshot target before an in-place `mutmut run` so an interrupt can undo it without the .bak
+    (mutmut only has one while a mutant is applied, and the kill may land mid-write)."""
+    original = target.read_bytes()
+    with _inplace_lock:
+        _inplace_targets[target] = original
+    return original
+
+def release_inplace_target(target: Path, restore: bool) -> None:
+    with _inplace_lock:
+        original = _inplace_targets.pop(target, None)
+    if original is not None and restore:
+        _restore_target_bytes(target, original)
+
+def restore_inplace_targets() -> None:
+    """Put back every mutate target an interrupted in-place `mutmut run` was working on."""
+    with _inplace_lock:
+        pending = list(_inplace_targets.items())
+        _inplace_targets.clear()
+    for target, original in pending:
+        _restore_target_bytes(target, original)
+
+def _restore_target_bytes(target: Path, original: bytes) -> None:
+    backup = target.with_name(f"{target.name}.bak")
+    try:
+        if not target.exists() or target.read_bytes() != original:
+            _atomic_write(target, original)
+            warn(f"Restored {target.name} in {target.parent.name} after the killed mutmut run")
+        backup.unlink(missing_ok=True)
+    except OSError as e:
+        err(f"Could not restore {target}: {e!r}")
+
 # ---------------------------
 # NEW: read counts from SQLite cache
 # ---------------------------
@@ -466,6 +1215,7 @@ def _open_sqlite_readonly(db_path: Path) -> sqlite3.Connection:
         # Fallback (still safe; we only read)
         return sqlite3.connect(str(db_path), timeout=5.0)
 
+@traced("compute_counts_from_cache", lambda td, *a: {"dir": str(td.test_dir)})
 def compute_counts_from_cache(td: TestDir, raw_status_map: Dict[str, str]) -> Tuple[bool, Dict[str, int]]:
     """
     Query `.mutmut-cache` and return counts for buckets:
@@ -477,8 +1227,7 @@ def compute_counts_from_cache(td: TestDir, raw_status_map: Dict[str, str]) -> Tu
         return False, {}
     # Reverse map raw->bucket
     raw_to_bucket = {raw: bucket for bucket, raw in raw_status_map.items()}
-    wanted_buckets = ("killed", "timeout", "suspicious", "survived", "skipped")
-    tallies: Dict[str, int] = {b: 0 for b in wanted_buckets}
+    tallies: Dict[str, int] = {b: 0 for b in MUTANT_BUCKETS}
 
     try:
         with _open_sqlite_readonly(db_path) as con:
@@ -497,26 +1246,1836 @@ def compute_counts_from_cache(td: TestDir, raw_status_map: Dict[str, str]) -> Tu
     except Exception:
         return False, {}
 
-def compute_score(killed: int, total: int) -> float:
+@traced("read_mutant_rows_from_cache", lambda test_dir: {"dir": str(test_dir)})
+def read_mutant_rows_from_cache(test_dir: Path) -> Optional[List[Tuple[int, int, str]]]:
+    """
+    Per-mutant rows of `.mutmut-cache` as (1-based line number, per-line index, raw status),
+    or None if the cache is missing or unreadable.
+    """
+    db_path = test_dir / ".mutmut-cache"
+    if not db_path.exists():
+        return None
+    try:
+        with _open_sqlite_readonly(db_path) as con:
+            con.execute("PRAGMA query_only = 1")
+            rows = con.execute(
+                'SELECT l.line_number, m."index", m.status FROM Mutant m JOIN Line l ON m.line = l.id ORDER BY m.id'
+            ).fetchall()
+        return [(int(line) + 1, int(index), str(status)) for line, index, status in rows]
+    except Exception:
+        return None
+
+def compute_score(killed: int, total: int, equivalent: int = 0, include_equivalent: bool = False) -> float:
+    """killed / total; equivalent mutants join the denominator only with include_equivalent."""
+    if include_equivalent:
+        total += equivalent
     if total <= 0:
         return 0.0
     return round(killed / total, 6)
 
+def score_interval(killed: int, total: int, method: str, confidence: float) -> Tuple[float, float]:
+    """Two-sided confidence interval of killed/total: Wilson score or Clopper-Pearson (exact)."""
+    if total <= 0:
+        return 0.0, 1.0
+    alpha = 1.0 - confidence
+    if method == "wilson":
+        z = statistics.NormalDist().inv_cdf(1.0 - alpha / 2)
+        p = killed / total
+        denom = 1.0 + z * z / total
+        centre = (p + z * z / (2 * total)) / denom
+        half = z / denom * math.sqrt(p * (1.0 - p) / total + z * z / (4 * total * total))
+        return max(0.0, centre - half), min(1.0, centre + half)
+    low = 0.0 if killed == 0 else _bisect_p(lambda p: 1.0 - _binom_cdf(killed - 1, total, p) - alpha / 2)
+    high = 1.0 if killed == total else _bisect_p(lambda p: alpha / 2 - _binom_cdf(killed, total, p))
+    return low, high
+
+def _binom_cdf(k: int, n: int, p: float) -> float:
+    if p <= 0.0:
+        return 1.0
+    if p >= 1.0:
+        return 1.0 if k >= n else 0.0
+    lp, lq = math.log(p), math.log1p(-p)
+    return min(1.0, sum(math.exp(math.lgamma(n + 1) - math.lgamma(i + 1) - math.lgamma(n - i + 1) + i * lp + (n - i) * lq)
+                        for i in range(k + 1)))
+
+def _bisect_p(f: Callable[[float], float]) -> float:
+    """Root in (0, 1) of f, which increases in p."""
+    lo, hi = 0.0, 1.0
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        if f(mid) < 0:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+def tally_outcomes(outcomes: List[MutantOutcome], raw_status_map: Dict[str, str]) -> Dict[str, int]:
+    """Bucket per-mutant outcomes exactly like compute_counts_from_cache buckets cache rows,
+    plus the equivalent bucket of --skip-equivalent."""
+    raw_to_bucket = {raw: bucket for bucket, raw in raw_status_map.items()}
+    raw_to_bucket[EQUIVALENT_STATUS] = EQUIVALENT_STATUS
+    tallies: Dict[str, int] = {b: 0 for b in MUTANT_BUCKETS + (EQUIVALENT_STATUS,)}
+    for o in outcomes:
+        bucket = raw_to_bucket.get(o.status, None)
+        if bucket in tallies:
+            tallies[bucket] += 1
+    return tallies
+
+# ---------------------------
+# In-process engines (warm, fork)
+# ---------------------------
+
+_mutmut_module = None
+_mutmut_import_failed = False  # reported once; later callers just get None
+_mutmut_module_lock = threading.Lock()
+
+def import_mutmut(venv_path: Path):
+    """
+    Import mutmut as a library (for mutant generation), preferring the venv copy.
+    Returns None if it cannot be imported.
+    """
+    global _mutmut_module, _mutmut_import_failed
+    with _mutmut_module_lock:
+        if _mutmut_module is None and not _mutmut_import_failed:
+            import importlib
+            for sp in _venv_site_packages_candidates(venv_path):
+                if str(sp) not in sys.path:
+                    sys.path.insert(0, str(sp))
+            try:
+                _mutmut_module = importlib.import_module("mutmut")
+            except Exception as e:
+                _mutmut_import_failed = True
+                err(f"Could not import mutmut for mutant generation: {e!r}")
+        return _mutmut_module
+
+def generate_mutants(mm, target_path: Path) -> List[MutantSpec]:
+    """
+    Enumerate the mutants of target_path the way `mutmut run` does (all mutation
+    types, default --dict-synonyms) and render the mutated source of each one.
+    """
+    source = target_path.read_text(encoding="utf-8")
+    filename = target_path.name
+    mutation_ids = mm.list_mutations(mm.Context(source=source, filename=filename, dict_synonyms=[""]))
+    specs: List[MutantSpec] = []
+    for n, mid in enumerate(mutation_ids, start=1):
+        ctx = mm.Context(source=source, mutation_id=mid, filename=filename, dict_synonyms=[""])
+        mutated, _ = mm.mutate(ctx)
+        specs.append(MutantSpec(n, mid.line_number + 1, mid.index, mutated, compute_mutant_hash(mutated)))
+    return specs
+
+def compute_mutant_hash(mutated_source: str) -> str:
+    return hashlib.sha256(mutated_source.encode("utf-8")).hexdigest()[:16]
+
+class WarmWorker:
+    """
+    Executor of the warm engine: orchestrator-side handle of one warm pytest
+    session (see warm_worker_main). Requests and replies are JSON lines; replies
+    are read by a background thread so every request can be bounded by a deadline.
+    """
+
+    def __init__(self, cfg: Config, td: TestDir, python_exe: str, trace: bool = False) -> None:
+        self._spawn_args = (cfg, td, python_exe, trace)
+        args = [
+            python_exe, str(Path(__file__).resolve()), WARM_WORKER_FLAG,
+            "--target", td.mutate_target,
+            "--test-file", td.test_file.name,
+        ] + (["--trace"] if trace else [])
+        env = mutation_env(cfg)
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        self.started = time.time()
+        self.startup = 0.0
+        self.proc = subprocess.Popen(
+            args, cwd=str(td.test_dir), env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace", **popen_group_kwargs(),
+        )
+        register_proc(self.proc)
+        self.stderr_tail: "collections.deque[str]" = collections.deque(maxlen=WARM_STDERR_TAIL_LINES)
+        self._replies: "queue.Queue[Optional[dict]]" = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+    def _read_replies(self) -> None:
+        for line in self.proc.stdout:
+            try:
+                self._replies.put(json.loads(line))
+            except ValueError:
+                self.stderr_tail.append(line.rstrip("\n"))
+        self._replies.put(None)  # EOF: the worker exited
+
+    def _drain_stderr(self) -> None:
+        for line in self.proc.stderr:
+            self.stderr_tail.append(line.rstrip("\n"))
+
+    def _request(self, msg: dict, deadline: float) -> Optional[dict]:
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+        return self._receive(deadline)
+
+    def _receive(self, deadline: float) -> Optional[dict]:
+        try:
+            return self._replies.get(timeout=max(deadline - time.time(), 0.0))
+        except queue.Empty:
+            raise TimeoutError from None
+
+    def open(self, deadline: float) -> bool:
+        ready = self._receive(deadline)
+        self.startup = time.time() - self.started
+        return ready is not None
+
+    def baseline(self, deadline: float) -> Optional[dict]:
+        return self._request({"cmd": "baseline"}, deadline)
+
+    def mutant(self, m: MutantSpec, deadline: float, tests: Optional[List[str]] = None, fail_fast: bool = False) -> Optional[dict]:
+        return self._request({"cmd": "mutant", "id": m.id, "source": m.source, "tests": tests, "fail_fast": fail_fast}, deadline)
+
+    def recover(self, deadline: float) -> bool:
+        """Replace a worker stuck in a timed-out mutant with a fresh session."""
+        _kill_proc_tree(self.proc)
+        unregister_proc(self.proc)
+        self.__init__(*self._spawn_args)
+        return self.open(deadline)
+
+    def diagnostics(self) -> str:
+        return "\n".join(list(self.stderr_tail)[-20:])
+
+    def close(self) -> None:
+        if self.proc.returncode is None:
+            try:
+                self.proc.stdin.write(json.dumps({"cmd": "exit"}) + "\n")
+                self.proc.stdin.flush()
+                wait_with_usage(self.proc, 5)
+            except Exception:
+                pass
+        _kill_proc_tree(self.proc)
+        unregister_proc(self.proc)
+
+class ForkSession:
+    """
+    Executor of the fork engine for one suite: every baseline/mutant run is a
+    child forked by the shared zygote of the suite's dependency profile.
+    """
+
+    def __init__(self, server: "ForkServer", td: TestDir) -> None:
+        self.server = server
+        self.td = td
+        self.startup = 0.0
+
+    def _payload(self, source: Optional[str], tests: Optional[List[str]] = None, fail_fast: bool = False) -> dict:
+        return {"dir": str(self.td.test_dir), "target": self.td.mutate_target,
+                "test_file": self.td.test_file.name, "source": source, "tests": tests, "fail_fast": fail_fast}
+
+    def open(self, deadline: float) -> bool:
+        ok = self.server.wait_ready(deadline)
+        self.startup = self.server.startup
+        return ok
+
+    def baseline(self, deadline: float) -> Optional[dict]:
+        reply = self.server.run(self._payload(None), deadline)
+        if reply is not None:
+            reply["passed"] = reply.get("exit_code") == 0
+        return reply
+
+    def mutant(self, m: MutantSpec, deadline: float, tests: Optional[List[str]] = None, fail_fast: bool = False) -> Optional[dict]:
+        reply = self.server.run(self._payload(m.source, tests, fail_fast), deadline)
+        if reply is not None:
+            # mutmut's tests_pass(): only pytest exit code 1 (tests failed) kills.
+            reply["killed"] = reply.get("exit_code") == 1
+        return reply
+
+    def recover(self, deadline: float) -> bool:
+        return self.server.alive()  # ForkServer.run already killed the timed-out child
+
+    def diagnostics(self) -> str:
+        return self.server.diagnostics()
+
+    def close(self) -> None:
+        pass  # the zygote outlives the suite; see shutdown_fork_servers()
+
+def make_executor(cfg: Config, td: TestDir, python_exe: str):
+    if cfg.engine == "fork":
+        return ForkSession(get_fork_server(cfg, python_exe, dependency_profile(td)), td)
+    return WarmWorker(cfg, td, python_exe)
+
+def _classify_kill(reply: dict, startup: float, baseline: float, raw_status_map: Dict[str, str]) -> str:
+    if not reply.get("killed"):
+        return raw_status_map["survived"]
+    # mutmut flags a kill as suspicious when (startup + body) > 2 * (startup + baseline);
+    # in-process engines pay startup once, so the same rule reads body > startup + 2 * baseline.
+    if float(reply.get("seconds") or 0.0) > startup + 2.0 * baseline:
+        return raw_status_map["suspicious"]
+    return raw_status_map["killed"]
+
+def load_mutants(cfg: Config, td: TestDir, generate: bool = True) -> Optional[List[MutantSpec]]:
+    return load_catalogue(cfg.catalogue_dir, cfg.venv_path, td.test_dir / td.mutate_target, generate)
+
+def fixed_sampling(cfg: Config) -> bool:
+    return cfg.mutant_sample_fraction < 1.0 or cfg.mutant_sample_max is not None
+
+def narrows_mutants(cfg: Config) -> bool:
+    """True when select_mutants may leave out mutants that a plain 'mutmut run' would test."""
+    return fixed_sampling(cfg) or cfg.skip_equivalent
+
+def select_mutants(cfg: Config, td: TestDir, equivalent: bool = False, generate: bool = True) -> Optional[List[MutantSpec]]:
+    """The mutants a run tests: load_mutants, or its fixed sample under --mutant-sample-fraction/-max,
+    minus those found equivalent under --skip-equivalent (only those, with equivalent=True)."""
+    mutants = load_mutants(cfg, td, generate)
+    if mutants is None or not narrows_mutants(cfg):
+        return [] if equivalent and mutants is not None else mutants
+    source = (td.test_dir / td.mutate_target).read_text(encoding="utf-8")
+    if fixed_sampling(cfg):
+        mutants = stratified_sample(mutants, source, cfg.mutant_sample_fraction, cfg.mutant_sample_max,
+                                    f"{cfg.sample_seed}:{hashlib.sha256(source.encode('utf-8')).hexdigest()}")
+    if cfg.skip_equivalent:
+        same = equivalent_ids(source, td.mutate_target, mutants)
+        return [m for m in mutants if (m.id in same) == equivalent]
+    return [] if equivalent else mutants
+
+_TOKEN_RX = re.compile(r"""[rbuRBUfF]*'[^']*'?|[rbuRBUfF]*"[^"]*"?|\d[\w.]*|\w+|[^\s\w]+""")
+
+def mutation_operator(original_lines: List[str], m: MutantSpec) -> str:
+    """Coarse operator of a mutant from the first token it changes on its line: 'number', 'string',
+    'keyword', 'name' or 'operator'; 'statement' when lines were added or removed."""
+    mutated_lines = m.source.splitlines()
+    if len(mutated_lines) != len(original_lines):
+        return "statement"
+    i = m.line_number - 1
+    before = _TOKEN_RX.findall(original_lines[i]) if i < len(original_lines) else []
+    after = _TOKEN_RX.findall(mutated_lines[i]) if i < len(mutated_lines) else []
+    for a, b in zip(before + [""], after + [""]):
+        if a == b:
+            continue
+        tok = a or b
+        if re.match(r"[rbuRBUfF]*['\"]", tok):
+            return "string"
+        if tok[:1].isdigit():
+            return "number"
+        if keyword.iskeyword(a) or keyword.iskeyword(b):
+            return "keyword"
+        if tok[:1].isalpha() or tok[:1] == "_":
+            return "name"
+        return "operator"
+    return "statement"
+
+_equivalent_cache: Dict[str, bool] = {}  # mutant hash -> equivalent (a mutant hash pins target and mutation)
+_equivalent_cache_lock = threading.Lock()
+
+def equivalent_ids(source: str, filename: str, mutants: List[MutantSpec]) -> Set[int]:
+    """Ids of the mutants whose code fingerprint equals the unmutated module's."""
+    with _equivalent_cache_lock:
+        todo = [m for m in mutants if m.mutant_hash not in _equivalent_cache]
+    if todo:
+        original = code_fingerprint(source, filename)
+        found = {m.mutant_hash: original is not None and code_fingerprint(m.source, filename) == original for m in todo}
+        with _equivalent_cache_lock:
+            _equivalent_cache.update(found)
+    with _equivalent_cache_lock:
+        return {m.id for m in mutants if _equivalent_cache.get(m.mutant_hash)}
+
+def code_fingerprint(source: str, filename: str) -> Optional[str]:
+    """
+    sha256 of the module compiled with its docstrings dropped, over bytecode, constants, names and
+    flags of every code object but not line numbers or file names. Constant folding is the
+    compiler's, so '2 * 3' and '6' agree. None when the source does not compile.
+    """
+    try:
+        tree = ast.parse(source, filename)
+    except (SyntaxError, ValueError):
+        return None
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) and node.body:
+            first = node.body[0]
+            if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+                node.body[0] = ast.copy_location(ast.Pass(), first)
+    try:
+        code = compile(tree, filename, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError):
+        return None
+    h = hashlib.sha256()
+    _hash_code(code, h)
+    return h.hexdigest()
+
+def _hash_code(code: types.CodeType, h) -> None:
+    for part in (code.co_name, code.co_argcount, code.co_posonlyargcount, code.co_kwonlyargcount, code.co_flags,
+                 code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars):
+        h.update(repr(part).encode("utf-8") + b"\0")
+    h.update(code.co_code)
+    for const in code.co_consts:
+        _hash_const(const, h)
+
+def _hash_const(const: object, h) -> None:
+    if isinstance(const, types.CodeType):
+        h.update(b"code\0")
+        _hash_code(const, h)
+    elif isinstance(const, (tuple, frozenset)):
+        items = list(const) if isinstance(const, tuple) else sorted(const, key=repr)
+        h.update(f"{type(const).__name__}({len(items)})".encode("utf-8"))
+        for item in items:
+            _hash_const(item, h)
+    else:
+        h.update(f"{type(const).__name__}:{const!r}\0".encode("utf-8"))
+
+def stratified_sample(mutants: List[MutantSpec], source: str, fraction: float, cap: Optional[int], seed: str) -> List[MutantSpec]:
+    """
+    Systematic sample over the mutants ordered by (operator, line, index): every operator gets
+    its proportional share, spread evenly over the file's lines. Only the seeded start varies,
+    so the sample depends on nothing but the mutants, the settings and the seed.
+    """
+    n = len(mutants)
+    k = min(n, max(1, math.ceil(fraction * n)), cap if cap is not None else n)
+    if k >= n:
+        return list(mutants)
+    lines = source.splitlines()
+    ordered = sorted(mutants, key=lambda m: (mutation_operator(lines, m), m.line_number, m.index))
+    step = n / k
+    start = random.Random(seed).uniform(0.0, step)
+    return sorted((ordered[int(start + i * step)] for i in range(k)), key=lambda m: m.id)
+
+def run_in_process(cfg: Config, td: TestDir, python_exe: str, raw_status_map: Dict[str, str],
+                   mutants: Optional[List[MutantSpec]] = None, label: Optional[str] = None,
+                   tests_for: Optional[Dict[int, List[str]]] = None,
+                   history: Optional["KillHistory"] = None,
+                   stop: Optional[Callable[[List[MutantOutcome]], bool]] = None) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+    """
+    Test the mutants of td (all of them unless a subset is given) with the executor
+    of cfg.engine ('warm' or 'fork'); tests_for optionally limits a mutant to some
+    tests, and a kill history orders them and stops each mutant at its first kill.
+    stop is asked after every mutant whether the remaining ones can be skipped.
+    Returns (completed, exit_code, outcomes) with run_mutmut's meaning of the first two:
+    exit_code bit 1 flags a fatal error (no mutmut, unclean baseline, crashed worker).
+    """
+    rel_dir = label or as_posix_relative(td.test_dir, cfg.repo_root)
+    if mutants is None:
+        mutants = select_mutants(cfg, td)
+        if mutants is None:
+            return True, 1, []
+
+    outcomes: List[MutantOutcome] = []
+    with get_per_dir_lock(td.test_dir):
+        deadline = time.time() + cfg.mutmut_timeout_seconds
+        executor = make_executor(cfg, td, python_exe)
+        try:
+            with trace_span("baseline", dir=rel_dir):
+                baseline = executor.baseline(deadline) if executor.open(deadline) else None
+            if not baseline or not baseline.get("passed"):
+                detail = baseline.get("detail") if baseline else executor.diagnostics()
+                err(f"Tests don't run cleanly without mutations in {rel_dir} ({cfg.engine} engine):\n{detail}")
+                return True, 1, []
+            for m in mutants:
+                tests = (tests_for or {}).get(m.id)
+                if history is not None:
+                    tests = history.order(tests or baseline.get("tests") or [])
+                limit = cfg.mutant_timeout_constant + cfg.mutant_timeout_multiplier * float(baseline["seconds"])
+                try:
+                    with trace_span("mutant", dir=rel_dir, id=m.id, line=m.line_number):
+                        reply = executor.mutant(m, min(deadline, time.time() + limit), tests, history is not None)
+                except TimeoutError:
+                    if time.time() >= deadline:
+                        raise
+                    warn(f"Mutant {m.id} (line {m.line_number}) in {rel_dir} exceeded its {limit:.1f}s limit; classified as timeout")
+                    outcomes.append(MutantOutcome(m.id, m.line_number, m.index, raw_status_map["timeout"], limit))
+                    report_progress(rel_dir, len(outcomes), len(mutants))
+                    if not executor.recover(deadline):
+                        err(f"Could not restart {cfg.engine} worker after a mutant timeout in {rel_dir}\n{executor.diagnostics()}")
+                        return True, 1, []
+                    if stop is not None and stop(outcomes):
+                        break
+                    continue
+                if reply is None:
+                    err(f"{cfg.engine} worker exited unexpectedly at mutant {m.id} in {rel_dir}\n{executor.diagnostics()}")
+                    return True, 1, []
+                if history is not None and reply.get("killed") and reply.get("killer"):
+                    history.record(reply["killer"])
+                status = _classify_kill(reply, executor.startup, float(baseline["seconds"]), raw_status_map)
+                outcomes.append(MutantOutcome(m.id, m.line_number, m.index, status, reply.get("seconds")))
+                report_progress(rel_dir, len(outcomes), len(mutants))
+                if stop is not None and stop(outcomes):
+                    break
+        except TimeoutError:
+            warn(f"Timeout after {cfg.mutmut_timeout_seconds}s for {rel_dir}; stopped {cfg.engine} worker ({len(outcomes)}/{len(mutants)} mutants done)")
+            return False, None, []
+        except OSError as e:
+            err(f"Lost connection to {cfg.engine} worker in {rel_dir}: {e!r}")
+            return True, 1, []
+        finally:
+            executor.close()
+    return True, 0, outcomes
+
+def warm_worker_main(argv: List[str]) -> int:
+    """
+    Child side of the warm engine. Runs under the venv interpreter with cwd set to
+    the suite directory: collects the test file once, then serves 'baseline' and
+    'mutant' requests from stdin until it receives 'exit' or EOF.
+    """
+    ap = argparse.ArgumentParser(prog=WARM_WORKER_FLAG)
+    ap.add_argument("--target", required=True)
+    ap.add_argument("--test-file", required=True)
+    ap.add_argument("--trace", action="store_true", help="Record the target lines each test executes.")
+    ns = ap.parse_args(argv)
+
+    # Private handles on the protocol pipes: pytest's fd capture redirects fds 0/1
+    # while tests run, and stray prints must not corrupt the reply stream.
+    proto_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    target_path = Path.cwd() / ns.target
+    module_name = target_path.stem
+    sys.path.insert(0, str(target_path.parent))
+
+    # Line tracing is installed before collection so that import-time lines of
+    # the target (definitions, constants) are recorded as well.
+    hits: Set[int] = set()
+    if ns.trace:
+        target_files = {str(target_path), os.path.realpath(str(target_path))}
+
+        def trace_lines(frame, event, arg):
+            if event == "line":
+                hits.add(frame.f_lineno)
+            return trace_lines
+
+        def trace_calls(frame, event, arg):
+            if frame.f_code.co_filename not in target_files:
+                return None
+            hits.add(frame.f_lineno)
+            return trace_lines
+
+        sys.settrace(trace_calls)
+        threading.settrace(trace_calls)
+
+    import pytest
+    from _pytest.runner import runtestprotocol
+
+    def reply(msg: dict) -> None:
+        proto_out.write(json.dumps(msg) + "\n")
+        proto_out.flush()
+
+    def imported_names(test_module) -> Dict[str, Optional[str]]:
+        """{local name: attribute of the target, or None for the module itself}."""
+        names: Dict[str, Optional[str]] = {}
+        try:
+            tree = ast.parse(Path(test_module.__file__).read_text(encoding="utf-8"))
+        except Exception:
+            return names
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module == module_name and not node.level:
+                for a in node.names:
+                    if a.name == "*":
+                        names.update({k: k for k in getattr(test_module, "__dict__", {}) if not k.startswith("_")})
+                    else:
+                        names[a.asname or a.name] = a.name
+            elif isinstance(node, ast.Import):
+                for a in node.names:
+                    if a.name == module_name:
+                        names[a.asname or a.name] = None
+        return names
+
+    failures: List[str] = []
+
+    def test_key(item) -> str:
+        """Node id relative to the suite directory, usable as a pytest argument from there."""
+        parts = item.nodeid.split("::", 1)
+        return f"{ns.test_file}::{parts[1]}" if len(parts) == 2 else item.nodeid
+
+    def run_items(items, lines_by_test: Optional[Dict[str, List[int]]] = None,
+                  fail_fast: bool = False) -> Tuple[bool, float, Optional[str]]:
+        """Returns (failed, seconds, key of the first failing test)."""
+        start = time.perf_counter()
+        killer: Optional[str] = None
+        for i, item in enumerate(items):
+            nextitem = items[i + 1] if i + 1 < len(items) else None
+            hits.clear()
+            reports = runtestprotocol(item, log=False, nextitem=nextitem)
+            if lines_by_test is not None:
+                lines_by_test[test_key(item)] = sorted(hits)
+            for r in reports:
+                if r.failed:
+                    killer = killer or test_key(item)
+                    failures.append(f"{item.nodeid} ({r.when}): {str(r.longrepr)[-2000:]}")
+            if killer and fail_fast:
+                if nextitem is not None:
+                    item.session._setupstate.teardown_exact(None)  # what the skipped tail would have torn down
+                break
+        return killer is not None, time.perf_counter() - start, killer
+
+    class WarmSession:
+        def pytest_collectreport(self, report):
+            if report.failed:
+                failures.append(f"collecting {report.nodeid}: {str(report.longrepr)[-2000:]}")
+
+        @pytest.hookimpl(tryfirst=True)
+        def pytest_runtestloop(self, session):
+            items = list(session.items)
+            original = sys.modules.get(module_name)
+            test_modules = {id(m): m for m in (getattr(it, "module", None) for it in items) if m is not None}
+            bindings = [(m, imported_names(m)) for m in test_modules.values()]
+            import_lines = sorted(hits)
+            reply({"event": "ready", "collected": len(items), "errors": session.testsfailed})
+
+            for line in proto_in:
+                msg = json.loads(line)
+                cmd = msg.get("cmd")
+                if cmd == "baseline":
+                    lines_by_test: Optional[Dict[str, List[int]]] = {} if ns.trace else None
+                    failed, secs, _ = run_items(items, lines_by_test)
+                    passed = bool(items) and not failed and not session.testsfailed
+                    detail = failures[0] if failures else ("" if items else "no tests collected")
+                    msg_out = {"event": "baseline", "passed": passed, "seconds": secs, "detail": detail,
+                               "tests": [test_key(it) for it in items]}
+                    if ns.trace:
+                        msg_out["coverage"] = {"import": import_lines, "tests": lines_by_test}
+                    reply(msg_out)
+                elif cmd == "mutant":
+                    saved = [(m, dict(vars(m))) for m, _ in bindings]
+                    mutant = types.ModuleType(module_name)
+                    mutant.__file__ = str(target_path)
+                    sys.modules[module_name] = mutant
+                    try:
+                        exec(compile(msg["source"], str(target_path), "exec"), mutant.__dict__)
+                    except Exception:
+                        # Under `mutmut run` this is a collection error (pytest exit 2),
+                        # which mutmut counts as survived; keep that semantics.
+                        sys.modules[module_name] = original
+                        reply({"event": "result", "id": msg["id"], "killed": False, "seconds": 0.0})
+                        continue
+                    try:
+                        for m, names in bindings:
+                            ns_ = vars(m)
+                            for local, attr in names.items():
+                                if attr is None:
+                                    if ns_.get(local) is original:
+                                        ns_[local] = mutant
+                                elif original is not None and ns_.get(local) is getattr(original, attr, object()):
+                                    if hasattr(mutant, attr):
+                                        ns_[local] = getattr(mutant, attr)
+                        if msg.get("tests"):
+                            by_key = {test_key(it): it for it in items}
+                            run = [by_key[k] for k in msg["tests"] if k in by_key]
+                        else:
+                            run = items
+                        killed, secs, killer = run_items(run, fail_fast=bool(msg.get("fail_fast")))
+                        failures.clear()
+                    finally:
+                        for m, snapshot in saved:
+                            vars(m).update(snapshot)
+                        sys.modules[module_name] = original
+                    reply({"event": "result", "id": msg["id"], "killed": killed, "seconds": secs, "killer": killer})
+                else:
+                    break
+            return True
+
+    pytest.main([ns.test_file, "-q", "-p", "no:cacheprovider"], plugins=[WarmSession()])
+    return 0
+
+# ---------------------------
+# Fork engine (POSIX zygotes)
+# ---------------------------
+
+_fork_servers: Dict[Tuple[str, ...], "ForkServer"] = {}
+_fork_servers_lock = threading.Lock()
+
+def dependency_profile(td: TestDir) -> Tuple[str, ...]:
+    """
+    Third-party modules imported by the target and the test file (plus pytest),
+    i.e. what a zygote should preload for this suite. Suites with equal profiles
+    share one zygote.
+    """
+    stdlib = getattr(sys, "stdlib_module_names", frozenset())
+    local = {p.stem for p in td.test_dir.glob("*.py")}
+    mods = {"pytest"}
+    for path in (td.test_dir / td.mutate_target, td.test_file):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [a.name for a in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                root = name.split(".", 1)[0]
+                if root not in stdlib and root not in local and root != "__future__":
+                    mods.add(name)
+    return tuple(sorted(mods))
+
+class ForkServer:
+    """
+    Orchestrator-side handle of one zygote (see fork_zygote_main). Shared by all
+    job threads whose suites have the same dependency profile; requests are
+    multiplexed over one pipe and matched to replies by request id.
+    """
+
+    def __init__(self, cfg: Config, python_exe: str, profile: Tuple[str, ...]) -> None:
+        self.profile = profile
+        env = mutation_env(cfg)
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        self.started = time.time()
+        self.startup = 0.0
+        self.proc = subprocess.Popen(
+            [python_exe, str(Path(__file__).resolve()), FORK_ZYGOTE_FLAG, *profile],
+            cwd=str(cfg.repo_root), env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace", **popen_group_kwargs(),
+        )
+        register_proc(self.proc)
+        self.stderr_tail: "collections.deque[str]" = collections.deque(maxlen=WARM_STDERR_TAIL_LINES)
+        self._ready = threading.Event()
+        self._alive = True
+        self._lock = threading.Lock()
+        self._next_req = 0
+        self._pending: Dict[int, "queue.Queue[Optional[dict]]"] = {}
+        threading.Thread(target=self._read_replies, daemon=True).start()
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+    def _read_replies(self) -> None:
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                self.stderr_tail.append(line.rstrip("\n"))
+                continue
+            if msg.get("event") == "ready":
+                self.startup = time.time() - self.started
+                if msg.get("failed"):
+                    warn(f"Zygote could not preload {', '.join(msg['failed'])}")
+                self._ready.set()
+                continue
+            with self._lock:
+                q = self._pending.get(msg.get("req"))
+            if q is not None:
+                q.put(msg)
+        with self._lock:
+            self._alive = False
+            pending = list(self._pending.values())
+        for q in pending:
+            q.put(None)
+        self._ready.set()
+
+    def _drain_stderr(self) -> None:
+        for line in self.proc.stderr:
+            self.stderr_tail.append(line.rstrip("\n"))
+
+    def alive(self) -> bool:
+        return self._alive and self.proc.poll() is None
+
+    def wait_ready(self, deadline: float) -> bool:
+        if not self._ready.wait(timeout=max(deadline - time.time(), 0.0)):
+            raise TimeoutError
+        return self.alive()
+
+    def run(self, payload: dict, deadline: float) -> Optional[dict]:
+        """Fork one child for payload; returns its report, None if the zygote died, raises TimeoutError past deadline."""
+        q: "queue.Queue[Optional[dict]]" = queue.Queue()
+        with self._lock:
+            if not self._alive:
+                return None
+            self._next_req += 1
+            req = self._next_req
+            self._pending[req] = q
+            self.proc.stdin.write(json.dumps(dict(payload, req=req)) + "\n")
+            self.proc.stdin.flush()
+        pid = None
+        try:
+            while True:
+                try:
+                    msg = q.get(timeout=max(deadline - time.time(), 0.0))
+                except queue.Empty:
+                    raise TimeoutError from None
+                if msg is None or msg.get("event") == "result":
+                    if msg is not None and msg.get("rusage"):
+                        add_usage(*msg["rusage"])
+                    return msg
+                pid = msg.get("pid")
+        except TimeoutError:
+            if pid is not None:
+                try:
+                    os.killpg(pid, signal.SIGKILL)  # the child leads its own session
+                except OSError:
+                    pass
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(req, None)
+
+    def diagnostics(self) -> str:
+        return "\n".join(list(self.stderr_tail)[-20:])
+
+    def close(self) -> None:
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(json.dumps({"cmd": "exit"}) + "\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=5)
+            except Exception:
+                pass
+        _kill_proc_tree(self.proc)
+        unregister_proc(self.proc)
+
+def get_fork_server(cfg: Config, python_exe: str, profile: Tuple[str, ...]) -> ForkServer:
+    with _fork_servers_lock:
+        server = _fork_servers.get(profile)
+        if server is None or not server.alive():
+            log(f"Starting zygote for profile [{', '.join(profile)}]")
+            server = ForkServer(cfg, python_exe, profile)
+            _fork_servers[profile] = server
+        return server
+
+def shutdown_fork_servers() -> None:
+    with _fork_servers_lock:
+        servers = list(_fork_servers.values())
+        _fork_servers.clear()
+    for server in servers:
+        server.close()
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _fork_child_run(msg: dict) -> dict:
+    """Body of a forked child: install the mutant (if any) and run the suite once."""
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    test_dir = msg["dir"]
+    os.chdir(test_dir)
+    sys.path.insert(0, test_dir)
+    target_path = Path(test_dir) / msg["target"]
+    start = time.perf_counter()
+    if msg.get("source") is not None:
+        mutant = types.ModuleType(target_path.stem)
+        mutant.__file__ = str(target_path)
+        sys.modules[target_path.stem] = mutant
+        try:
+            exec(compile(msg["source"], str(target_path), "exec"), mutant.__dict__)
+        except Exception as e:
+            # `mutmut run` would see a collection error here (pytest exit 2).
+            return {"exit_code": 2, "seconds": time.perf_counter() - start, "detail": repr(e)}
+
+    import pytest
+    failures: List[str] = []
+    killers: List[str] = []
+    collected: List[str] = []
+
+    def test_key(nodeid: str) -> str:
+        parts = nodeid.split("::", 1)
+        return f"{msg['test_file']}::{parts[1]}" if len(parts) == 2 else nodeid
+
+    class _Failures:
+        def pytest_collectreport(self, report):
+            if report.failed:
+                failures.append(f"collecting {report.nodeid}: {str(report.longrepr)[-2000:]}")
+
+        def pytest_collection_finish(self, session):
+            collected.extend(test_key(item.nodeid) for item in session.items)
+
+        def pytest_runtest_logreport(self, report):
+            if report.failed:
+                failures.append(f"{report.nodeid} ({report.when}): {str(report.longrepr)[-2000:]}")
+                killers.append(test_key(report.nodeid))
+
+    args = (msg.get("tests") or [msg["test_file"]]) + ["-q", "-p", "no:cacheprovider"] + (["-x"] if msg.get("fail_fast") else [])
+    rc = pytest.main(args, plugins=[_Failures()])
+    return {"exit_code": int(rc), "seconds": time.perf_counter() - start, "detail": failures[0] if failures else "",
+            "tests": collected, "killer": killers[0] if killers else None}
+
+def fork_zygote_main(argv: List[str]) -> int:
+    """
+    Zygote of the fork engine. Preloads the modules named in argv, then forks one
+    child per request read from stdin. Each child reports through a private pipe;
+    the zygote relays the report (or the child's death) to stdout.
+    """
+    import importlib
+    import select
+
+    failed = []
+    for name in argv:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            failed.append(name)
+
+    def send(msg: dict) -> None:
+        _write_all(1, (json.dumps(msg) + "\n").encode("utf-8"))
+
+    send({"event": "ready", "failed": failed})
+    children: Dict[int, Tuple[int, int, bytearray]] = {}  # read fd -> (req, pid, report bytes)
+    inbuf = b""
+    reading = True
+    while reading or children:
+        readable, _, _ = select.select(([0] if reading else []) + list(children), [], [])
+        for fd in readable:
+            if fd != 0:
+                req, pid, buf = children[fd]
+                chunk = os.read(fd, 65536)
+                if chunk:
+                    buf.extend(chunk)
+                    continue
+                os.close(fd)
+                del children[fd]
+                _, wstatus, ru = os.wait4(pid, 0)
+                try:
+                    os.killpg(pid, signal.SIGKILL)  # processes the tests left behind in the child's session
+                except OSError:
+                    pass
+                try:
+                    report = json.loads(bytes(buf))
+                except ValueError:
+                    code = -os.WTERMSIG(wstatus) if os.WIFSIGNALED(wstatus) else os.WEXITSTATUS(wstatus)
+                    report = {"exit_code": code, "seconds": None, "detail": "child exited without a report"}
+                report.update(req=req, event="result", rusage=[ru.ru_utime, ru.ru_stime, ru.ru_maxrss])
+                send(report)
+                continue
+
+            chunk = os.read(0, 65536)
+            if not chunk:
+                reading = False
+                continue
+            inbuf += chunk
+            while reading and b"\n" in inbuf:
+                line, inbuf = inbuf.split(b"\n", 1)
+                msg = json.loads(line)
+                if msg.get("cmd") == "exit":
+                    reading = False
+                    break
+                rfd, wfd = os.pipe()
+                pid = os.fork()
+                if pid == 0:
+                    os.close(rfd)
+                    try:
+                        report = _fork_child_run(msg)
+                    except BaseException as e:
+                        report = {"exit_code": 3, "seconds": None, "detail": repr(e)}
+                    _write_all(wfd, json.dumps(report).encode("utf-8"))
+                    os._exit(0)
+                os.close(wfd)
+                children[rfd] = (msg["req"], pid, bytearray())
+                send({"req": msg["req"], "event": "forked", "pid": pid})
+    return 0
+
+# ---------------------------
+# Mutant sharding (scratch clones)
+# ---------------------------
+
+SCRATCH_SKIP_NAMES = {".mutmut-cache", ".pytest_cache", "__pycache__"}
+
+SHARD_MUTMUT_CONFIG = """\
+# Generated by run_single_mutation_test.py: this scratch clone tests one shard of the mutants.
+OWNED = {owned!r}
+TESTS = {tests!r}  # per-mutant test selection; mutmut resets test_command after each mutant
+PYTEST = {pytest!r}
+
+def pre_mutation(context):
+    mutation_id = context.mutation_id
+    key = (mutation_id.line_number, mutation_id.index)
+    if key not in OWNED:
+        context.skip = True
+    elif key in TESTS:
+        context.config.test_command = " ".join([PYTEST] + ['"%s"' % t for t in TESTS[key]])
+"""
+
+def _link_or_copy(src: str, dst: str) -> str:
+    try:
+        os.link(src, dst)
+    except OSError:  # other filesystem (e.g. tmpfs), or no hardlink support
+        shutil.copy2(src, dst)
+    return dst
+
+def clone_suite(td: TestDir, scratch_root: Path, link: bool = False) -> TestDir:
+    """Copy a suite directory (minus caches) to a fresh scratch directory. With link, files are
+    hardlinked where the filesystem allows, except the mutate target, which mutmut rewrites in place."""
+    scratch_root.mkdir(parents=True, exist_ok=True)
+    dest = Path(tempfile.mkdtemp(prefix=f"{td.test_dir.name}-", dir=str(scratch_root)))
+    copy = _link_or_copy if link else shutil.copy2
+    for entry in td.test_dir.iterdir():
+        if entry.name in SCRATCH_SKIP_NAMES:
+            continue
+        if entry.is_dir():
+            shutil.copytree(entry, dest / entry.name, ignore=shutil.ignore_patterns(*SCRATCH_SKIP_NAMES), copy_function=copy)
+        else:
+            copy(str(entry), str(dest / entry.name))
+    if link:
+        target = dest / td.mutate_target
+        target.unlink()
+        shutil.copy2(td.test_dir / td.mutate_target, target)
+    return TestDir(td.root_name, dest, td.mutate_target, dest / td.test_file.name)
+
+def copy_back_cache(clone: TestDir, td: TestDir) -> None:
+    """Replace td's `.mutmut-cache` with the clone's, atomically."""
+    src = clone.test_dir / ".mutmut-cache"
+    if not src.exists():
+        return
+    try:
+        _atomic_write(td.test_dir / ".mutmut-cache", src.read_bytes())
+    except OSError as e:
+        warn(f"Could not copy .mutmut-cache back to {td.test_dir}: {e!r}")
+
+def _run_mutmut_shard(cfg: Config, shard_td: TestDir, shard: List[MutantSpec], pytest_exe: str, mutmut_exe: str,
+                      tests_for: Optional[Dict[int, List[str]]] = None, log_path: Optional[Path] = None,
+                      label: Optional[str] = None, history: Optional["KillHistory"] = None) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+    """Run `mutmut run` in a clone whose mutmut_config skips every mutant outside the shard."""
+    owned = {(m.line_number - 1, m.index) for m in shard}
+    tests = {(m.line_number - 1, m.index): history.order(tests_for[m.id]) if history else tests_for[m.id]
+             for m in shard if tests_for and m.id in tests_for}
+    pytest_cmd = quote_if_needed(pytest_exe) + (" -x" if cfg.kill_order else "")
+    config = SHARD_MUTMUT_CONFIG.format(owned=owned, tests=tests, pytest=pytest_cmd)
+    config_path = shard_td.test_dir / "mutmut_config.py"
+    config_path.unlink(missing_ok=True)  # may be a hardlink into the corpus (--workspace)
+    config_path.write_text(config, encoding="utf-8")
+    completed, exit_code = run_mutmut(cfg, shard_td, pytest_exe, mutmut_exe, log_path, label,
+                                      kill_ordered_tests(history, shard_td.test_file) if history else None)
+    if not completed or exit_code is None or exit_code & 1:
+        return completed, exit_code, []
+    statuses = {(line, index): status for line, index, status in read_mutant_rows_from_cache(shard_td.test_dir) or []}
+    outcomes = []
+    for m in shard:
+        status = statuses.get((m.line_number, m.index))
+        if status is None:
+            err(f"Mutant {m.id} missing from shard cache in {shard_td.test_dir}")
+            return True, 1, []
+        outcomes.append(MutantOutcome(m.id, m.line_number, m.index, status, None))
+    return True, exit_code, outcomes
+
+def run_sharded(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str],
+                mutants: Optional[List[MutantSpec]] = None,
+                tests_for: Optional[Dict[int, List[str]]] = None,
+                history: Optional["KillHistory"] = None) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+    """
+    Spread the mutants of td (all of them unless a subset is given) over
+    cfg.mutant_shards workers, each in its own scratch clone, and merge the
+    per-mutant statuses back into one result.
+    """
+    rel_dir = as_posix_relative(td.test_dir, cfg.repo_root)
+    if mutants is None:
+        mutants = select_mutants(cfg, td)
+        if mutants is None:
+            return True, 1, []
+    if not mutants:
+        return True, 0, []
+    n = max(1, min(cfg.mutant_shards, len(mutants)))
+    shards = [mutants[i::n] for i in range(n)]  # striped, so slow regions of the file are spread out
+    with get_per_dir_lock(td.test_dir):
+        clones = [clone_suite(td, cfg.workspace_dir or cfg.scratch_dir, cfg.workspace_dir is not None) for _ in shards]
+
+    def run_shard(i: int) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+        if cfg.engine == "mutmut":
+            suffix = f".shard{i + 1}" if n > 1 else ""
+            label = f"{rel_dir} [shard {i + 1}/{n}]" if n > 1 else rel_dir
+            return _run_mutmut_shard(cfg, clones[i], shards[i], pytest_exe, mutmut_exe, tests_for, mutmut_log_path(cfg, td, suffix),
+                                     label, history)
+        return run_in_process(cfg, clones[i], python_exe, raw_status_map, shards[i], f"{rel_dir} [shard {i + 1}/{n}]", tests_for, history)
+
+    try:
+        with ThreadPoolExecutor(max_workers=n) as ex:
+            # copies of this thread's context, so each shard charges its children to this suite's RunUsage
+            contexts = [contextvars.copy_context() for _ in range(n)]
+            results = list(ex.map(lambda i: contexts[i].run(run_shard, i), range(n)))
+    finally:
+        for clone in clones:
+            shutil.rmtree(clone.test_dir, ignore_errors=True)
+
+    completed = all(r[0] for r in results)
+    exit_code = 0
+    for _, code, _ in results:
+        exit_code |= 1 if code is None else code
+    outcomes = sorted((o for r in results for o in r[2]), key=lambda o: o.id)
+    return completed, (exit_code if completed else None), outcomes
+
+# ---------------------------
+# Coverage gate
+# ---------------------------
+
+def measure_coverage(cfg: Config, td: TestDir, python_exe: str) -> Tuple[bool, Optional[CoverageMap]]:
+    """
+    One traced run of the unmutated suite in a warm worker. Returns (completed, map);
+    map is None when the baseline fails, which is fatal just like under `mutmut run`.
+    """
+    rel_dir = as_posix_relative(td.test_dir, cfg.repo_root)
+    deadline = time.time() + cfg.mutmut_timeout_seconds
+    with get_per_dir_lock(td.test_dir):
+        worker = WarmWorker(cfg, td, python_exe, trace=True)
+        try:
+            baseline = worker.baseline(deadline) if worker.open(deadline) else None
+        except TimeoutError:
+            warn(f"Timeout after {cfg.mutmut_timeout_seconds}s while measuring coverage of {rel_dir}")
+            return False, None
+        except OSError as e:
+            err(f"Lost connection to coverage worker in {rel_dir}: {e!r}")
+            return True, None
+        finally:
+            worker.close()
+    if not baseline or not baseline.get("passed") or "coverage" not in baseline:
+        detail = baseline.get("detail") if baseline else worker.diagnostics()
+        err(f"Tests don't run cleanly without mutations in {rel_dir} (coverage pass):\n{detail}")
+        return True, None
+    data = baseline["coverage"]
+    return True, CoverageMap(set(data["import"]), {k: set(v) for k, v in data["tests"].items()})
+
+def statement_heads(source: str) -> Dict[int, Tuple[int, int]]:
+    """
+    {line: (first, last)} line span of the innermost statement (for compound
+    statements: their header) containing each line. A line event is only reported
+    for some lines of a multi-line statement, so coverage is judged per span.
+    """
+    heads: Dict[int, Tuple[int, int]] = {}
+    for node in sorted((n for n in ast.walk(ast.parse(source)) if isinstance(n, ast.stmt)), key=lambda n: n.lineno):
+        end = node.end_lineno or node.lineno
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and body and isinstance(body[0], ast.stmt):
+            end = max(node.lineno, body[0].lineno - 1)
+        for line in range(node.lineno, end + 1):
+            heads[line] = (node.lineno, end)  # later (inner) statements override outer ones
+    return heads
+
+def line_is_covered(line: int, lines: Set[int], heads: Dict[int, Tuple[int, int]]) -> bool:
+    span = heads.get(line)
+    if span is None:
+        return True  # not inside any statement (e.g. a decorator line): cannot judge, run it
+    return any(n in lines for n in range(span[0], span[1] + 1))
+
+def load_coverage_map(cfg: Config, td: TestDir, python_exe: str) -> Tuple[bool, Optional[CoverageMap]]:
+    """
+    Coverage map of td, stored next to the mutant catalogue under the suite's content
+    hash so that it is measured once for all byte-identical suites and later runs.
+    """
+    path = cfg.catalogue_dir / "coverage" / f"{suite_content_hash(td)}.json"
+    if path.exists():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return True, CoverageMap(set(data["import"]), {k: set(v) for k, v in data["tests"].items()})
+        except Exception as e:
+            warn(f"Re-measuring unreadable coverage map {path.name}: {e!r}")
+    completed, cov = measure_coverage(cfg, td, python_exe)
+    if cov is not None:
+        data = {"import": sorted(cov.import_lines), "tests": {k: sorted(v) for k, v in cov.test_lines.items()}}
+        try:
+            _atomic_write(path, json.dumps(data))
+        except Exception as e:
+            warn(f"Could not write coverage map {path.name}: {e!r}")
+    return completed, cov
+
+def plan_by_coverage(cfg: Config, td: TestDir, mutants: List[MutantSpec], cov: CoverageMap,
+                     raw_status_map: Dict[str, str]) -> Tuple[List[MutantSpec], List[MutantOutcome], Dict[int, List[str]]]:
+    """
+    Split mutants into (to run, outcomes of uncovered mutants marked survived,
+    {mutant id: tests to run}). Tests are only selected with --select-tests, and
+    never for lines executed at import time, which every test depends on.
+    """
+    heads = statement_heads((td.test_dir / td.mutate_target).read_text(encoding="utf-8"))
+    run: List[MutantSpec] = []
+    skipped: List[MutantOutcome] = []
+    tests_for: Dict[int, List[str]] = {}
+    for m in mutants:
+        if line_is_covered(m.line_number, cov.import_lines, heads):
+            run.append(m)
+            continue
+        tests = [t for t, lines in cov.test_lines.items() if line_is_covered(m.line_number, lines, heads)]
+        if not tests:
+            skipped.append(MutantOutcome(m.id, m.line_number, m.index, raw_status_map["survived"], 0.0))
+            continue
+        run.append(m)
+        if cfg.select_tests:
+            tests_for[m.id] = tests
+    return run, skipped, tests_for
+
+# ---------------------------
+# Mutant catalogue (shared across suites)
+# ---------------------------
+
+_catalogue_locks: Dict[str, threading.Lock] = {}
+_catalogue_locks_guard = threading.Lock()
+
+def catalogue_key(mm, target_path: Path) -> str:
+    """sha256 over the catalogue format, the mutmut version and the target bytes."""
+    h = hashlib.sha256()
+    h.update(f"v{CATALOGUE_VERSION}\0{getattr(mm, '__version__', 'unknown')}\0".encode("utf-8"))
+    h.update(target_path.read_bytes())
+    return h.hexdigest()
+
+def load_catalogue(catalogue_dir: Path, venv_path: Path, target_path: Path, generate: bool = True) -> Optional[List[MutantSpec]]:
+    """
+    Mutants of target_path from the shared catalogue, generating and storing the
+    entry on first use. Every suite with the same target source therefore sees
+    the same mutant ids, line numbers and hashes. Returns None if mutmut cannot
+    be imported or generation fails, and with generate=False if there is no entry yet.
+    """
+    mm = import_mutmut(venv_path)
+    if mm is None:
+        return None
+    try:
+        key = catalogue_key(mm, target_path)
+    except OSError as e:
+        err(f"Cannot read mutate target {target_path}: {e!r}")
+        return None
+    with _catalogue_locks_guard:
+        lock = _catalogue_locks.setdefault(key, threading.Lock())
+    path = catalogue_dir / f"{key}.json"
+    with lock:
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                return [MutantSpec(int(m["id"]), int(m["line_number"]), int(m["index"]), str(m["source"]), str(m["mutant_hash"]))
+                        for m in data["mutants"]]
+            except Exception as e:
+                if not generate:
+                    return None
+                warn(f"Regenerating unreadable catalogue entry {path.name}: {e!r}")
+        if not generate:
+            return None
+        try:
+            specs = generate_mutants(mm, target_path)
+        except Exception as e:
+            err(f"Mutant generation failed for {target_path}: {e!r}")
+            return None
+        data = {
+            "target": target_path.name,
+            "mutmut_version": str(getattr(mm, "__version__", "unknown")),
+            "mutants": [{"id": m.id, "line_number": m.line_number, "index": m.index,
+                         "mutant_hash": m.mutant_hash, "source": m.source} for m in specs],
+        }
+        try:
+            _atomic_write(path, json.dumps(data))
+        except Exception as e:
+            warn(f"Could not write catalogue entry {path.name}: {e!r}")
+        return specs
+
+# ---------------------------
+# Kill history (test ordering)
+# ---------------------------
+
+class KillHistory:
+    """
+    Per-suite count of mutants each test killed first, kept next to the mutant
+    catalogue under the suite's content hash so it carries over to later
+    replications. Shared by the shards of a suite, hence the lock.
+    """
+
+    def __init__(self, path: Path, counts: Dict[str, int]) -> None:
+        self.path = path
+        self.counts = counts
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, cfg: Config, td: TestDir) -> "KillHistory":
+        path = cfg.catalogue_dir / "kill-history" / f"{suite_content_hash(td)}.json"
+        counts: Dict[str, int] = {}
+        if path.exists():
+            try:
+                counts = {str(k): int(v) for k, v in json.loads(path.read_text(encoding="utf-8")).items()}
+            except Exception as e:
+                warn(f"Ignoring unreadable kill history {path.name}: {e!r}")
+        return cls(path, counts)
+
+    def order(self, tests: List[str]) -> List[str]:
+        """Strongest killers first; ties keep file order."""
+        with self._lock:
+            rank = dict(self.counts)
+        return sorted(tests, key=lambda t: -rank.get(t, 0))
+
+    def record(self, test: str) -> None:
+        with self._lock:
+            self.counts[test] = self.counts.get(test, 0) + 1
+
+    def by_function(self) -> Dict[str, int]:
+        """Counts per test function: the cases of a parametrized test ('t[1]', 't[2]') are summed under 't'."""
+        totals: Dict[str, int] = {}
+        with self._lock:
+            for test, n in self.counts.items():
+                base = test.split("[", 1)[0]
+                totals[base] = totals.get(base, 0) + n
+        return totals
+
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps(self.counts, sort_keys=True)
+        try:
+            _atomic_write(self.path, data)
+        except Exception as e:
+            warn(f"Could not write kill history {self.path.name}: {e!r}")
+
+def kill_ordered_tests(history: "KillHistory", test_file: Path) -> Optional[List[str]]:
+    """
+    Node ids of every test in test_file, strongest killers first, for a `mutmut run` under
+    --kill-order. None (pytest's file order) when no test has a recorded kill or the ids would
+    not fit a command line. The warm and fork engines record the kills; mutmut cannot.
+    """
+    totals = history.by_function()
+    tests = list_test_ids(test_file)
+    if not tests or not any(totals.get(t) for t in tests):
+        return None
+    ordered = sorted(tests, key=lambda t: -totals.get(t, 0))
+    if sum(len(t) + 3 for t in ordered) > MAX_RUNNER_TEST_CHARS:
+        return None
+    return ordered
+
+# ---------------------------
+# Outcome cache (content-addressed)
+# ---------------------------
+
+def mutmut_version(cfg: Config) -> str:
+    mm = import_mutmut(cfg.venv_path)
+    return str(getattr(mm, "__version__", "unknown")) if mm is not None else "unknown"
+
+def outcome_cache_key(cfg: Config, td: TestDir, pytest_exe: str) -> str:
+    """
+    sha256 over everything that determines per-mutant statuses: target and test
+    sources, mutmut version, engine/runner command, hash seed, suite and per-mutant
+    timeouts, shard count, fixed sample and equivalence check.
+    """
+    h = hashlib.sha256()
+    for part in (
+        f"v{OUTCOME_CACHE_VERSION}",
+        cfg.engine,
+        "select-tests" if cfg.select_tests else ("coverage-gate" if cfg.coverage_gate else ""),
+        "kill-order" if cfg.kill_order else "",
+        mutmut_runner_command(Path(pytest_exe).name, cfg.kill_order),
+        mutmut_version(cfg),
+        cfg.python_hash_seed or "",
+        f"timeout {cfg.mutmut_timeout_seconds!r} {cfg.mutant_timeout_multiplier!r} {cfg.mutant_timeout_constant!r}",
+        f"shards {cfg.mutant_shards}",
+        f"sample {cfg.mutant_sample_fraction} {cfg.mutant_sample_max} {cfg.sample_seed}" if fixed_sampling(cfg) else "",
+        "skip-equivalent" if cfg.skip_equivalent else "",
+        suite_content_hash(td),
+    ):
+        h.update(part.encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+def _outcome_cache_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.json"
+
+def load_cached_outcomes(cache_dir: Path, key: str) -> Optional[List[MutantOutcome]]:
+    path = _outcome_cache_path(cache_dir, key)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return [MutantOutcome(int(o["id"]), int(o["line_number"]), int(o["index"]), str(o["status"]), None)
+                for o in data["outcomes"]]
+    except Exception as e:
+        warn(f"Ignoring unreadable outcome cache entry {path.name}: {e!r}")
+        return None
+
+def store_cached_outcomes(cache_dir: Path, key: str, outcomes: List[MutantOutcome]) -> None:
+    path = _outcome_cache_path(cache_dir, key)
+    data = {"outcomes": [{"id": o.id, "line_number": o.line_number, "index": o.index, "status": o.status} for o in outcomes]}
+    try:
+        _atomic_write(path, json.dumps(data))
+    except Exception as e:
+        warn(f"Could not write outcome cache entry {path.name}: {e!r}")
+
+def _outcome_mismatches(cached: List[MutantOutcome], fresh: List[MutantOutcome]) -> int:
+    a = {(o.line_number, o.index): o.status for o in cached}
+    b = {(o.line_number, o.index): o.status for o in fresh}
+    return sum(1 for k in a.keys() | b.keys() if a.get(k) != b.get(k))
+
+# ---------------------------
+# Progress and ETA
+# ---------------------------
+
+class SweepProgress:
+    """
+    Mutants done across the pool. Running suites report (done, total) under a label;
+    a finished job adds its real mutant count. The ETA divides the mutants still
+    expected (existing catalogue counts, the count a finished job with the same
+    content reported, else the mean of those and of the running suites' totals)
+    by the sweep's rate so far.
+    """
+
+    def __init__(self, jobs: List[Tuple[str, Optional[int]]], interval: float):
+        self._keys = [k for k, _ in jobs]
+        self._expected = [n for _, n in jobs]
+        self._known: Dict[str, int] = {}
+        self._finished: Set[int] = set()
+        self._running: Dict[str, Tuple[int, int]] = {}
+        self._completed = 0
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._stop = threading.Event()
+        self._last = ""
+        self._interval = interval
+        self._thread = threading.Thread(target=self._report_loop, name="sweep-progress", daemon=True)
+        if interval > 0:
+            self._thread.start()
+
+    def report(self, label: str, done: int, total: int) -> None:
+        with self._lock:
+            self._running[label] = (done, total)
+
+    def finish(self, job: int, rel_dir: str, mutants: int) -> None:
+        """Job done with `mutants` mutants counted; drops the labels of its (shard) runs."""
+        with self._lock:
+            for label in [l for l in self._running if l == rel_dir or l.startswith(rel_dir + " [")]:
+                del self._running[label]
+            self._finished.add(job)
+            self._completed += mutants
+            if mutants:
+                self._known[self._keys[job]] = mutants
+
+    def line(self) -> str:
+        with self._lock:
+            elapsed = max(time.time() - self._started, 1e-6)
+            in_flight = sum(d for d, _ in self._running.values())
+            done = self._completed + in_flight
+            known = [n for n in self._known.values()] + [n for n in self._expected if n] + [t for _, t in self._running.values() if t]
+            fallback = sum(known) / len(known) if known else 0.0
+            expected_left = sum(self._known.get(k) or n or fallback
+                                for j, (k, n) in enumerate(zip(self._keys, self._expected)) if j not in self._finished)
+            left = max(expected_left - in_flight, 0.0)
+            total = done + left
+            rate = done / elapsed
+            eta = "?"
+            if rate > 0:
+                secs = int(left / rate)
+                eta = f"{secs // 3600}:{secs % 3600 // 60:02d}:{secs % 60:02d}"
+            running = ", ".join(f"{label} {d}/{t}" for label, (d, t) in sorted(self._running.items())[:4])
+            more = f" +{len(self._running) - 4}" if len(self._running) > 4 else ""
+        pct = 100.0 * done / total if total else 0.0
+        return (f"[progress] {len(self._finished)}/{len(self._keys)} job(s), {done}/{total:.0f} mutants ({pct:.0f}%), "
+                f"{rate:.2f} mutants/s, ETA {eta}" + (f" | {running}{more}" if running else ""))
+
+    def _report_loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            text = self.line()
+            if text != self._last:
+                log(text)
+                self._last = text
+
+    def close(self) -> None:
+        self._stop.set()
+
+def report_progress(label: str, done: int, total: int) -> None:
+    if _progress is not None:
+        _progress.report(label, done, total)
+
+def expected_mutants(cfg: Config, td: TestDir) -> Optional[int]:
+    """Mutant count of td's target from its catalogue entry (after --mutant-sample-fraction/-max), or None
+    when there is no entry yet; never generates one."""
+    try:
+        specs = select_mutants(cfg, td, generate=False)
+    except Exception:
+        return None
+    return len(specs) if specs else None
+
+# ---------------------------
+# Resource-aware admission (--jobs auto)
+# ---------------------------
+
+def usable_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+def available_memory_mb() -> Optional[float]:
+    """MemAvailable on Linux, ullAvailPhys on Windows; None elsewhere."""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    if os.name == "nt":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+        stat = MEMORYSTATUSEX()
+        stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+            return stat.ullAvailPhys / (1024.0 * 1024.0)
+    return None
+
+def auto_job_count(job_memory_mb: float) -> Tuple[int, Optional[float]]:
+    """Pool size for --jobs auto: one per usable core, fewer if memory is short. Returns (jobs, available MB)."""
+    cores = usable_cores()
+    avail = available_memory_mb()
+    jobs = cores if avail is None else min(cores, int(avail // job_memory_mb))
+    return max(1, jobs), avail
+
+def children_rss_mb(root_pids: List[int]) -> Optional[float]:
+    """Total RSS of the given processes and all their descendants (Linux /proc only)."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text(encoding="ascii", errors="replace")
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry.name))
+    total_kb = 0
+    stack = list(root_pids)
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, ()))
+        try:
+            for line in (proc / str(pid) / "status").read_text(encoding="ascii", errors="replace").splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024.0
+
+class AdmissionGate:
+    """
+    Admits a suite only while fewer than `limit` run, the load average per core is
+    under max_load and the children's RSS is under max_rss_mb. A suite that hits
+    the whole-suite timeout halves the limit (contention makes everything slower);
+    each suite that finishes in time raises it again by 1/limit, up to the pool size.
+    """
+
+    def __init__(self, cfg: Config) -> None:
+        self.cfg = cfg
+        self.capacity = cfg.jobs
+        self.limit = float(cfg.jobs)
+        self.active = 0
+        self.cores = usable_cores()
+        self._cond = threading.Condition()
+
+    def _pressure(self) -> Optional[str]:
+        if hasattr(os, "getloadavg"):
+            load = os.getloadavg()[0] / self.cores
+            if load > self.cfg.max_load:
+                return f"load {load:.2f}/core"
+        if self.cfg.max_rss_mb is not None:
+            with _active_procs_lock:
+                pids = list(_active_procs.keys())
+            rss = children_rss_mb(pids) if pids else 0.0
+            if rss is not None and rss > self.cfg.max_rss_mb:
+                return f"child RSS {rss:.0f} MB"
+        return None
+
+    def acquire(self) -> None:
+        announced = False
+        with self._cond:
+            while True:
+                if self.active == 0:
+                    break  # never starve: something must always be able to run
+                if self.active < int(self.limit):
+                    reason = self._pressure()
+                    if reason is None:
+                        break
+                    if not announced:
+                        log(f"Admission paused ({reason}; {self.active} suite(s) running)")
+                        announced = True
+                self._cond.wait(timeout=ADMISSION_POLL_SECONDS)
+            self.active += 1
+
+    def release(self, timed_out: bool) -> None:
+        with self._cond:
+            self.active -= 1
+            if timed_out:
+                new = max(1.0, self.limit / 2.0)
+                if int(new) < int(self.limit):
+                    warn(f"Suite timeout under load; lowering concurrency to {int(new)}")
+                self.limit = new
+            else:
+                self.limit = min(float(self.capacity), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+# ---------------------------
+# Scheduling (longest job first)
+# ---------------------------
+
+def run_duration_key(cfg: Config, td: TestDir) -> str:
+    return f"{suite_content_hash(td)}:{cfg.engine}"
+
+def load_run_durations(cfg: Config) -> Dict[str, float]:
+    path = cfg.catalogue_dir / RUN_DURATIONS_FILE
+    if not path.exists():
+        return {}
+    try:
+        return {str(k): float(v) for k, v in json.loads(path.read_text(encoding="utf-8")).items()}
+    except Exception as e:
+        warn(f"Ignoring unreadable run durations {path}: {e!r}")
+        return {}
+
+def save_run_durations(cfg: Config, durations: Dict[str, float]) -> None:
+    path = cfg.catalogue_dir / RUN_DURATIONS_FILE
+    try:
+        _atomic_write(path, json.dumps(durations, sort_keys=True))
+    except Exception as e:
+        warn(f"Could not write run durations {path}: {e!r}")
+
+def list_test_ids(test_file: Path) -> List[str]:
+    """Node ids ('test_final.py::test_x', 'test_final.py::TestC::test_y') of the test functions pytest
+    would collect, in file order: test_* at module level or in Test* classes."""
+    try:
+        tree = ast.parse(test_file.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+    ids = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            ids.append(f"{test_file.name}::{node.name}")
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            ids.extend(f"{test_file.name}::{node.name}::{f.name}" for f in node.body
+                       if isinstance(f, (ast.FunctionDef, ast.AsyncFunctionDef)) and f.name.startswith("test"))
+    return list(dict.fromkeys(ids))  # a redefined name is collected once
+
+def count_tests(test_file: Path) -> int:
+    return len(list_test_ids(test_file))
+
+def count_code_lines(path: Path) -> int:
+    """Lines that are neither blank nor comments; 0 if path cannot be read."""
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return 0
+    return sum(1 for line in lines if line.strip() and not line.lstrip().startswith("#"))
+
+def suite_features(cfg: Config, td: TestDir) -> List[float]:
+    """[1, file_size_bytes / 1000, mutants, mutants * tests] for the cost model. Planning never generates
+    mutants: without a catalogue entry, mutants is estimated from the target's code lines."""
+    try:
+        specs = select_mutants(cfg, td, generate=False)
+    except Exception:
+        specs = None
+    if specs is not None:
+        mutants = len(specs)
+    else:
+        mutants = round(MUTANTS_PER_CODE_LINE * count_code_lines(td.test_dir / td.mutate_target))
+    tests = count_tests(td.test_file)
+    return [1.0, td.test_file.stat().st_size / 1000.0, float(mutants), float(mutants * max(tests, 1))]
+
+def _solve_least_squares(xs: List[List[float]], ys: List[float], ridge: float = 1e-6) -> Optional[List[float]]:
+    """Normal equations with a small ridge term, solved by Gaussian elimination."""
+    k = len(xs[0])
+    a = [[sum(x[i] * x[j] for x in xs) + (ridge if i == j else 0.0) for j in range(k)] + [sum(x[i] * y for x, y in zip(xs, ys))]
+         for i in range(k)]
+    for col in range(k):
+        pivot = max(range(col, k), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            return None
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(k):
+            if r != col:
+                f = a[r][col] / a[col][col]
+                a[r] = [v - f * w for v, w in zip(a[r], a[col])]
+    return [a[i][k] / a[i][i] for i in range(k)]
+
+def predict_costs(cfg: Config, groups: List[List[TestDir]], durations: Dict[str, float]) -> List[float]:
+    """
+    Seconds per group: the recorded duration when there is one, otherwise a linear
+    model over suite_features fitted to the recorded suites (a per-test-run rate
+    when there are too few of them to fit).
+    """
+    keys = [run_duration_key(cfg, g[0]) for g in groups]
+    feats = [suite_features(cfg, g[0]) for g in groups]
+    known = [(f, durations[k]) for f, k in zip(feats, keys) if k in durations]
+    coef = None
+    if len(known) >= MIN_SAMPLES_FOR_FIT:
+        coef = _solve_least_squares([f for f, _ in known], [y for _, y in known])
+    rate = DEFAULT_SECONDS_PER_TEST_RUN
+    if known and coef is None:
+        runs = sum(f[3] for f, _ in known)
+        if runs > 0:
+            rate = sum(y for _, y in known) / runs
+    costs = []
+    for f, k in zip(feats, keys):
+        if k in durations:
+            costs.append(durations[k])
+        elif coef is not None:
+            costs.append(max(sum(c * x for c, x in zip(coef, f)), 0.1))
+        else:
+            costs.append(max(rate * f[3], 0.1))
+    return costs
+
+def simulate_makespan(costs: List[float], workers: int) -> float:
+    """Makespan of greedy list scheduling of costs (in the given order) on `workers` slots."""
+    slots = [0.0] * max(workers, 1)
+    for c in costs:
+        i = slots.index(min(slots))
+        slots[i] += c
+    return max(slots)
+
+def schedule_longest_first(cfg: Config, groups: List[List[TestDir]], durations: Dict[str, float]) -> Tuple[List[List[TestDir]], Dict[int, float]]:
+    """Order groups by predicted cost, longest first; returns the order and {position: predicted seconds}."""
+    costs = predict_costs(cfg, groups, durations)
+    order = sorted(range(len(groups)), key=lambda i: -costs[i])  # stable: ties keep discovery order
+    ordered_costs = [costs[i] for i in order]
+    if cfg.coordinator is not None:  # the workers' slots are unknown until they join
+        log(f"Longest-first schedule: {sum(costs):.1f}s of predicted work in {len(costs)} group(s)")
+    else:
+        log(f"Longest-first schedule: predicted makespan {simulate_makespan(ordered_costs, cfg.jobs):.1f}s on {cfg.jobs} worker(s) "
+            f"(discovery order: {simulate_makespan(costs, cfg.jobs):.1f}s)")
+    return [groups[i] for i in order], dict(enumerate(ordered_costs))
+
 # ---------------------------
 # Per-directory processing
 # ---------------------------
 
-def process_one(cfg: Config, td: TestDir, idx: int, totalN: int, pytest_exe: str, mutmut_exe: str, raw_status_map: Dict[str, str]) -> Row:
-    rel_test = as_posix_relative(td.test_file, cfg.repo_root)
-    log(f"Running mutmut for {as_posix_relative(td.test_dir, cfg.repo_root)} (target {td.mutate_target}) with timeout {cfg.mutmut_timeout_seconds}s...")
-    tc_id, api, temp, rep = derive_metadata(cfg, td, rel_test)
-    duration = parse_duration_seconds(td)
-    file_size = td.test_file.stat().st_size
+def run_coverage_gated(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str],
+                       history: Optional["KillHistory"] = None) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+    """
+    Coverage-gated run: only mutants on executed lines are tested, optionally against
+    only the tests that execute them. The mutmut engine runs them in a scratch clone
+    whose mutmut_config skips the rest and narrows test_command per mutant.
+    """
+    mutants = select_mutants(cfg, td)
+    if mutants is None:
+        return True, 1, []
+    completed, cov = load_coverage_map(cfg, td, python_exe)
+    if not completed:
+        return False, None, []
+    if cov is None:
+        return True, 1, []
+    to_run, outcomes, tests_for = plan_by_coverage(cfg, td, mutants, cov, raw_status_map)
+    rel_dir = as_posix_relative(td.test_dir, cfg.repo_root)
+    log(f"Coverage gate for {rel_dir}: {len(outcomes)}/{len(mutants)} mutants on unexecuted lines")
+    if cfg.select_tests and to_run:
+        n_tests = len(cov.test_lines)
+        selected = sum(len(tests_for.get(m.id, ())) or n_tests for m in to_run)
+        log(f"Test selection for {rel_dir}: {selected}/{n_tests * len(to_run)} test runs")
+    if cfg.mutant_shards > 1 or cfg.engine == "mutmut":
+        completed, exit_code, ran = run_sharded(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map, to_run, tests_for, history)
+    else:
+        completed, exit_code, ran = run_in_process(cfg, td, python_exe, raw_status_map, to_run, None, tests_for, history) if to_run else (True, 0, [])
+    return completed, exit_code, sorted(outcomes + ran, key=lambda o: o.id)
+
+def run_sampled(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str],
+                history: Optional["KillHistory"] = None) -> Tuple[bool, Optional[int], List[MutantOutcome]]:
+    """
+    Sequential sampling (--sample-epsilon): test the mutants in a seeded random order and stop
+    once the score's interval is within +-epsilon. The warm and fork engines check after every
+    mutant; mutmut and sharded runs after every batch of SAMPLE_BATCH_MUTANTS, each batch one
+    run_sharded call whose clone skips the other mutants.
+    """
+    mutants = select_mutants(cfg, td)
+    if mutants is None:
+        return True, 1, []
+    order = list(mutants)
+    random.Random(f"{cfg.sample_seed}:{target_hash(td)}").shuffle(order)
+
+    def tight(outcomes: List[MutantOutcome]) -> bool:
+        counts = tally_outcomes(outcomes, raw_status_map)
+        total = sum(counts[k] for k in MUTANT_BUCKETS)
+        if total < SAMPLE_MIN_MUTANTS:
+            return False
+        low, high = score_interval(counts["killed"], total, cfg.sample_ci, cfg.sample_confidence)
+        return (high - low) / 2 <= cfg.sample_epsilon
+
+    if cfg.engine != "mutmut" and cfg.mutant_shards == 1:
+        completed, exit_code, outcomes = run_in_process(cfg, td, python_exe, raw_status_map, order, None, None, history, tight)
+    else:
+        completed, exit_code, outcomes = True, 0, []
+        for start in range(0, len(order), SAMPLE_BATCH_MUTANTS):
+            completed, exit_code, ran = run_sharded(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map,
+                                                    order[start:start + SAMPLE_BATCH_MUTANTS], None, history)
+            if not completed or exit_code is None or exit_code & 1:
+                return completed, exit_code, []
+            outcomes += ran
+            if tight(outcomes):
+                break
+    if completed and exit_code == 0 and len(outcomes) < len(order):
+        log(f"Sampling stopped {as_posix_relative(td.test_dir, cfg.repo_root)} after {len(outcomes)}/{len(order)} mutants")
+    return completed, exit_code, sorted(outcomes, key=lambda o: o.id)
 
-    completed, exit_code = run_mutmut(cfg, td, pytest_exe, mutmut_exe)
+def run_engine(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str]) -> Tuple[bool, Optional[int], Optional[List[MutantOutcome]]]:
+    """
+    Run all mutants of td with the configured engine. outcomes is None only when
+    the mutmut engine's cache could not be read per mutant (counts then fall back
+    to compute_counts_from_cache). With --skip-equivalent the equivalent mutants
+    are not run; they are added to the outcomes with EQUIVALENT_STATUS.
+    """
+    completed, exit_code, outcomes = _run_selected(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map)
+    if cfg.skip_equivalent and completed and exit_code is not None and not exit_code & 1 and outcomes is not None:
+        equivalent = select_mutants(cfg, td, equivalent=True) or []
+        if equivalent:
+            log(f"{len(equivalent)} mutant(s) of {as_posix_relative(td.test_dir, cfg.repo_root)} compile to the original code; not run")
+            outcomes = sorted(outcomes + [MutantOutcome(m.id, m.line_number, m.index, EQUIVALENT_STATUS, None) for m in equivalent],
+                              key=lambda o: o.id)
+    return completed, exit_code, outcomes
+
+def _run_selected(cfg: Config, td: TestDir, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str]) -> Tuple[bool, Optional[int], Optional[List[MutantOutcome]]]:
+    """run_engine for the mutants select_mutants picks."""
+    history = KillHistory.load(cfg, td) if cfg.kill_order else None
+    try:
+        if cfg.sample_epsilon is not None:
+            return run_sampled(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map, history)
+        if cfg.coverage_gate or cfg.select_tests:
+            return run_coverage_gated(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map, history)
+        if cfg.mutant_shards > 1 or (narrows_mutants(cfg) and cfg.engine == "mutmut"):
+            # a plain 'mutmut run' tests every mutant; a shard clone skips those not selected
+            return run_sharded(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map, None, None, history)
+        if cfg.engine in ("warm", "fork"):
+            return run_in_process(cfg, td, python_exe, raw_status_map, None, None, None, history)
+    finally:
+        if history is not None and cfg.engine != "mutmut":  # mutmut does not say which test killed a mutant
+            history.save()
+    # --workspace: run in a private clone, so neither the per-dir lock nor the corpus disk is in the hot loop
+    work = clone_suite(td, cfg.workspace_dir, link=True) if cfg.workspace_dir is not None else td
+    try:
+        # the lock spans run and read: another replication of td would otherwise replace the cache in between
+        with get_per_dir_lock(work.test_dir):
+            completed, exit_code = run_mutmut(cfg, work, pytest_exe, mutmut_exe, mutmut_log_path(cfg, td),
+                                              as_posix_relative(td.test_dir, cfg.repo_root),
+                                              kill_ordered_tests(history, td.test_file) if history else None)
+            outcomes = None
+            if completed and exit_code is not None and not exit_code & 1:
+                rows = read_mutant_rows_from_cache(work.test_dir)
+                if rows is not None:
+                    outcomes = [MutantOutcome(i, line, index, status, None) for i, (line, index, status) in enumerate(rows, start=1)]
+        if work is not td:
+            copy_back_cache(work, td)
+    finally:
+        if work is not td:
+            shutil.rmtree(work.test_dir, ignore_errors=True)
+    return completed, exit_code, outcomes
+
+@traced("suite", lambda cfg, td, *a: {"dir": as_posix_relative(td.test_dir, cfg.repo_root), "engine": cfg.engine})
+def evaluate_suite(cfg: Config, td: TestDir, idx: int, totalN: int, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str]) -> SuiteResult:
+    rel_test = as_posix_relative(td.test_file, cfg.repo_root)
+    log(f"Running mutmut for {as_posix_relative(td.test_dir, cfg.repo_root)} (target {td.mutate_target}, engine {cfg.engine}) with timeout {cfg.mutmut_timeout_seconds}s...")
+
+    seconds: Optional[float] = None
+    usage: Optional[RunUsage] = None
+    cache_key = outcome_cache_key(cfg, td, pytest_exe) if cfg.outcome_cache_dir is not None else None
+    cached = load_cached_outcomes(cfg.outcome_cache_dir, cache_key) if cache_key else None
+    if cached is not None and (cfg.sample_epsilon is not None or random.random() >= cfg.verify_fraction):
+        log(f"Outcome cache hit for {rel_test} ({cache_key[:12]})")
+        completed, exit_code, outcomes = True, 0, cached
+    else:
+        usage = RunUsage()
+        token = _usage_var.set(usage)
+        started = time.perf_counter()
+        try:
+            completed, exit_code, outcomes = run_engine(cfg, td, pytest_exe, mutmut_exe, python_exe, raw_status_map)
+        finally:
+            seconds = time.perf_counter() - started
+            _usage_var.reset(token)
+        # a sample is not the suite's outcome set, so it is neither cached nor compared with the cache
+        if cache_key and completed and exit_code is not None and not exit_code & 1 and outcomes is not None and cfg.sample_epsilon is None:
+            if cached is not None:
+                mismatches = _outcome_mismatches(cached, outcomes)
+                if mismatches:
+                    warn(f"Verification of cached outcomes for {rel_test}: {mismatches} mutant(s) differ; cache entry replaced")
+                else:
+                    log(f"Verified cached outcomes for {rel_test}")
+            store_cached_outcomes(cfg.outcome_cache_dir, cache_key, outcomes)
 
     killed = 0
     total_count = 0
+    equivalent = 0
     score = 0.0
     status = "ok"
 
@@ -528,25 +3087,82 @@ def process_one(cfg: Config, td: TestDir, idx: int, totalN: int, pytest_exe: str
         is_fatal = bool(exit_code & 1) if exit_code is not None else True
         if is_fatal:
             status = "failed"
-            err(f"mutmut run reported fatal error (exit {exit_code}) in {as_posix_relative(td.test_dir, cfg.repo_root)}; counts set to zero, status=failed")
+            err(f"{cfg.engine} engine reported fatal error (exit {exit_code}) in {as_posix_relative(td.test_dir, cfg.repo_root)}; counts set to zero, status=failed")
         else:
-            ok, counts = compute_counts_from_cache(td, raw_status_map)
+            if outcomes is None:
+                ok, counts = compute_counts_from_cache(td, raw_status_map)
+            else:
+                ok, counts = True, tally_outcomes(outcomes, raw_status_map)
             if not ok:
                 status = "error"
                 err(f"Cache read error in {as_posix_relative(td.test_dir, cfg.repo_root)}; counts set to zero, status=error")
             else:
                 killed = counts.get("killed", 0)
-                total_count = sum(counts.get(k, 0) for k in ("killed", "timeout", "suspicious", "survived", "skipped"))
-                score = compute_score(killed, total_count)
+                total_count = sum(counts.get(k, 0) for k in MUTANT_BUCKETS)
+                equivalent = counts.get(EQUIVALENT_STATUS, 0)
+                score = compute_score(killed, total_count, equivalent, cfg.equivalent_in_score)
+                if cfg.equivalent_in_score:
+                    total_count += equivalent
                 status = "ok"
 
+    tested: Optional[int] = None
+    interval: Optional[Tuple[float, float]] = None
+    if (cfg.sample_epsilon is not None or fixed_sampling(cfg)) and status == "ok" and outcomes is not None:
+        tested = len(outcomes)
+        population = len(load_mutants(cfg, td) or []) or None
+        if population is not None and tested >= population:
+            interval = (score, score)  # every mutant tested (or a cached full result): the score is exact
+        else:
+            interval = score_interval(killed, total_count, cfg.sample_ci, cfg.sample_confidence)
+        log(f"[{idx}/{totalN}] {rel_test}: {tested} mutant(s) tested, score {score} in [{interval[0]:.3f}, {interval[1]:.3f}]")
+
     log(f"[{idx}/{totalN}] {rel_test}: killed={killed} all={total_count} score={score} status={status}")
-    return Row(tc_id, api, temp, rep, duration, file_size, killed, total_count, score, rel_test, status)
+    return SuiteResult(killed, total_count, score, status, seconds, usage, outcomes if status == "ok" else None, tested, interval,
+                       equivalent if cfg.skip_equivalent and status == "ok" else None)
+
+def make_row(cfg: Config, td: TestDir, result: SuiteResult, ran: bool = True) -> Row:
+    """Row for one directory: its own metadata, duration and file size, shared counts;
+    the run's cost only when the suite was run for this directory (ran)."""
+    rel_test = as_posix_relative(td.test_file, cfg.repo_root)
+    tc_id, api, temp, rep = derive_metadata(cfg, td, rel_test)
+    duration = parse_duration_seconds(td)
+    file_size = td.test_file.stat().st_size if td.test_file.exists() else 0
+    row = Row(tc_id, api, temp, rep, duration, file_size, result.killed, result.total, result.score, rel_test, result.status)
+    if ran and result.seconds is not None:
+        row.wall_seconds = result.seconds
+        if result.usage is not None and result.usage.measured:
+            row.cpu_user_seconds = result.usage.user_seconds
+            row.cpu_system_seconds = result.usage.system_seconds
+            row.peak_rss_mb = result.usage.peak_rss_mb
+    if result.interval is not None:
+        row.mutants_tested = result.tested
+        row.score_estimate = result.score
+        row.score_ci_low, row.score_ci_high = result.interval
+    row.equivalent = result.equivalent
+    return row
+
+def process_group(cfg: Config, group: List[TestDir], idx: int, totalN: int, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str]) -> Tuple[List[Row], SuiteResult]:
+    rep_td = group[0]
+    result = evaluate_suite(cfg, rep_td, idx, totalN, pytest_exe, mutmut_exe, python_exe, raw_status_map)
+    if len(group) > 1:
+        log(f"[{idx}/{totalN}] Result of {as_posix_relative(rep_td.test_dir, cfg.repo_root)} reused for {len(group) - 1} identical suite(s)")
+    return [make_row(cfg, td, result, i == 0) for i, td in enumerate(group)], result
+
+def run_group(cfg: Config, group: List[TestDir], idx: int, totalN: int, pytest_exe: str, mutmut_exe: str, python_exe: str, raw_status_map: Dict[str, str]) -> Tuple[List[Row], SuiteResult]:
+    """process_group that turns an unhandled exception into 'error' rows."""
+    try:
+        return process_group(cfg, group, idx, totalN, pytest_exe, mutmut_exe, python_exe, raw_status_map)
+    except Exception as e:
+        err(f"Unhandled exception in {as_posix_relative(group[0].test_dir, cfg.repo_root)}: {e!r}")
+        result = SuiteResult(0, 0, 0.0, "error")
+        return [make_row(cfg, td, result) for td in group], result
+
 
 # ---------------------------
 # CSV output
 # ---------------------------
 
+@traced("write_csv", lambda cfg, rows: {"path": str(cfg.output_path), "rows": len(rows)})
 def write_csv(cfg: Config, rows: List[Row]) -> None:
     """Sort rows to match dataset expectations before writing the CSV."""
 
@@ -579,6 +3195,9 @@ def write_csv(cfg: Config, rows: List[Row]) -> None:
     with cfg.output_path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(CSV_HEADER)
+        def _opt(value: Optional[float], fmt: str) -> str:
+            return "" if value is None else (fmt % value)
+
         for r in rows_sorted:
             duration_str = "" if r.duration is None else ("%.12g" % r.duration)
             w.writerow([
@@ -590,6 +3209,15 @@ def write_csv(cfg: Config, rows: List[Row]) -> None:
                 ("%.6f" % r.score) if r.total > 0 else "0.0",
                 r.actual_test_path,
                 r.status,
+                _opt(r.wall_seconds, "%.3f"),
+                _opt(r.cpu_user_seconds, "%.3f"),
+                _opt(r.cpu_system_seconds, "%.3f"),
+                _opt(r.peak_rss_mb, "%.1f"),
+                "" if r.mutants_tested is None else r.mutants_tested,
+                _opt(r.score_estimate, "%.6f"),
+                _opt(r.score_ci_low, "%.6f"),
+                _opt(r.score_ci_high, "%.6f"),
+                "" if r.equivalent is None else r.equivalent,
             ])
     # Report summary including failed counts
     ok_count = sum(1 for r in rows_sorted if r.status == "ok")
@@ -604,82 +3232,691 @@ def discover_validate(cfg: Config) -> List[TestDir]:
     tds = find_test_dirs(cfg)
     if not tds:
         warn("No qualifying test directories found (need test_final.py and a mutate target). Writing empty CSV with header only.")
+    restore_leftover_backups(tds)
     return tds
 
-def resolve_tools(cfg: Config) -> Tuple[str, str]:
-    pytest_exe = resolve_executable(cfg.repo_root, cfg.venv_path, "pytest.exe", "pytest")
-    mutmut_exe = resolve_executable(cfg.repo_root, cfg.venv_path, "mutmut.exe", "mutmut")
-    return pytest_exe, mutmut_exe
+def resolve_tools(cfg: Config) -> Tuple[str, str, str]:
+    pytest_exe = resolve_executable(cfg.repo_root, cfg.venv_path, "pytest", "pytest")
+    mutmut_exe = resolve_executable(cfg.repo_root, cfg.venv_path, "mutmut", "mutmut")
+    python_exe = resolve_executable(cfg.repo_root, cfg.venv_path, "python", sys.executable)
+    return pytest_exe, mutmut_exe, python_exe
 
 def cleanup_all_processes() -> None:
+    _interrupted.set()
     with _active_procs_lock:
         procs = list(_active_procs.values())
     for p in procs:
-        try: os.kill(p.pid, signal.CTRL_BREAK_EVENT)
-        except Exception: pass
+        _interrupt_group(p.pid)
     time.sleep(1.0)
     for p in procs:
-        try: subprocess.run(["taskkill", "/F", "/T", "/PID", str(p.pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except Exception: pass
-    for p in procs:
+        _kill_group(p, wait_seconds=3)
+    restore_inplace_targets()
+
+def abort_pool(ex: ThreadPoolExecutor) -> None:
+    """Ctrl-C: drop the queued jobs and kill the running ones without waiting for the pool to drain."""
+    _interrupted.set()
+    ex.shutdown(wait=False, cancel_futures=True)
+    err("KeyboardInterrupt received; terminating all active processes...")
+    cleanup_all_processes()
+
+# ---------------------------
+# Results journal (--resume)
+# ---------------------------
+
+class ResultsJournal:
+    """Append-only JSON-lines file of finished rows. The first line records the run settings;
+    every append is flushed and fsynced, so a crash loses at most the suites still running."""
+
+    def __init__(self, path: Path, settings: Dict[str, object], resume: bool):
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not resume or not path.exists() or path.stat().st_size == 0
+        self._f = path.open("w" if fresh else "a", encoding="utf-8")
+        if fresh:
+            self._write([{"journal": JOURNAL_VERSION, "settings": settings}])
+
+    def _write(self, records: List[dict]) -> None:
+        self._f.write("".join(json.dumps(r, sort_keys=True) + "\n" for r in records))
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def append(self, rows: List[Row]) -> None:
+        if _interrupted.is_set():
+            return  # rows of suites cut short by Ctrl-C are not results
+        with self._lock:
+            if not self._f.closed:
+                self._write([asdict(r) for r in rows])
+
+    def close(self) -> None:
+        with self._lock:
+            self._f.close()
+
+def read_journal(path: Path, settings: Dict[str, object]) -> List[Row]:
+    """Rows recorded by an earlier run with the same settings, last row per directory.
+    Raises ValueError when the journal was written with other settings."""
+    if not path.exists():
+        return []
+    latest: Dict[str, Row] = {}
+    with path.open("r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    for n, line in enumerate(lines):
+        if not line.strip():
+            continue
         try:
-            if p.poll() is None:
-                p.kill()
-        except Exception:
-            pass
-        try: p.wait(timeout=3)
-        except Exception: pass
+            rec = json.loads(line)
+        except ValueError:
+            warn(f"Ignoring torn line {n + 1} of {path}")
+            continue
+        if "journal" in rec:
+            if rec.get("journal") != JOURNAL_VERSION or rec.get("settings") != settings:
+                raise ValueError(f"{path} was written with different settings: {rec.get('settings')!r}")
+            continue
+        row = Row(**rec)
+        latest[row.actual_test_path] = row
+    return list(latest.values())
+
+def open_journal(cfg: Config) -> Tuple[ResultsJournal, List[Row]]:
+    """Journal for this run plus, with --resume, the rows it already holds ('error' rows are re-run)."""
+    settings = run_settings(cfg)
+    done = [r for r in read_journal(cfg.journal_path, settings) if r.status != "error"] if cfg.resume else []
+    if cfg.resume:
+        log(f"Resuming from {cfg.journal_path}: {len(done)} row(s) already done")
+    return ResultsJournal(cfg.journal_path, settings, cfg.resume), done
+
+@dataclass
+class Replication:
+    cfg: Config  # with this replication's output_path and journal_path
+    journal: ResultsJournal
+    rows: List[Row]  # resumed from the journal, then appended as jobs finish
+
+def replication_config(cfg: Config, r: int) -> Config:
+    """The config replication r (0-based) runs its suites with. Only the first may use the outcome
+    cache: later ones would otherwise replay its outcomes instead of measuring again."""
+    return cfg if r == 0 or cfg.outcome_cache_dir is None else replace(cfg, outcome_cache_dir=None)
+
+def open_replications(cfg: Config) -> List[Replication]:
+    """One journal per replication; raises ValueError like read_journal."""
+    reps: List[Replication] = []
+    try:
+        for i in range(1, cfg.replications + 1):
+            rcfg = cfg
+            if cfg.replications > 1:
+                rcfg = replace(cfg, output_path=Path(str(cfg.output_path).replace("{i}", str(i))),
+                               journal_path=Path(str(cfg.journal_path).replace("{i}", str(i))))
+            journal, rows = open_journal(rcfg)
+            reps.append(Replication(rcfg, journal, rows))
+    except ValueError:
+        for r in reps:
+            r.journal.close()
+        raise
+    return reps
+
+# ---------------------------
+# Mutant warehouse (--warehouse-path)
+# ---------------------------
+
+WAREHOUSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS suite_run (
+    id INTEGER PRIMARY KEY,
+    sweep TEXT NOT NULL,             -- start time and host:pid of the sweep that wrote the row
+    replication INTEGER NOT NULL,    -- 1-based, see --replications
+    actual_test_path TEXT NOT NULL,
+    put TEXT, api_mode TEXT, temperature TEXT, repetition_id TEXT,
+    target TEXT NOT NULL,
+    target_hash TEXT NOT NULL,       -- sha256 prefix of the mutate target's source
+    engine TEXT NOT NULL,
+    status TEXT NOT NULL,            -- same values as the CSV's status column
+    killed_mutations INTEGER NOT NULL,
+    all_mutations INTEGER NOT NULL,
+    score REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    UNIQUE (sweep, replication, actual_test_path)
+);
+CREATE TABLE IF NOT EXISTS mutant_result (
+    suite_run_id INTEGER NOT NULL REFERENCES suite_run (id) ON DELETE CASCADE,
+    mutant_id INTEGER NOT NULL,      -- 1-based, in mutmut's enumeration order
+    line_number INTEGER NOT NULL,
+    mutation_index INTEGER NOT NULL,
+    mutant_hash TEXT,                -- catalogue hash of the mutated source; NULL when unknown
+    raw_status TEXT NOT NULL,        -- mutmut's status, e.g. 'ok_killed'
+    status TEXT NOT NULL,            -- bucket: killed, timeout, suspicious, survived, skipped, untested
+    seconds REAL,
+    PRIMARY KEY (suite_run_id, mutant_id)
+);
+CREATE INDEX IF NOT EXISTS suite_run_config ON suite_run (put, api_mode, temperature);
+CREATE INDEX IF NOT EXISTS suite_run_target ON suite_run (target_hash);
+CREATE INDEX IF NOT EXISTS mutant_result_hash ON mutant_result (mutant_hash);
+CREATE INDEX IF NOT EXISTS mutant_result_status ON mutant_result (status);
+"""
+
+def target_hash(td: TestDir) -> str:
+    return hashlib.sha256((td.test_dir / td.mutate_target).read_bytes()).hexdigest()[:16]
+
+def warehouse_payload(cfg: Config, td: TestDir, result: SuiteResult, raw_status_map: Dict[str, str]) -> dict:
+    """What the warehouse stores for one suite run besides its rows: the target, its hash and one
+    record per mutant (none unless the result is 'ok'). Built where the suite ran, so it can be
+    sent to a coordinator."""
+    try:
+        digest = target_hash(td)
+    except OSError:
+        digest = ""
+    mutants: List[dict] = []
+    if result.outcomes:
+        specs = load_mutants(cfg, td) or []
+        hashes = {(m.line_number, m.index): m.mutant_hash for m in specs}
+        raw_to_bucket = {raw: bucket for bucket, raw in raw_status_map.items()}
+        mutants = [{"id": o.id, "line_number": o.line_number, "index": o.index,
+                    "mutant_hash": hashes.get((o.line_number, o.index)) or None,
+                    "raw_status": o.status, "status": raw_to_bucket.get(o.status, o.status), "seconds": o.seconds}
+                   for o in result.outcomes]
+    return {"target": td.mutate_target, "target_hash": digest, "mutants": mutants}
+
+class MutantWarehouse:
+    """SQLite store of per-mutant outcomes across suites, replications and sweeps. Every row of a
+    group (dedup fan-out included) gets its own suite_run with the shared mutant records; each
+    suite is written in one transaction under a lock, so the pool's threads share one connection."""
+
+    def __init__(self, path: Path, engine: str):
+        self.path = path
+        self.engine = engine
+        self.sweep = f"{time.strftime('%Y-%m-%dT%H:%M:%S')} {socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._con = sqlite3.connect(str(path), timeout=60.0, check_same_thread=False)
+        self._con.execute("PRAGMA journal_mode = WAL")
+        self._con.execute("PRAGMA foreign_keys = ON")
+        self._con.executescript(WAREHOUSE_SCHEMA)
+        self._suites = 0
+        self._mutants = 0
+
+    def record(self, replication: int, rows: List[Row], payload: dict) -> None:
+        if _interrupted.is_set():
+            return  # like the journal: suites cut short by Ctrl-C are not results
+        mutants = payload.get("mutants") or []
+        now = time.time()
+        with self._lock:
+            try:
+                with self._con:
+                    for row in rows:
+                        self._con.execute("DELETE FROM suite_run WHERE sweep = ? AND replication = ? AND actual_test_path = ?",
+                                          (self.sweep, replication, row.actual_test_path))
+                        cur = self._con.execute(
+                            "INSERT INTO suite_run (sweep, replication, actual_test_path, put, api_mode, temperature, "
+                            "repetition_id, target, target_hash, engine, status, killed_mutations, all_mutations, score, recorded_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (self.sweep, replication, row.actual_test_path, row.tc_id, row.api, row.temp, row.rep,
+                             payload["target"], payload["target_hash"], self.engine, row.status, row.killed, row.total,
+                             row.score, now))
+                        self._con.executemany(
+                            "INSERT INTO mutant_result (suite_run_id, mutant_id, line_number, mutation_index, mutant_hash, "
+                            "raw_status, status, seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            [(cur.lastrowid, m["id"], m["line_number"], m["index"], m["mutant_hash"], m["raw_status"],
+                              m["status"], m["seconds"]) for m in mutants])
+                self._suites += len(rows)
+                self._mutants += len(rows) * len(mutants)
+            except sqlite3.Error as e:
+                warn(f"Warehouse write for {rows[0].actual_test_path if rows else '?'} failed: {e!r}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+        log(f"Warehouse {self.path}: {self._suites} suite run(s), {self._mutants} mutant row(s) written (sweep {self.sweep})")
+
+# ---------------------------
+# Distributed sweep (coordinator / workers)
+# ---------------------------
+
+class SweepManager(BaseManager):
+    pass
+
+def run_settings(cfg: Config) -> Dict[str, object]:
+    """Settings that change a suite's outcome; every worker must match the coordinator's."""
+    settings: Dict[str, object] = {
+        "engine": cfg.engine,
+        "mutmut_timeout_seconds": cfg.mutmut_timeout_seconds,
+        "python_hash_seed": cfg.python_hash_seed,
+        "mutant_shards": cfg.mutant_shards,
+        "coverage_gate": cfg.coverage_gate,
+        "select_tests": cfg.select_tests,
+        "kill_order": cfg.kill_order,
+        "mutant_timeout_multiplier": cfg.mutant_timeout_multiplier,
+        "mutant_timeout_constant": cfg.mutant_timeout_constant,
+    }
+    if cfg.sample_epsilon is not None:  # only then, so exact-mode journals stay resumable
+        settings.update(sample_epsilon=cfg.sample_epsilon, sample_ci=cfg.sample_ci,
+                        sample_confidence=cfg.sample_confidence, sample_seed=cfg.sample_seed)
+    if cfg.skip_equivalent:
+        settings.update(skip_equivalent=True, equivalent_in_score=cfg.equivalent_in_score)
+    if fixed_sampling(cfg):
+        settings.update(mutant_sample_fraction=cfg.mutant_sample_fraction, mutant_sample_max=cfg.mutant_sample_max,
+                        sample_seed=cfg.sample_seed)
+    return settings
+
+class SweepCoordinator:
+    """Job table served to workers. Jobs are pulled, never pushed: a worker asks for the next job
+    when it has a free slot and returns the rows. Jobs held by a worker whose heartbeats stop are
+    re-queued; the first result submitted for a job wins."""
+
+    def __init__(self, jobs: List[Tuple[int, List[Tuple[str, str]]]], settings: Dict[str, object], worker_timeout: float,
+                 on_result: Optional[Callable[[int, List[Row], Optional[dict]], None]] = None, collect_mutants: bool = False):
+        self._jobs = jobs
+        self._on_result = on_result
+        self._collect_mutants = collect_mutants
+        self._settings = settings
+        self._worker_timeout = worker_timeout
+        self._lock = threading.Lock()
+        self._pending = collections.deque(range(len(jobs)))
+        self._assigned: Dict[int, str] = {}
+        self._results: Dict[int, Tuple[List[dict], str, Optional[float]]] = {}
+        self._seen: Dict[str, float] = {}
+        self._stopped: Set[str] = set()
+        self._slots: Dict[str, int] = {}
+        self._delivering = 0  # results recorded but still being passed to on_result
+        self.finished = threading.Event()
+        if not jobs:
+            self.finished.set()
+
+    def settings(self) -> Dict[str, object]:
+        return dict(self._settings)
+
+    def collects_mutants(self) -> bool:
+        """True when workers should submit warehouse payloads with their rows."""
+        return self._collect_mutants
+
+    def join(self, worker_id: str, slots: int) -> None:
+        """Called once by each worker with its --jobs; the makespan estimate is over all joined slots."""
+        with self._lock:
+            self._seen[worker_id] = time.time()
+            self._slots[worker_id] = slots
+
+    def total_slots(self) -> int:
+        with self._lock:
+            return sum(self._slots.values())
+
+    def heartbeat(self, worker_id: str) -> None:
+        with self._lock:
+            self._seen[worker_id] = time.time()
+
+    def next_job(self, worker_id: str) -> tuple:
+        """('job', id, total, replication, [(relative dir, mutate target), ...]), ('wait',) or ('stop',)."""
+        with self._lock:
+            self._seen[worker_id] = time.time()
+            self._requeue_silent()
+            if self._pending:
+                job_id = self._pending.popleft()
+                self._assigned[job_id] = worker_id
+                return ("job", job_id, len(self._jobs)) + tuple(self._jobs[job_id])
+            if len(self._results) == len(self._jobs):
+                self._stopped.add(worker_id)
+                return ("stop",)
+            return ("wait",)
+
+    def submit(self, worker_id: str, job_id: int, rows: List[dict], status: str, seconds: Optional[float],
+               warehouse: Optional[dict] = None) -> None:
+        with self._lock:
+            self._seen[worker_id] = time.time()
+            if job_id in self._results:
+                return
+            self._results[job_id] = (rows, status, seconds)
+            self._assigned.pop(job_id, None)
+            if job_id in self._pending:
+                self._pending.remove(job_id)
+            self._delivering += 1
+        try:
+            # outside the lock: the journal fsync and warehouse insert must not stall other workers' calls
+            if self._on_result is not None:
+                self._on_result(job_id, [Row(**r) for r in rows], warehouse)
+        finally:
+            with self._lock:
+                self._delivering -= 1
+                if len(self._results) == len(self._jobs) and not self._delivering:
+                    self.finished.set()
+
+    def check_workers(self) -> None:
+        with self._lock:
+            self._requeue_silent()
+
+    def _requeue_silent(self) -> None:
+        now = time.time()
+        for job_id, worker_id in list(self._assigned.items()):
+            if now - self._seen.get(worker_id, 0.0) > self._worker_timeout:
+                warn(f"Worker {worker_id} silent for over {self._worker_timeout:.0f}s; re-queueing job {job_id + 1}")
+                del self._assigned[job_id]
+                self._pending.appendleft(job_id)
+
+    def progress(self) -> Tuple[int, int, int]:
+        """(jobs done, jobs total, live workers)."""
+        with self._lock:
+            now = time.time()
+            live = sum(1 for t in self._seen.values() if now - t <= self._worker_timeout)
+            return len(self._results), len(self._jobs), live
+
+    def all_workers_stopped(self) -> bool:
+        with self._lock:
+            now = time.time()
+            live = {w for w, t in self._seen.items() if now - t <= self._worker_timeout}
+            return live <= self._stopped
+
+    def results(self) -> Dict[int, Tuple[List[dict], str, Optional[float]]]:
+        with self._lock:
+            return dict(self._results)
+
+def _strip_options(argv: List[str], names: Set[str]) -> List[str]:
+    """argv without the given '--name value' / '--name=value' options."""
+    out: List[str] = []
+    skip = False
+    for a in argv:
+        if skip:
+            skip = False
+            continue
+        if a in names:
+            skip = True
+            continue
+        if a.split("=", 1)[0] in names:
+            continue
+        out.append(a)
+    return out
+
+def start_local_workers(cfg: Config, argv: List[str], address: Tuple[str, int]) -> List[subprocess.Popen]:
+    """Start cfg.local_workers copies of this script as workers of the coordinator at address."""
+    host = address[0] if address[0] not in ("", "0.0.0.0", "::") else "127.0.0.1"
+    cmd = [sys.executable, str(Path(__file__).resolve())] + _strip_options(argv, {"--coordinator", "--local-workers", "--authkey"})
+    cmd += ["--worker", f"{host}:{address[1]}"]
+    env = dict(os.environ, **{AUTHKEY_ENV: cfg.authkey.decode("utf-8")})  # not on the command line, where ps shows it
+    procs = []
+    for _ in range(cfg.local_workers):
+        procs.append(subprocess.Popen(cmd, cwd=str(cfg.repo_root), env=env, **popen_group_kwargs()))
+    return procs
+
+def run_coordinator(cfg: Config, argv: List[str]) -> int:
+    try:
+        reps = open_replications(cfg)
+    except ValueError as e:
+        err(f"Cannot resume: {e}")
+        return 2
+    planned, durations, predicted = plan_jobs(cfg, reps)
+    jobs = [(r + 1, [(as_posix_relative(td.test_dir, cfg.repo_root), td.mutate_target) for td in group]) for r, group in planned]
+
+    warehouse = MutantWarehouse(cfg.warehouse_path, cfg.engine) if cfg.warehouse_path is not None else None
+
+    def on_result(job_id: int, rows: List[Row], payload: Optional[dict]) -> None:
+        r = planned[job_id][0]
+        reps[r].journal.append(rows)
+        if warehouse is not None and payload is not None:
+            warehouse.record(r + 1, rows, payload)
+
+    coordinator = SweepCoordinator(jobs, run_settings(cfg), cfg.worker_timeout, on_result, warehouse is not None)
+    SweepManager.register("coordinator", callable=lambda: coordinator)
+    manager = SweepManager(address=cfg.coordinator, authkey=cfg.authkey)
+    server = manager.get_server()
+    threading.Thread(target=server.serve_forever, name="sweep-coordinator", daemon=True).start()
+    address = server.address
+    log(f"Coordinator serving {len(jobs)} job(s) on {address[0]}:{address[1]}")
+
+    local = start_local_workers(cfg, argv, address) if cfg.local_workers else []
+    started = time.time()
+    last = None
+    try:
+        while not coordinator.finished.wait(DIST_POLL_SECONDS):
+            coordinator.check_workers()
+            state = coordinator.progress()
+            if state != last:
+                log(f"[dist] {state[0]}/{state[1]} job(s) done, {state[2]} live worker(s)")
+                last = state
+        linger_until = time.time() + DIST_LINGER_SECONDS
+        while time.time() < linger_until and not coordinator.all_workers_stopped():
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        err("KeyboardInterrupt received; stopping local workers...")
+        _interrupted.set()
+        for p in local:
+            _interrupt_group(p.pid)
+        raise
+    finally:
+        for r in reps:
+            r.journal.close()
+        if warehouse is not None:
+            warehouse.close()
+        for p in local:
+            try:
+                p.wait(timeout=DIST_LINGER_SECONDS)
+            except subprocess.TimeoutExpired:
+                pass
+            _kill_group(p, wait_seconds=3)
+
+    for job_id, (job_rows, status, seconds) in sorted(coordinator.results().items()):
+        r, group = planned[job_id]
+        reps[r].rows.extend(Row(**row) for row in job_rows)
+        if seconds is not None and status in ("ok", "timeout"):
+            durations[run_duration_key(cfg, group[0])] = seconds
+    slots = coordinator.total_slots()
+    if predicted and slots:
+        log(f"Makespan: predicted {simulate_makespan(predicted, slots):.1f}s on {slots} worker slot(s), "
+            f"actual {time.time() - started:.1f}s")
+    save_run_durations(cfg, durations)
+    for r in reps:
+        write_csv(r.cfg, r.rows)
+    return 0
+
+def _connect_coordinator(cfg: Config):
+    SweepManager.register("coordinator")
+    deadline = time.time() + DIST_CONNECT_SECONDS
+    while True:
+        manager = SweepManager(address=cfg.worker, authkey=cfg.authkey)
+        try:
+            manager.connect()
+            return manager.coordinator()
+        except (ConnectionError, OSError):
+            if time.time() >= deadline:
+                raise
+            time.sleep(1.0)
+
+def run_worker(cfg: Config) -> int:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        coordinator = _connect_coordinator(cfg)
+    except (ConnectionError, OSError) as e:
+        err(f"Cannot reach coordinator at {cfg.worker[0]}:{cfg.worker[1]}: {e!r}")
+        return 1
+    theirs, ours = coordinator.settings(), run_settings(cfg)
+    if theirs != ours:
+        diff = ", ".join(f"{k}={ours.get(k)!r} (coordinator: {theirs.get(k)!r})" for k in sorted(theirs) if theirs.get(k) != ours.get(k))
+        err(f"Worker settings differ from the coordinator's: {diff}")
+        return 1
+    restore_leftover_backups(find_test_dirs(cfg))
+    coordinator.join(worker_id, cfg.jobs)
+    collect_mutants = coordinator.collects_mutants()
+    pytest_exe, mutmut_exe, python_exe = resolve_tools(cfg)
+    raw_status_map = load_status_mapping_from_venv(cfg.venv_path)
+    gate = AdmissionGate(cfg) if cfg.auto_jobs else None
+    log(f"Worker {worker_id} connected to {cfg.worker[0]}:{cfg.worker[1]} with {cfg.jobs} slot(s)")
+
+    stop = threading.Event()
+
+    def heartbeat() -> None:
+        while not stop.wait(DIST_HEARTBEAT_SECONDS):
+            try:
+                coordinator.heartbeat(worker_id)
+            except Exception:
+                return
+
+    def slot() -> None:
+        while not _interrupted.is_set():
+            if gate is not None:
+                gate.acquire()
+            timed_out = False
+            try:
+                reply = coordinator.next_job(worker_id)
+                if reply[0] == "stop":
+                    return
+                if reply[0] == "wait":
+                    time.sleep(DIST_POLL_SECONDS)
+                    continue
+                _, job_id, total, replication, members = reply
+                group = [TestDir(Path(rel).parts[0], cfg.repo_root / rel, target, cfg.repo_root / rel / "test_final.py")
+                         for rel, target in members]
+                group_rows, result = run_group(replication_config(cfg, replication - 1), group, job_id + 1, total,
+                                               pytest_exe, mutmut_exe, python_exe, raw_status_map)
+                timed_out = result.status == "timeout"
+                payload = warehouse_payload(cfg, group[0], result, raw_status_map) if collect_mutants else None
+                coordinator.submit(worker_id, job_id, [asdict(r) for r in group_rows], result.status, result.seconds, payload)
+            finally:
+                if gate is not None:
+                    gate.release(timed_out)
+
+    threading.Thread(target=heartbeat, name="sweep-heartbeat", daemon=True).start()
+    ex = ThreadPoolExecutor(max_workers=cfg.jobs)
+    try:
+        for fut in as_completed([ex.submit(slot) for _ in range(cfg.jobs)]):
+            fut.result()
+        ex.shutdown()
+    except (ConnectionError, EOFError, BrokenPipeError) as e:
+        warn(f"Lost the coordinator ({e!r}); exiting")
+        ex.shutdown()
+    except KeyboardInterrupt:
+        abort_pool(ex)
+        raise
+    finally:
+        stop.set()
+        shutdown_fork_servers()
+    return 0
 
 # ---------------------------
 # main
 # ---------------------------
 
-def main(argv: Optional[List[str]] = None) -> int:
-    cfg = parse_args(argv)
-    tds = discover_validate(cfg)
-    pytest_exe, mutmut_exe = resolve_tools(cfg)
+@traced("plan_jobs")
+def plan_jobs(cfg: Config, reps: List[Replication]) -> Tuple[List[Tuple[int, List[TestDir]]], Dict[str, float], List[float]]:
+    """
+    Discover, dedup and order the sweep once, then emit one job per group and replication:
+    (jobs as (replication index, group), recorded durations, predicted seconds per job).
+    Jobs are replication-major, so the next replication starts as soon as a worker is free
+    rather than after the slowest suite of the previous one. Directories a replication's
+    journal already holds are left out.
+    """
+    groups = plan_groups(cfg, discover_validate(cfg))
+    durations = load_run_durations(cfg)
+    predicted: Dict[int, float] = {}
+    if cfg.schedule == "ljf" and groups:
+        groups, predicted = schedule_longest_first(cfg, groups, durations)
+    jobs: List[Tuple[int, List[TestDir]]] = []
+    costs: List[float] = []
+    for r, rep in enumerate(reps):
+        done = {row.actual_test_path for row in rep.rows}
+        for g, group in enumerate(groups):
+            todo = [td for td in group if as_posix_relative(td.test_file, cfg.repo_root) not in done]
+            if todo:
+                jobs.append((r, todo))
+                costs.append(predicted.get(g, 0.0))
+    return jobs, durations, costs if predicted else []
+
+def run_sweep(cfg: Config) -> int:
+    global _progress
+    pytest_exe, mutmut_exe, python_exe = resolve_tools(cfg)
 
-    rows: List[Row] = []
-    totalN = len(tds)
+    try:
+        reps = open_replications(cfg)
+    except ValueError as e:
+        err(f"Cannot resume: {e}")
+        return 2
+    jobs, durations, predicted = plan_jobs(cfg, reps)
+    totalN = len(jobs)
 
     # Preload status mapping from the target venv (used for ALL dirs)
     raw_status_map = load_status_mapping_from_venv(cfg.venv_path)
 
     if totalN == 0:
-        write_csv(cfg, rows)
+        for r in reps:
+            r.journal.close()
+            write_csv(r.cfg, r.rows)
         return 0
 
     counter_lock = threading.Lock()
     index_counter = {"i": 0}
-
-    def wrap_process(td: TestDir) -> Row:
+    warehouse = MutantWarehouse(cfg.warehouse_path, cfg.engine) if cfg.warehouse_path is not None else None
+    gate = AdmissionGate(cfg) if cfg.auto_jobs else None
+    if gate is not None:
+        log(f"--jobs auto: {cfg.jobs} worker(s) on {gate.cores} core(s), max load {cfg.max_load}/core, "
+            f"RSS ceiling {'none' if cfg.max_rss_mb is None else f'{cfg.max_rss_mb:.0f} MB'}")
+
+    def wrap_process(job: int, r: int, group: List[TestDir]) -> Tuple[int, List[Row]]:
+        if _interrupted.is_set():
+            return r, []  # queued behind the interrupt: leave it for --resume
+        if gate is not None:
+            gate.acquire()
         with counter_lock:
             index_counter["i"] += 1
             idx = index_counter["i"]
+        timed_out = False
         try:
-            return process_one(cfg, td, idx, totalN, pytest_exe, mutmut_exe, raw_status_map)
-        except Exception as e:
-            err(f"Unhandled exception in {as_posix_relative(td.test_dir, cfg.repo_root)}: {e!r}")
-            rel_test = as_posix_relative(td.test_file, cfg.repo_root)
-            tc_id, api, temp, rep = derive_metadata(cfg, td, rel_test)
-            duration = parse_duration_seconds(td)
-            file_size = td.test_file.stat().st_size if td.test_file.exists() else 0
-            return Row(tc_id, api, temp, rep, duration, file_size, 0, 0, 0.0, rel_test, "error")
-
-    try:
-        with ThreadPoolExecutor(max_workers=cfg.jobs) as ex:
-            futures = [ex.submit(wrap_process, td) for td in tds]
-            for fut in as_completed(futures):
-                rows.append(fut.result())
+            group_rows, result = run_group(replication_config(cfg, r), group, idx, totalN, pytest_exe, mutmut_exe, python_exe, raw_status_map)
+            if _interrupted.is_set():
+                return r, []  # killed mid-run; the journal and warehouse may already be closed
+            reps[r].journal.append(group_rows)
+            if warehouse is not None:
+                warehouse.record(r + 1, group_rows, warehouse_payload(cfg, group[0], result, raw_status_map))
+            _progress.finish(job, as_posix_relative(group[0].test_dir, cfg.repo_root), result.total)
+            timed_out = result.status == "timeout"
+            if result.seconds is not None and result.status in ("ok", "timeout"):
+                with counter_lock:
+                    durations[run_duration_key(cfg, group[0])] = result.seconds
+            return r, group_rows
+        finally:
+            if gate is not None:
+                gate.release(timed_out)
+
+    _progress = SweepProgress([(suite_content_hash(group[0]), expected_mutants(cfg, group[0]) if cfg.progress_interval > 0 else None)
+                               for _, group in jobs], cfg.progress_interval)
+    pool_started = time.time()
+    # no `with`: its exit waits for every queued suite, so Ctrl-C would only land after the whole sweep
+    ex = ThreadPoolExecutor(max_workers=cfg.jobs)
+    try:
+        futures = [ex.submit(wrap_process, job, r, group) for job, (r, group) in enumerate(jobs)]
+        for fut in as_completed(futures):
+            r, group_rows = fut.result()
+            reps[r].rows.extend(group_rows)
+        ex.shutdown()
     except KeyboardInterrupt:
-        err("KeyboardInterrupt received; terminating all active processes...")
-        cleanup_all_processes()
+        abort_pool(ex)
         raise
-
-    write_csv(cfg, rows)
+    finally:
+        shutdown_fork_servers()
+        _progress.close()
+        for r in reps:
+            r.journal.close()
+        if warehouse is not None:
+            warehouse.close()
+
+    log(_progress.line())
+    if predicted:
+        log(f"Makespan: predicted {simulate_makespan(predicted, cfg.jobs):.1f}s, actual {time.time() - pool_started:.1f}s")
+    save_run_durations(cfg, durations)
+    for r in reps:
+        write_csv(r.cfg, r.rows)
     return 0
 
+def main(argv: Optional[List[str]] = None) -> int:
+    global _tracer
+    argv = sys.argv[1:] if argv is None else argv
+    cfg = parse_args(argv)
+    if cfg.trace_path is not None:
+        _tracer = TraceRecorder(cfg.trace_path)
+    try:
+        if cfg.coordinator is not None:
+            return run_coordinator(cfg, argv)
+        if cfg.worker is not None:
+            return run_worker(cfg)
+        return run_sweep(cfg)
+    finally:
+        if _tracer is not None:
+            _tracer.write()
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == WARM_WORKER_FLAG:
+        sys.exit(warm_worker_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == FORK_ZYGOTE_FLAG:
+        sys.exit(fork_zygote_main(sys.argv[2:]))
     try:
         sys.exit(main())
     except SystemExit as e:
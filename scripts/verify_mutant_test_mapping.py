@@ -7,6 +7,9 @@ Determines which specific tests kill which specific mutants by running
 each test individually against each mutant. This provides the granular
 data needed to verify tables like tbl-extra-tests in the manuscript.
 
+Mutants come from the shared mutant catalogue of run_single_mutation_test.py,
+so mutant ids and hashes match those of every suite with the same target source.
+
 Usage:
     python verify_mutant_test_mapping.py --test-dir <path> [--venv-path <path>] [--repo-root <path>]
 
@@ -31,6 +34,8 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
+from run_single_mutation_test import DEFAULT_CATALOGUE_DIR, MutantSpec, load_catalogue
+
 DEFAULT_VENV = ".venv-invicto"
 DEFAULT_TIMEOUT = 60  # per-test timeout (shorter than full suite)
 
@@ -42,6 +47,7 @@ class MutantInfo:
     operator: str
     description: str
     status_full_suite: str
+    mutant_hash: str = ""
 
 
 @dataclass
@@ -93,6 +99,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default="mutant_test_mapping.json",
         help="Output JSON file path (default: mutant_test_mapping.json)",
     )
+    p.add_argument(
+        "--catalogue-dir",
+        type=str,
+        default=None,
+        help=f"Shared mutant catalogue (default: <repo-root or CWD>/{DEFAULT_CATALOGUE_DIR})",
+    )
     p.add_argument(
         "--skip-full-run",
         action="store_true",
@@ -216,36 +228,52 @@ def run_full_mutmut(
         return False
 
 
-def get_mutants_from_cache(test_dir: Path) -> List[MutantInfo]:
-    """Read mutant information from .mutmut-cache SQLite database."""
+def get_full_suite_statuses(test_dir: Path) -> Dict[Tuple[int, int], str]:
+    """Read {(1-based line, index): status} from the .mutmut-cache of a full run."""
     cache_path = test_dir / ".mutmut-cache"
     if not cache_path.exists():
-        print(f"[ERROR] No .mutmut-cache found at {cache_path}")
-        return []
+        print(f"[WARN] No .mutmut-cache found at {cache_path}; full-suite statuses unknown")
+        return {}
 
-    mutants = []
+    statuses: Dict[Tuple[int, int], str] = {}
     try:
         with sqlite3.connect(str(cache_path), timeout=5.0) as con:
-            # Get mutant details
             cursor = con.execute("""
-                SELECT id, line, status
-                FROM Mutant
-                ORDER BY id
+                SELECT Line.line_number, Mutant."index", Mutant.status
+                FROM Mutant JOIN Line ON Mutant.line = Line.id
             """)
-
-            for row in cursor:
-                mutant_id, line, status = row
-                mutants.append(MutantInfo(
-                    id=mutant_id,
-                    line=line,
-                    operator="unknown",  # mutmut doesn't store operator name directly
-                    description=f"Mutant {mutant_id} at line {line}",
-                    status_full_suite=status,
-                ))
+            for line_number, index, status in cursor:
+                statuses[(int(line_number) + 1, int(index))] = status
     except Exception as e:
         print(f"[ERROR] Failed to read mutmut cache: {e}")
 
-    return mutants
+    return statuses
+
+
+def get_mutants_from_catalogue(
+    test_dir: Path,
+    mutate_target: str,
+    venv_path: Path,
+    catalogue_dir: Path,
+) -> Tuple[List[MutantInfo], Dict[int, MutantSpec]]:
+    """Mutants of the target from the shared catalogue, annotated with full-suite statuses."""
+    specs = load_catalogue(catalogue_dir, venv_path, test_dir / mutate_target)
+    if not specs:
+        return [], {}
+
+    statuses = get_full_suite_statuses(test_dir)
+    mutants = [
+        MutantInfo(
+            id=m.id,
+            line=m.line_number,
+            operator="unknown",  # mutmut doesn't expose operator names
+            description=f"Mutant {m.id} at line {m.line_number} (index {m.index})",
+            status_full_suite=statuses.get((m.line_number, m.index), "untested"),
+            mutant_hash=m.mutant_hash,
+        )
+        for m in specs
+    ]
+    return mutants, {m.id: m for m in specs}
 
 
 def extract_test_names(test_file: Path) -> List[TestInfo]:
@@ -291,34 +319,24 @@ def extract_test_names(test_file: Path) -> List[TestInfo]:
 def run_single_test_against_mutant(
     test_dir: Path,
     mutate_target: str,
-    mutant_id: int,
+    mutant: MutantSpec,
     test_name: str,
     pytest_exe: str,
-    mutmut_exe: str,
     timeout: int,
 ) -> Tuple[bool, Optional[str]]:
     """
     Run a single test against a specific mutant.
     Returns (killed: bool, error: Optional[str]).
     """
-    # Use mutmut's apply mechanism to apply the mutant
     env = os.environ.copy()
     env["PYTHONIOENCODING"] = "utf-8"
     env["PYTHONHASHSEED"] = "0"
 
+    target_path = test_dir / mutate_target
+    original = target_path.read_bytes()
     try:
-        # Apply the mutant
-        apply_result = subprocess.run(
-            [mutmut_exe, "apply", str(mutant_id)],
-            cwd=str(test_dir),
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if apply_result.returncode != 0:
-            return False, f"Failed to apply mutant: {apply_result.stderr}"
+        # Write the catalogued mutant over the target
+        target_path.write_text(mutant.source, encoding="utf-8")
 
         # Run the specific test
         test_result = subprocess.run(
@@ -340,17 +358,11 @@ def run_single_test_against_mutant(
     except Exception as e:
         return False, str(e)
     finally:
-        # Always try to restore original code
+        # Always restore the original code
         try:
-            subprocess.run(
-                [mutmut_exe, "apply", "0"],  # Apply mutant 0 = restore original
-                cwd=str(test_dir),
-                env=env,
-                capture_output=True,
-                timeout=10,
-            )
-        except Exception:
-            pass
+            target_path.write_bytes(original)
+        except Exception as e:
+            print(f"[ERROR] Failed to restore {target_path}: {e}")
 
 
 def verify_mutant_test_mapping(
@@ -359,6 +371,7 @@ def verify_mutant_test_mapping(
     timeout: int,
     skip_full_run: bool,
     repo_root: Optional[Path] = None,
+    catalogue_dir: Optional[Path] = None,
 ) -> Tuple[List[MutantInfo], List[TestInfo], List[MutantTestResult]]:
     """
     Main verification logic.
@@ -387,10 +400,12 @@ def verify_mutant_test_mapping(
             print("[ERROR] Full mutmut run failed")
             return [], [], []
 
-    # Get mutants from cache
-    mutants = get_mutants_from_cache(test_dir)
+    # Get mutants from the shared catalogue
+    if catalogue_dir is None:
+        catalogue_dir = (repo_root or Path.cwd()) / DEFAULT_CATALOGUE_DIR
+    mutants, specs = get_mutants_from_catalogue(test_dir, mutate_target, venv_path, catalogue_dir)
     if not mutants:
-        print("[ERROR] No mutants found in cache")
+        print("[ERROR] No mutants found in catalogue")
         return [], [], []
 
     print(f"[INFO] Found {len(mutants)} mutants")
@@ -421,10 +436,9 @@ def verify_mutant_test_mapping(
             killed, error = run_single_test_against_mutant(
                 test_dir,
                 mutate_target,
-                mutant.id,
+                specs[mutant.id],
                 test.full_name,
                 pytest_exe,
-                mutmut_exe,
                 timeout,
             )
 
@@ -567,6 +581,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         args.timeout,
         args.skip_full_run,
         repo_root,
+        Path(args.catalogue_dir).resolve() if args.catalogue_dir else None,
     )
 
     if mutants and tests and results:
@@ -0,0 +1,33 @@
+"""Shared helpers for the unit tests of scripts/run_single_mutation_test.py (std lib + pytest)."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import run_single_mutation_test as rsmt  # noqa: E402
+
+TARGET = "def add(a, b):\n    return a + b\n"
+TESTS = "from put import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+
+
+def make_suite(repo: Path, name: str, target: str = TARGET, tests: str = TESTS) -> rsmt.TestDir:
+    d = repo / "assistant" / name
+    d.mkdir(parents=True)
+    (d / "put.py").write_text(target, encoding="utf-8")
+    (d / "test_final.py").write_text(tests, encoding="utf-8")
+    return rsmt.TestDir("assistant", d, "put.py", d / "test_final.py")
+
+
+@pytest.fixture
+def cfg(tmp_path):
+    (tmp_path / "assistant").mkdir()
+    return rsmt.parse_args(["--repo-root", str(tmp_path), "--output-path", str(tmp_path / "out.csv"),
+                            "--catalogue-dir", "catalogue"])
+
+
+@pytest.fixture
+def interrupted():
+    rsmt._interrupted.set()
+    yield
+    rsmt._interrupted.clear()
@@ -0,0 +1,68 @@
+"""SweepCoordinator job table (--coordinator / --worker)."""
+import threading
+from dataclasses import asdict
+
+import run_single_mutation_test as rsmt
+
+JOBS = [(1, [("assistant/tc_a", "put.py")]), (1, [("assistant/tc_b", "put.py")])]
+
+
+def row(path: str) -> dict:
+    return asdict(rsmt.Row("a", "assistant", "0.0", "1", 1.0, 10, 1, 2, 0.5, path, "ok"))
+
+
+def test_jobs_are_handed_out_once_and_the_first_result_wins():
+    delivered = []
+    coordinator = rsmt.SweepCoordinator(JOBS, {}, 60.0, lambda job_id, rows, payload: delivered.append(job_id))
+    assert coordinator.next_job("w1") == ("job", 0, 2) + JOBS[0]
+    assert coordinator.next_job("w2") == ("job", 1, 2) + JOBS[1]
+    assert coordinator.next_job("w1") == ("wait",)
+    coordinator.submit("w1", 0, [row("assistant/tc_a/test_final.py")], "ok", 1.0)
+    coordinator.submit("w2", 0, [], "error", None)
+    assert not coordinator.finished.is_set()
+    coordinator.submit("w2", 1, [row("assistant/tc_b/test_final.py")], "ok", 2.0)
+    assert coordinator.finished.is_set() and delivered == [0, 1]
+    assert coordinator.results()[0] == ([row("assistant/tc_a/test_final.py")], "ok", 1.0)
+    assert coordinator.next_job("w1") == ("stop",)
+
+
+def test_jobs_of_a_silent_worker_are_requeued(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rsmt.time, "time", lambda: now[0])
+    coordinator = rsmt.SweepCoordinator(JOBS[:1], {}, 30.0)
+    assert coordinator.next_job("w1")[:2] == ("job", 0)
+    now[0] += 10
+    coordinator.heartbeat("w1")
+    now[0] += 25
+    assert coordinator.next_job("w2") == ("wait",)
+    now[0] += 10
+    assert coordinator.next_job("w2")[:2] == ("job", 0)
+
+
+def test_results_are_delivered_outside_the_lock():
+    coordinator = None
+    seen = []
+
+    def on_result(job_id, rows, payload):
+        # another worker's call while this result is being journaled must not block
+        t = threading.Thread(target=lambda: seen.append(coordinator.next_job("w2")))
+        t.start()
+        t.join(timeout=5)
+        assert not t.is_alive()
+        assert not coordinator.finished.is_set()
+        assert [r.actual_test_path for r in rows] == ["assistant/tc_a/test_final.py"]
+
+    coordinator = rsmt.SweepCoordinator(JOBS[:1], {}, 60.0, on_result)
+    coordinator.next_job("w1")
+    coordinator.submit("w1", 0, [row("assistant/tc_a/test_final.py")], "ok", 1.0)
+    assert seen == [("stop",)]
+    assert coordinator.finished.is_set()
+
+
+def test_total_slots_sum_the_joined_workers():
+    coordinator = rsmt.SweepCoordinator(JOBS, {}, 60.0)
+    assert coordinator.total_slots() == 0
+    coordinator.join("w1", 4)
+    coordinator.join("w2", 2)
+    coordinator.join("w1", 4)
+    assert coordinator.total_slots() == 6
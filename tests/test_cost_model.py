@@ -0,0 +1,42 @@
+"""Longest-first cost model (--schedule ljf)."""
+import importlib
+from pathlib import Path
+
+import pytest
+
+import run_single_mutation_test as rsmt
+from conftest import make_suite
+
+
+def test_solve_least_squares_recovers_linear_coefficients():
+    xs = [[1.0, float(i), float(i * i % 7)] for i in range(12)]
+    ys = [2.0 + 0.5 * x[1] + 3.0 * x[2] for x in xs]
+    assert rsmt._solve_least_squares(xs, ys) == pytest.approx([2.0, 0.5, 3.0], abs=1e-4)
+
+
+def test_predict_costs_fits_recorded_suites_without_generating_mutants(cfg):
+    tds = []
+    for i in range(rsmt.MIN_SAMPLES_FOR_FIT + 1):
+        target = "".join(f"v{j} = {j}\n" for j in range(i + 1))
+        tests = "".join(f"def test_{j}():\n    pass\n" for j in range(i % 3 + 1)) + "#" * (100 * i)
+        tds.append(make_suite(cfg.repo_root, f"tc_{i}", target, tests))
+    coef = [1.0, 2.0, 0.5, 0.25]
+    feats = [rsmt.suite_features(cfg, td) for td in tds]
+    durations = {rsmt.run_duration_key(cfg, td): sum(c * x for c, x in zip(coef, f)) for td, f in zip(tds[:-1], feats[:-1])}
+    costs = rsmt.predict_costs(cfg, [[td] for td in tds], durations)
+    assert costs[:-1] == [durations[rsmt.run_duration_key(cfg, td)] for td in tds[:-1]]
+    assert costs[-1] == pytest.approx(sum(c * x for c, x in zip(coef, feats[-1])), rel=1e-3)
+    assert not cfg.catalogue_dir.exists() or not list(cfg.catalogue_dir.glob("*.json"))
+
+
+def test_import_mutmut_failure_is_reported_once(monkeypatch, capsys):
+    monkeypatch.setattr(rsmt, "_mutmut_module", None)
+    monkeypatch.setattr(rsmt, "_mutmut_import_failed", False)
+
+    def boom(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(importlib, "import_module", boom)
+    assert rsmt.import_mutmut(Path("no-venv")) is None
+    assert rsmt.import_mutmut(Path("no-venv")) is None
+    assert capsys.readouterr().err.count("Could not import mutmut") == 1
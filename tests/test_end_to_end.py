@@ -0,0 +1,143 @@
+"""End-to-end sweeps over a tiny fixture suite; these run mutmut and pytest in subprocesses."""
+import csv
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mutmut")
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "run_single_mutation_test.py"
+
+CLAMP = '''def clamp(x, low=0, high=10):
+    if x < low:
+        return low
+    if x > high:
+        return high
+    return x
+
+
+def scale(x):
+    return x * 2 + 1
+'''
+CLAMP_TESTS = '''from put import clamp, scale
+
+
+def test_clamp():
+    assert clamp(-5) == 0
+    assert clamp(50) == 10
+
+
+def test_scale():
+    assert scale(3) == 7
+'''
+
+
+def make_repo(root: Path, *suites: str, tests: str = CLAMP_TESTS) -> Path:
+    for name in suites:
+        d = root / "assistant" / name
+        d.mkdir(parents=True)
+        (d / "put.py").write_text(CLAMP, encoding="utf-8")
+        (d / "test_final.py").write_text(tests, encoding="utf-8")
+    return root
+
+
+def sweep(repo: Path, *args: str, name: str = "out") -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(SCRIPT), "--repo-root", str(repo), "--output-path", str(repo / f"{name}.csv"),
+                           "--no-cache", "--progress-interval", "0", *args],
+                          cwd=repo, capture_output=True, text=True, timeout=300)
+
+
+def counts(repo: Path, name: str = "out") -> dict:
+    with (repo / f"{name}.csv").open(newline="", encoding="utf-8") as f:
+        return {r["actual_test_path"]: (r["killed_mutations"], r["all_mutations"], r["status"]) for r in csv.DictReader(f)}
+
+
+@pytest.fixture(scope="module")
+def repo(tmp_path_factory):
+    return make_repo(tmp_path_factory.mktemp("repo"), "tc_e2e_t0.0_rep1")
+
+
+@pytest.fixture(scope="module")
+def mutmut_counts(repo):
+    proc = sweep(repo, "--engine", "mutmut", name="mutmut")
+    assert proc.returncode == 0, proc.stderr
+    result = counts(repo, "mutmut")
+    assert result == {"assistant/tc_e2e_t0.0_rep1/test_final.py": ("6", "8", "ok")}
+    return result
+
+
+# ---------------------------
+# Engines agree with mutmut
+# ---------------------------
+
+def test_warm_engine_matches_mutmut(repo, mutmut_counts):
+    proc = sweep(repo, "--engine", "warm", name="warm")
+    assert proc.returncode == 0, proc.stderr
+    assert counts(repo, "warm") == mutmut_counts
+    assert (repo / "assistant" / "tc_e2e_t0.0_rep1" / "put.py").read_text(encoding="utf-8") == CLAMP
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="the fork engine needs os.fork")
+def test_fork_engine_matches_mutmut(repo, mutmut_counts):
+    proc = sweep(repo, "--engine", "fork", name="fork")
+    assert proc.returncode == 0, proc.stderr
+    assert counts(repo, "fork") == mutmut_counts
+    assert (repo / "assistant" / "tc_e2e_t0.0_rep1" / "put.py").read_text(encoding="utf-8") == CLAMP
+
+
+# ---------------------------
+# Coordinator and workers
+# ---------------------------
+
+def test_coordinator_with_a_local_worker_matches_a_local_sweep(repo, mutmut_counts):
+    proc = sweep(repo, "--coordinator", "127.0.0.1:0", "--local-workers", "1",
+                 "--warehouse-path", str(repo / "dist.sqlite"), name="dist")
+    assert proc.returncode == 0, proc.stderr
+    assert counts(repo, "dist") == mutmut_counts
+    assert "on 1 worker slot(s)" in proc.stdout
+    with sqlite3.connect(str(repo / "dist.sqlite")) as con:
+        assert con.execute("SELECT COUNT(*) FROM mutant_result").fetchone() == (8,)
+
+
+# ---------------------------
+# Ctrl-C
+# ---------------------------
+
+@pytest.mark.skipif(os.name != "posix", reason="sends a real SIGINT")
+def test_sigint_stops_the_sweep_without_starting_queued_suites(tmp_path):
+    slow_tests = CLAMP_TESTS.replace("from put", "import time\nfrom put").replace("def test_clamp():\n",
+                                                                               "def test_clamp():\n    time.sleep(1)\n")
+    suites = [f"tc_s{i}_t0.0_rep1" for i in range(3)]
+    repo = make_repo(tmp_path, *suites, tests=slow_tests)
+    dirs = [repo / "assistant" / name for name in suites]
+    targets = [CLAMP + f"\n\ndef suite_id():\n    return {i}\n" for i in range(len(dirs))]
+    for d, target in zip(dirs, targets):
+        (d / "put.py").write_text(target, encoding="utf-8")  # distinct suites, so none is deduplicated away
+    proc = subprocess.Popen([sys.executable, str(SCRIPT), "--repo-root", str(repo), "--output-path", str(repo / "out.csv"),
+                             "--no-cache", "--progress-interval", "0", "--jobs", "1"],
+                            cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        deadline = time.time() + 120
+        while not any((d / ".mutmut-cache").exists() for d in dirs):
+            assert proc.poll() is None and time.time() < deadline, "no suite started"
+            time.sleep(0.1)
+        time.sleep(2.0)  # a mutant or two into the first suite
+        proc.send_signal(signal.SIGINT)
+        interrupted_at = time.time()
+        _, stderr = proc.communicate(timeout=60)
+    finally:
+        proc.kill()
+    assert time.time() - interrupted_at < 15, stderr
+    assert proc.returncode != 0
+    assert "KeyboardInterrupt received" in stderr
+    assert sum((d / ".mutmut-cache").exists() for d in dirs) == 1
+    for d, target in zip(dirs, targets):
+        assert (d / "put.py").read_text(encoding="utf-8") == target
+        assert not (d / "put.py.bak").exists()
+    assert not (repo / "out.csv").exists()
@@ -0,0 +1,15 @@
+"""Bytecode fingerprints for --skip-equivalent."""
+import run_single_mutation_test as rsmt
+
+
+def test_code_fingerprint_ignores_layout_docstrings_and_folded_constants():
+    def fp(body, doc="Doc."):
+        return rsmt.code_fingerprint(f'"""{doc}"""\ndef f(x):\n    """{doc}"""\n{body}', "put.py")
+
+    base = fp("    return x * 6\n")
+    assert base is not None
+    assert fp("\n    # six\n    return x * 6  # six\n", doc="XXDoc.XX") == base
+    assert fp("    return x * (2 * 3)\n") == base
+    assert fp("    return x * 7\n") != base
+    assert fp("    return x / 6\n") != base
+    assert rsmt.code_fingerprint("def f(x:\n", "put.py") is None
@@ -0,0 +1,93 @@
+"""Results journal (--resume) and restoring mutated targets on interrupt."""
+from dataclasses import replace
+
+import pytest
+
+import run_single_mutation_test as rsmt
+from conftest import TARGET, make_suite
+
+
+def make_row(path: str, status: str = "ok", killed: int = 1) -> rsmt.Row:
+    return rsmt.Row("s00", "assistant", "0.0", "1", 1.0, 10, killed, 2, killed / 2, path, status)
+
+
+# ---------------------------
+# Journal
+# ---------------------------
+
+def test_read_journal_keeps_the_last_row_per_directory_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "out.csv.journal.jsonl"
+    journal = rsmt.ResultsJournal(path, {"engine": "mutmut"}, resume=False)
+    journal.append([make_row("a/test_final.py", killed=0), make_row("b/test_final.py")])
+    journal.append([make_row("a/test_final.py", killed=2)])
+    journal.close()
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"tc_id": "s00", "api"')  # crash mid-write
+    rows = {r.actual_test_path: r for r in rsmt.read_journal(path, {"engine": "mutmut"})}
+    assert set(rows) == {"a/test_final.py", "b/test_final.py"}
+    assert rows["a/test_final.py"].killed == 2
+    with pytest.raises(ValueError):
+        rsmt.read_journal(path, {"engine": "warm"})
+
+
+def test_open_journal_resumes_all_but_error_rows(cfg):
+    first, _ = rsmt.open_journal(cfg)
+    first.append([make_row("a/test_final.py"), make_row("b/test_final.py", status="error")])
+    first.close()
+    resumed, done = rsmt.open_journal(replace(cfg, resume=True))
+    resumed.append([make_row("b/test_final.py")])
+    resumed.close()
+    assert [r.actual_test_path for r in done] == ["a/test_final.py"]
+    assert len(rsmt.read_journal(cfg.journal_path, rsmt.run_settings(cfg))) == 2
+    fresh, done = rsmt.open_journal(cfg)
+    fresh.close()
+    assert done == [] and rsmt.read_journal(cfg.journal_path, rsmt.run_settings(cfg)) == []
+
+
+def test_rows_are_not_journaled_after_an_interrupt(tmp_path, interrupted):
+    path = tmp_path / "j.jsonl"
+    journal = rsmt.ResultsJournal(path, {}, resume=False)
+    journal.append([make_row("a/test_final.py")])
+    journal.close()
+    assert rsmt.read_journal(path, {}) == []
+
+
+# ---------------------------
+# Interrupt / restore of mutated targets
+# ---------------------------
+
+def test_leftover_backup_is_restored_before_a_run(tmp_path):
+    td = make_suite(tmp_path, "tc_a")
+    (td.test_dir / "put.py.bak").write_text(TARGET, encoding="utf-8")
+    (td.test_dir / "put.py").write_text(TARGET.replace("+", "-"), encoding="utf-8")
+    rsmt.restore_leftover_backups([td])
+    assert (td.test_dir / "put.py").read_text(encoding="utf-8") == TARGET
+    assert not (td.test_dir / "put.py.bak").exists()
+
+
+def test_inflight_targets_are_restored_from_the_snapshot(tmp_path):
+    with_bak, without_bak = make_suite(tmp_path, "tc_a"), make_suite(tmp_path, "tc_b")
+    for td in (with_bak, without_bak):
+        rsmt.track_inplace_target(td.test_dir / "put.py")
+        (td.test_dir / "put.py").write_text(TARGET.replace("+", "-"), encoding="utf-8")  # mutant applied
+    (with_bak.test_dir / "put.py.bak").write_text(TARGET, encoding="utf-8")
+    rsmt.restore_inplace_targets()
+    for td in (with_bak, without_bak):
+        assert (td.test_dir / "put.py").read_text(encoding="utf-8") == TARGET
+        assert not (td.test_dir / "put.py.bak").exists()
+    assert not rsmt._inplace_targets
+
+
+def test_release_without_restore_keeps_the_file(tmp_path):
+    target = make_suite(tmp_path, "tc_a").test_dir / "put.py"
+    rsmt.track_inplace_target(target)
+    target.write_text("changed = True\n", encoding="utf-8")
+    rsmt.release_inplace_target(target, restore=False)
+    assert target.read_text(encoding="utf-8") == "changed = True\n"
+    assert target not in rsmt._inplace_targets
+
+
+def test_run_mutmut_does_not_start_after_an_interrupt(cfg, interrupted):
+    td = make_suite(cfg.repo_root, "tc_a")
+    assert rsmt.run_mutmut(cfg, td, "pytest", str(cfg.repo_root / "no-such-mutmut")) == (False, None)
+    assert not rsmt._inplace_targets
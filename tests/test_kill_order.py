@@ -0,0 +1,20 @@
+"""Kill-history test ordering (--kill-order)."""
+import os
+
+import run_single_mutation_test as rsmt
+
+
+def test_kill_ordered_tests_puts_strongest_killers_first(tmp_path):
+    test_file = tmp_path / "test_final.py"
+    test_file.write_text("def test_a(): pass\ndef test_b(): pass\nclass TestC:\n    def test_c(self): pass\n"
+                         "def test_a(): pass\n", encoding="utf-8")
+    history = rsmt.KillHistory(tmp_path / "h.json", {})
+    assert rsmt.kill_ordered_tests(history, test_file) is None
+    history.record("test_final.py::TestC::test_c")
+    history.record("test_final.py::test_b[1]")
+    history.record("test_final.py::test_b[2]")
+    assert rsmt.kill_ordered_tests(history, test_file) == [
+        "test_final.py::test_b", "test_final.py::TestC::test_c", "test_final.py::test_a"]
+    assert rsmt.mutmut_runner_command("pytest", True, ["test_final.py::test_b"]).split() == [
+        "pytest", "-x", os.path.join(".", "test_final.py::test_b")]
+    assert rsmt.count_tests(test_file) == 3
@@ -0,0 +1,35 @@
+"""Outcome cache key (--outcome-cache-dir)."""
+from dataclasses import replace
+
+import pytest
+
+import run_single_mutation_test as rsmt
+from conftest import TARGET, make_suite
+
+
+@pytest.mark.parametrize("change", [
+    {"mutmut_timeout_seconds": 10},
+    {"mutant_timeout_multiplier": 3.0},
+    {"mutant_timeout_constant": 1.0},
+    {"mutant_shards": 4},
+    {"engine": "warm"},
+    {"kill_order": True},
+    {"python_hash_seed": "1"},
+    {"skip_equivalent": True},
+])
+def test_outcome_cache_key_covers_outcome_settings(cfg, change):
+    td = make_suite(cfg.repo_root, "tc_a")
+    assert rsmt.outcome_cache_key(replace(cfg, **change), td, "pytest") != rsmt.outcome_cache_key(cfg, td, "pytest")
+
+
+def test_outcome_cache_key_ignores_pool_settings_and_location(cfg):
+    a, b = make_suite(cfg.repo_root, "tc_a"), make_suite(cfg.repo_root, "tc_b")
+    key = rsmt.outcome_cache_key(cfg, a, "pytest")
+    assert rsmt.outcome_cache_key(replace(cfg, jobs=4, progress_interval=0.0), b, "pytest") == key
+    (b.test_dir / "put.py").write_text(TARGET.replace("+", "-"), encoding="utf-8")
+    assert rsmt.outcome_cache_key(cfg, b, "pytest") != key
+
+
+def test_only_the_first_replication_uses_the_outcome_cache(cfg):
+    assert rsmt.replication_config(cfg, 0).outcome_cache_dir == cfg.outcome_cache_dir
+    assert rsmt.replication_config(cfg, 1).outcome_cache_dir is None
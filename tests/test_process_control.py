@@ -0,0 +1,27 @@
+"""Tool lookup and process control across Windows and POSIX."""
+import sys
+
+import run_single_mutation_test as rsmt
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+def test_resolve_executable_uses_the_posix_venv_layout(tmp_path, monkeypatch):
+    monkeypatch.setattr(rsmt.os, "name", "posix")
+    _touch(tmp_path / "Scripts" / "pytest.exe")
+    assert rsmt.resolve_executable(tmp_path, tmp_path, "pytest", "pytest") == "pytest"
+    pytest_exe = _touch(tmp_path / "bin" / "pytest")
+    assert rsmt.resolve_executable(tmp_path, tmp_path, "pytest", "pytest") == str(pytest_exe)
+    assert rsmt.resolve_executable(tmp_path, tmp_path, "python", sys.executable) == sys.executable
+
+
+def test_resolve_executable_uses_the_windows_venv_layout(tmp_path, monkeypatch):
+    pytest_exe = _touch(tmp_path / "Scripts" / "pytest.exe")
+    _touch(tmp_path / "bin" / "mutmut")
+    monkeypatch.setattr(rsmt.os, "name", "nt")
+    assert rsmt.resolve_executable(tmp_path, tmp_path, "pytest", "pytest") == str(pytest_exe)
+    assert rsmt.resolve_executable(tmp_path, tmp_path, "mutmut", "mutmut") == "mutmut"
@@ -0,0 +1,42 @@
+"""Mutant sampling and score confidence intervals."""
+import pytest
+
+import run_single_mutation_test as rsmt
+
+
+@pytest.mark.parametrize("method,killed,total,expected", [
+    ("wilson", 8, 10, (0.4902, 0.9433)),
+    ("clopper-pearson", 8, 10, (0.4439, 0.9748)),
+    ("clopper-pearson", 0, 10, (0.0, 1 - 0.025 ** 0.1)),
+    ("clopper-pearson", 10, 10, (0.025 ** 0.1, 1.0)),
+    ("wilson", 0, 0, (0.0, 1.0)),
+])
+def test_score_interval(method, killed, total, expected):
+    assert method in rsmt.SAMPLE_CI_METHODS
+    low, high = rsmt.score_interval(killed, total, method, 0.95)
+    assert low == pytest.approx(expected[0], abs=1e-4)
+    assert high == pytest.approx(expected[1], abs=1e-4)
+
+
+def _mutants(lines, kind):
+    """One mutant per line: 'number' bumps the constant, 'operator' swaps + for -."""
+    out = []
+    for i in range(len(lines)):
+        mutated = list(lines)
+        mutated[i] = mutated[i].replace("1", "2") if kind == "number" else mutated[i].replace("+", "-")
+        out.append(mutated)
+    return out
+
+
+def test_stratified_sample_is_seeded_proportional_and_capped():
+    lines = [f"{chr(ord('a') + i)} = y + 1" for i in range(10)]
+    source = "\n".join(lines) + "\n"
+    mutants = [rsmt.MutantSpec(n, i % 10 + 1, 0, "\n".join(m) + "\n")
+               for n, (i, m) in enumerate(enumerate(_mutants(lines, "number") + _mutants(lines, "operator")), start=1)]
+    sample = rsmt.stratified_sample(mutants, source, 0.5, None, "seed")
+    assert len(sample) == 10
+    assert [m.id for m in sample] == sorted(m.id for m in sample)
+    assert sum(m.id <= 10 for m in sample) == 5  # each operator keeps its half
+    assert rsmt.stratified_sample(mutants, source, 0.5, None, "seed") == sample
+    assert len(rsmt.stratified_sample(mutants, source, 0.5, 3, "seed")) == 3
+    assert rsmt.stratified_sample(mutants, source, 1.0, None, "seed") == mutants